@@ -14,6 +14,7 @@ from ._creation_function import (
     empty,
     empty_like,
     eye,
+    from_dlpack,
     full,
     full_like,
     linspace,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import types
+from enum import IntEnum
 from typing import Any
 
 import arrayfire as af
@@ -25,6 +27,8 @@ from ._dtypes import (
 
 
 class Array:
+    __slots__ = ("_array",)
+
     _array: af.Array
 
     def __new__(cls, *args: Any, **kwargs: Any) -> Array:
@@ -33,45 +37,33 @@ class Array:
             "Use an array creation function, such as asarray(), instead."
         )
 
-    def _check_allowed_dtypes(self, other: bool | int | float | Array, dtype_category: str, op: str) -> Array:
+    def _check_allowed_dtypes(self, other: bool | int | float | complex | Array, dtype_category: str, op: str) -> Any:
         """
         Helper function for operators to only allow specific input dtypes
 
-        Use like
+        Returns the operand to pass to the arrayfire operator: the wrapped array of other or the promoted Python
+        scalar. Use like
 
-            other = self._check_allowed_dtypes(other, 'numeric', '__add__')
-            if other is NotImplemented:
-                return other
+            operand = self._check_allowed_dtypes(other, 'numeric', '__add__')
+            if operand is NotImplemented:
+                return operand
         """
-        if self.dtype not in dtype_categories[dtype_category]:
-            raise TypeError(f"Only {dtype_category} dtypes are allowed in {op}")
+        if isinstance(other, Array):
+            # This will raise TypeError for type combinations that are not allowed
+            # to promote in the spec (even if the NumPy array operator would
+            # promote them).
+            _result_dtype(self.dtype, other.dtype, dtype_category, op)
+            return other._array
+
         if isinstance(other, int | complex | float | bool):
-            other = self._promote_scalar(other)
-        elif isinstance(other, Array):
-            if other.dtype not in dtype_categories[dtype_category]:
+            if self.dtype not in dtype_categories[dtype_category]:
                 raise TypeError(f"Only {dtype_category} dtypes are allowed in {op}")
-        else:
-            return NotImplemented
-
-        # This will raise TypeError for type combinations that are not allowed
-        # to promote in the spec (even if the NumPy array operator would
-        # promote them).
-        res_dtype = promote_types(self.dtype, other.dtype)
-        if op.startswith("__i"):
-            # Note: NumPy will allow in-place operators in some cases where
-            # the type promoted operator does not match the left-hand side
-            # operand. For example,
 
-            # >>> a = np.array(1, dtype=np.int8)
-            # >>> a += np.array(1, dtype=np.int16)
+            return self._promote_scalar(other)
 
-            # The spec explicitly disallows this.
-            if res_dtype != self.dtype:
-                raise TypeError(f"Cannot perform {op} with dtypes {self.dtype} and {other.dtype}")
-
-        return other
+        return NotImplemented
 
-    def _promote_scalar(self, scalar: bool | int | float | complex) -> Array:
+    def _promote_scalar(self, scalar: bool | int | float | complex) -> bool | int | float | complex:
         """
         Returns a promoted version of a Python scalar appropriate for use with
         operations on self.
@@ -80,76 +72,22 @@ class Array:
         integer that is too large to fit in a NumPy integer dtype, or
         TypeError when the scalar type is incompatible with the dtype of self.
         """
-        from ._data_type_functions import iinfo
-
         # NOTE
-        # Only Python scalar types that match the array dtype are allowed.
-        if isinstance(scalar, bool):
-            if self.dtype not in boolean_dtypes:
-                raise TypeError("Python bool scalars can only be promoted with bool arrays")
-
-        elif isinstance(scalar, int):
-            if self.dtype in boolean_dtypes:
-                raise TypeError("Python int scalars cannot be promoted with bool arrays")
-            if self.dtype in integer_dtypes:
-                info = iinfo(self.dtype)
-                if not (info.min <= scalar <= info.max):
-                    raise OverflowError("Python int scalars must be within the bounds of the dtype for integer arrays")
-
-        elif isinstance(scalar, float):
-            if self.dtype not in floating_dtypes:
-                raise TypeError("Python float scalars can only be promoted with floating-point arrays.")
-
-        elif isinstance(scalar, complex):
-            if self.dtype not in complex_floating_dtypes:
-                raise TypeError("Python complex scalars can only be promoted with complex floating-point arrays.")
-
-        else:
-            raise TypeError("'scalar' must be a Python scalar")
+        # Only Python scalar types that match the array dtype are allowed. The check only depends on the scalar type
+        # and the array dtype, so it is cached.
+        scalar_type: type = type(scalar)
+        bounds = _scalar_bounds(scalar_type, self.dtype)
+        if bounds is not None and not (bounds[0] <= scalar <= bounds[1]):  # type: ignore[operator]
+            raise OverflowError("Python int scalars must be within the bounds of the dtype for integer arrays")
 
         # NOTE
-        # Scalars are unconditionally cast to the same dtype as the array.
+        # Scalars are unconditionally cast to the same dtype as the array. The arrayfire operators do that with a
+        # 1-element constant that is broadcast inside the JIT kernel, so the scalar is passed on as is.
 
         # NOTE (numpy-specific rule)
         # The spec only specifies integer-dtype/int promotion behavior for integers within the bounds of the integer
         # dtype. Outside of those bounds we use the default NumPy behavior (either cast or raise OverflowError).
-        return Array._new(af.constant(scalar, dtype=self.dtype, shape=(1,)))
-
-    @staticmethod
-    def _normalize_two_args(x1: Array, x2: Array) -> tuple[Array, Array]:
-        # BUG, FIXME
-        # """
-        # Normalize inputs to two arg functions to fix type promotion rules
-
-        # NumPy deviates from the spec type promotion rules in cases where one
-        # argument is 0-dimensional and the other is not. For example:
-
-        # >>> import numpy as np
-        # >>> a = np.array([1.0], dtype=np.float32)
-        # >>> b = np.array(1.0, dtype=np.float64)
-        # >>> np.add(a, b) # The spec says this should be float64
-        # array([2.], dtype=float32)
-
-        # To fix this, we add a dimension to the 0-dimension array before passing it
-        # through. This works because a dimension would be added anyway from
-        # broadcasting, so the resulting shape is the same, but this prevents NumPy
-        # from not promoting the dtype.
-        # """
-        # # Another option would be to use signature=(x1.dtype, x2.dtype, None),
-        # # but that only works for ufuncs, so we would have to call the ufuncs
-        # # directly in the operator methods. One should also note that this
-        # # sort of trick wouldn't work for functions like searchsorted, which
-        # # don't do normal broadcasting, but there aren't any functions like
-        # # that in the array API namespace.
-        # if x1.ndim == 0 and x2.ndim != 0:
-        #     # The _array[None] workaround was chosen because it is relatively
-        #     # performant. broadcast_to(x1._array, x2.shape) is much slower. We
-        #     # could also manually type promote x2, but that is more complicated
-        #     # and about the same performance as this.
-        #     x1 = Array._new(x1._array[None])
-        # elif x2.ndim == 0 and x1.ndim != 0:
-        #     x2 = Array._new(x2._array[None])
-        return (x1, x2)
+        return scalar
 
     @classmethod
     def _new(cls, x: Array | bool | int | float | complex | NestedSequence | SupportsBufferProtocol, /) -> Array:
@@ -209,22 +147,20 @@ class Array:
         """
         Performs the operation __add__.
         """
-        other = self._check_allowed_dtypes(other, "numeric", "__add__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__add__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__add__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__add__(operand)
         return self.__class__._new(res)
 
     def __and__(self: Array, other: int | bool | Array, /) -> Array:
         """
         Performs the operation __and__.
         """
-        other = self._check_allowed_dtypes(other, "integer or boolean", "__and__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__and__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer or boolean", "__and__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__and__(operand)
         return self.__class__._new(res)
 
     def __array_namespace__(self: Array, /, *, api_version: str | None = None) -> types.ModuleType:
@@ -260,13 +196,11 @@ class Array:
         """
         return self._array.__dlpack__(stream=stream)
 
-    # FIXME
-    # def __dlpack_device__(self: Array, /) -> Tuple[IntEnum, int]:
-    #     """
-    #     Performs the operation __dlpack_device__.
-    #     """
-    #     # Note: device support is required for this
-    #     return self._array.__dlpack_device__()
+    def __dlpack_device__(self: Array, /) -> tuple[IntEnum, int]:
+        """
+        Performs the operation __dlpack_device__.
+        """
+        return self._array.__dlpack_device__()
 
     def __eq__(self: Array, other: int | float | bool | Array, /) -> Array:  # type: ignore[override]
         """
@@ -274,11 +208,10 @@ class Array:
         """
         # Even though "all" dtypes are allowed, we still require them to be
         # promotable with each other.
-        other = self._check_allowed_dtypes(other, "all", "__eq__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__eq__(other._array)
+        operand = self._check_allowed_dtypes(other, "all", "__eq__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__eq__(operand)
         return self.__class__._new(res)
 
     def __float__(self: Array, /) -> float:
@@ -297,22 +230,20 @@ class Array:
         """
         Performs the operation __floordiv__.
         """
-        other = self._check_allowed_dtypes(other, "real numeric", "__floordiv__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__floordiv__(other._array)
+        operand = self._check_allowed_dtypes(other, "real numeric", "__floordiv__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__floordiv__(operand)
         return self.__class__._new(res)
 
     def __ge__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __ge__.
         """
-        other = self._check_allowed_dtypes(other, "real numeric", "__ge__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__ge__(other._array)
+        operand = self._check_allowed_dtypes(other, "real numeric", "__ge__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__ge__(operand)
         return self.__class__._new(res)
 
     # def __getitem__(
@@ -336,11 +267,10 @@ class Array:
         """
         Performs the operation __gt__.
         """
-        other = self._check_allowed_dtypes(other, "real numeric", "__gt__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__gt__(other._array)
+        operand = self._check_allowed_dtypes(other, "real numeric", "__gt__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__gt__(operand)
         return self.__class__._new(res)
 
     def __int__(self: Array, /) -> int:
@@ -375,33 +305,30 @@ class Array:
         """
         Performs the operation __le__.
         """
-        other = self._check_allowed_dtypes(other, "real numeric", "__le__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__le__(other._array)
+        operand = self._check_allowed_dtypes(other, "real numeric", "__le__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__le__(operand)
         return self.__class__._new(res)
 
     def __lshift__(self: Array, other: int | Array, /) -> Array:
         """
         Performs the operation __lshift__.
         """
-        other = self._check_allowed_dtypes(other, "integer", "__lshift__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__lshift__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer", "__lshift__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__lshift__(operand)
         return self.__class__._new(res)
 
     def __lt__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __lt__.
         """
-        other = self._check_allowed_dtypes(other, "real numeric", "__lt__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__lt__(other._array)
+        operand = self._check_allowed_dtypes(other, "real numeric", "__lt__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__lt__(operand)
         return self.__class__._new(res)
 
     def __matmul__(self: Array, other: Array, /) -> Array:
@@ -410,43 +337,40 @@ class Array:
         """
         # matmul is not defined for scalars, but without this, we may get
         # the wrong error message from asarray.
-        other = self._check_allowed_dtypes(other, "numeric", "__matmul__")
-        if other is NotImplemented:
-            return other
-        res = self._array.__matmul__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__matmul__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__matmul__(operand)
         return self.__class__._new(res)
 
     def __mod__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __mod__.
         """
-        other = self._check_allowed_dtypes(other, "real numeric", "__mod__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__mod__(other._array)
+        operand = self._check_allowed_dtypes(other, "real numeric", "__mod__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__mod__(operand)
         return self.__class__._new(res)
 
     def __mul__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __mul__.
         """
-        other = self._check_allowed_dtypes(other, "numeric", "__mul__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__mul__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__mul__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__mul__(operand)
         return self.__class__._new(res)
 
     def __ne__(self: Array, other: int | float | bool | Array, /) -> Array:  # type: ignore[override]
         """
         Performs the operation __ne__.
         """
-        other = self._check_allowed_dtypes(other, "all", "__ne__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__ne__(other._array)
+        operand = self._check_allowed_dtypes(other, "all", "__ne__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__ne__(operand)
         return self.__class__._new(res)
 
     def __neg__(self: Array, /) -> Array:
@@ -462,11 +386,10 @@ class Array:
         """
         Performs the operation __or__.
         """
-        other = self._check_allowed_dtypes(other, "integer or boolean", "__or__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__or__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer or boolean", "__or__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__or__(operand)
         return self.__class__._new(res)
 
     def __pos__(self: Array, /) -> Array:
@@ -484,9 +407,9 @@ class Array:
     #     """
     #     from ._elementwise_functions import pow
 
-    #     other = self._check_allowed_dtypes(other, "numeric", "__pow__")
-    #     if other is NotImplemented:
-    #         return other
+    #     operand = self._check_allowed_dtypes(other, "numeric", "__pow__")
+    #     if operand is NotImplemented:
+    #         return operand
     #     # Note: NumPy's __pow__ does not follow type promotion rules for 0-d
     #     # arrays, so we use pow() here instead.
     #     return pow(self, other)
@@ -495,11 +418,10 @@ class Array:
         """
         Performs the operation __rshift__.
         """
-        other = self._check_allowed_dtypes(other, "integer", "__rshift__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__rshift__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer", "__rshift__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__rshift__(operand)
         return self.__class__._new(res)
 
     # def __setitem__(
@@ -523,11 +445,10 @@ class Array:
         """
         Performs the operation __sub__.
         """
-        other = self._check_allowed_dtypes(other, "numeric", "__sub__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__sub__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__sub__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__sub__(operand)
         return self.__class__._new(res)
 
     # PEP 484 requires int to be a subtype of float, but __truediv__ should
@@ -536,106 +457,100 @@ class Array:
         """
         Performs the operation __truediv__.
         """
-        other = self._check_allowed_dtypes(other, "floating-point", "__truediv__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__truediv__(other._array)
+        operand = self._check_allowed_dtypes(other, "floating-point", "__truediv__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__truediv__(operand)
         return self.__class__._new(res)
 
     def __xor__(self: Array, other: int | bool | Array, /) -> Array:
         """
         Performs the operation __xor__.
         """
-        other = self._check_allowed_dtypes(other, "integer or boolean", "__xor__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__xor__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer or boolean", "__xor__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__xor__(operand)
         return self.__class__._new(res)
 
     def __iadd__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __iadd__.
         """
-        other = self._check_allowed_dtypes(other, "numeric", "__iadd__")
-        if other is NotImplemented:
-            return other
-        self._array.__iadd__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__iadd__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__iadd__(operand)
         return self
 
     def __radd__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __radd__.
         """
-        other = self._check_allowed_dtypes(other, "numeric", "__radd__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__radd__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__radd__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__radd__(operand)
         return self.__class__._new(res)
 
     def __iand__(self: Array, other: int | bool | Array, /) -> Array:
         """
         Performs the operation __iand__.
         """
-        other = self._check_allowed_dtypes(other, "integer or boolean", "__iand__")
-        if other is NotImplemented:
-            return other
-        self._array.__iand__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer or boolean", "__iand__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__iand__(operand)
         return self
 
     def __rand__(self: Array, other: int | bool | Array, /) -> Array:
         """
         Performs the operation __rand__.
         """
-        other = self._check_allowed_dtypes(other, "integer or boolean", "__rand__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__rand__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer or boolean", "__rand__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__rand__(operand)
         return self.__class__._new(res)
 
     def __ifloordiv__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __ifloordiv__.
         """
-        other = self._check_allowed_dtypes(other, "real numeric", "__ifloordiv__")
-        if other is NotImplemented:
-            return other
-        self._array.__ifloordiv__(other._array)
+        operand = self._check_allowed_dtypes(other, "real numeric", "__ifloordiv__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__ifloordiv__(operand)
         return self
 
     def __rfloordiv__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __rfloordiv__.
         """
-        other = self._check_allowed_dtypes(other, "real numeric", "__rfloordiv__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__rfloordiv__(other._array)
+        operand = self._check_allowed_dtypes(other, "real numeric", "__rfloordiv__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__rfloordiv__(operand)
         return self.__class__._new(res)
 
     def __ilshift__(self: Array, other: int | Array, /) -> Array:
         """
         Performs the operation __ilshift__.
         """
-        other = self._check_allowed_dtypes(other, "integer", "__ilshift__")
-        if other is NotImplemented:
-            return other
-        self._array.__ilshift__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer", "__ilshift__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__ilshift__(operand)
         return self
 
     def __rlshift__(self: Array, other: int | Array, /) -> Array:
         """
         Performs the operation __rlshift__.
         """
-        other = self._check_allowed_dtypes(other, "integer", "__rlshift__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__rlshift__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer", "__rlshift__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__rlshift__(operand)
         return self.__class__._new(res)
 
     def __imatmul__(self: Array, other: Array, /) -> Array:
@@ -644,10 +559,10 @@ class Array:
         """
         # matmul is not defined for scalars, but without this, we may get
         # the wrong error message from asarray.
-        other = self._check_allowed_dtypes(other, "numeric", "__imatmul__")
-        if other is NotImplemented:
-            return other
-        res = self._array.__imatmul__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__imatmul__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__imatmul__(operand)
         return self.__class__._new(res)
 
     def __rmatmul__(self: Array, other: Array, /) -> Array:
@@ -656,177 +571,170 @@ class Array:
         """
         # matmul is not defined for scalars, but without this, we may get
         # the wrong error message from asarray.
-        other = self._check_allowed_dtypes(other, "numeric", "__rmatmul__")
-        if other is NotImplemented:
-            return other
-        res = self._array.__rmatmul__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__rmatmul__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__rmatmul__(operand)
         return self.__class__._new(res)
 
     def __imod__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __imod__.
         """
-        other = self._check_allowed_dtypes(other, "real numeric", "__imod__")
-        if other is NotImplemented:
-            return other
-        self._array.__imod__(other._array)
+        operand = self._check_allowed_dtypes(other, "real numeric", "__imod__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__imod__(operand)
         return self
 
     def __rmod__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __rmod__.
         """
-        other = self._check_allowed_dtypes(other, "real numeric", "__rmod__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__rmod__(other._array)
+        operand = self._check_allowed_dtypes(other, "real numeric", "__rmod__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__rmod__(operand)
         return self.__class__._new(res)
 
     def __imul__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __imul__.
         """
-        other = self._check_allowed_dtypes(other, "numeric", "__imul__")
-        if other is NotImplemented:
-            return other
-        self._array.__imul__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__imul__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__imul__(operand)
         return self
 
     def __rmul__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __rmul__.
         """
-        other = self._check_allowed_dtypes(other, "numeric", "__rmul__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__rmul__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__rmul__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__rmul__(operand)
         return self.__class__._new(res)
 
     def __ior__(self: Array, other: int | bool | Array, /) -> Array:
         """
         Performs the operation __ior__.
         """
-        other = self._check_allowed_dtypes(other, "integer or boolean", "__ior__")
-        if other is NotImplemented:
-            return other
-        self._array.__ior__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer or boolean", "__ior__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__ior__(operand)
         return self
 
     def __ror__(self: Array, other: int | bool | Array, /) -> Array:
         """
         Performs the operation __ror__.
         """
-        other = self._check_allowed_dtypes(other, "integer or boolean", "__ror__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__ror__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer or boolean", "__ror__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__ror__(operand)
         return self.__class__._new(res)
 
     def __ipow__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __ipow__.
         """
-        other = self._check_allowed_dtypes(other, "numeric", "__ipow__")
-        if other is NotImplemented:
-            return other
-        self._array.__ipow__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__ipow__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__ipow__(operand)
         return self
 
     def __rpow__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __rpow__.
         """
-        other = self._check_allowed_dtypes(other, "numeric", "__rpow__")
-        if other is NotImplemented:
-            return other
-        self._array.__rpow__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__rpow__")
+        if operand is NotImplemented:
+            return operand
+        self._array.__rpow__(operand)
         return self
 
     def __irshift__(self: Array, other: int | Array, /) -> Array:
         """
         Performs the operation __irshift__.
         """
-        other = self._check_allowed_dtypes(other, "integer", "__irshift__")
-        if other is NotImplemented:
-            return other
-        self._array.__irshift__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer", "__irshift__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__irshift__(operand)
         return self
 
     def __rrshift__(self: Array, other: int | Array, /) -> Array:
         """
         Performs the operation __rrshift__.
         """
-        other = self._check_allowed_dtypes(other, "integer", "__rrshift__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__rrshift__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer", "__rrshift__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__rrshift__(operand)
         return self.__class__._new(res)
 
     def __isub__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __isub__.
         """
-        other = self._check_allowed_dtypes(other, "numeric", "__isub__")
-        if other is NotImplemented:
-            return other
-        self._array.__isub__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__isub__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__isub__(operand)
         return self
 
     def __rsub__(self: Array, other: int | float | Array, /) -> Array:
         """
         Performs the operation __rsub__.
         """
-        other = self._check_allowed_dtypes(other, "numeric", "__rsub__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__rsub__(other._array)
+        operand = self._check_allowed_dtypes(other, "numeric", "__rsub__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__rsub__(operand)
         return self.__class__._new(res)
 
     def __itruediv__(self: Array, other: float | Array, /) -> Array:
         """
         Performs the operation __itruediv__.
         """
-        other = self._check_allowed_dtypes(other, "floating-point", "__itruediv__")
-        if other is NotImplemented:
-            return other
-        self._array.__itruediv__(other._array)
+        operand = self._check_allowed_dtypes(other, "floating-point", "__itruediv__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__itruediv__(operand)
         return self
 
     def __rtruediv__(self: Array, other: float | Array, /) -> Array:
         """
         Performs the operation __rtruediv__.
         """
-        other = self._check_allowed_dtypes(other, "floating-point", "__rtruediv__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__rtruediv__(other._array)
+        operand = self._check_allowed_dtypes(other, "floating-point", "__rtruediv__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__rtruediv__(operand)
         return self.__class__._new(res)
 
     def __ixor__(self: Array, other: int | bool | Array, /) -> Array:
         """
         Performs the operation __ixor__.
         """
-        other = self._check_allowed_dtypes(other, "integer or boolean", "__ixor__")
-        if other is NotImplemented:
-            return other
-        self._array.__ixor__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer or boolean", "__ixor__")
+        if operand is NotImplemented:
+            return operand
+        self._array = self._array.__ixor__(operand)
         return self
 
     def __rxor__(self: Array, other: int | bool | Array, /) -> Array:
         """
         Performs the operation __rxor__.
         """
-        other = self._check_allowed_dtypes(other, "integer or boolean", "__rxor__")
-        if other is NotImplemented:
-            return other
-        self, other = self._normalize_two_args(self, other)
-        res = self._array.__rxor__(other._array)
+        operand = self._check_allowed_dtypes(other, "integer or boolean", "__rxor__")
+        if operand is NotImplemented:
+            return operand
+        res = self._array.__rxor__(operand)
         return self.__class__._new(res)
 
     def to_device(self: Array, device: Device, /, stream: None = None) -> Array:
@@ -906,3 +814,62 @@ class Array:
                 "Use x.mT to transpose stacks of matrices and permute_dims() to permute dimensions."
             )
         return self.__class__._new(self._array.T)
+
+
+@functools.lru_cache(maxsize=None)
+def _result_dtype(dtype1: af.Dtype, dtype2: af.Dtype, dtype_category: str, op: str) -> af.Dtype:
+    """
+    Returns the dtype of an operator applied to arrays of dtype1 and dtype2, raising TypeError if the operator does
+    not allow the dtypes. Cached per dtype pair, so operators only pay for a dict lookup.
+    """
+    allowed = dtype_categories[dtype_category]
+    if dtype1 not in allowed or dtype2 not in allowed:
+        raise TypeError(f"Only {dtype_category} dtypes are allowed in {op}")
+
+    res_dtype = promote_types(dtype1, dtype2)
+    if op.startswith("__i"):
+        # Note: NumPy will allow in-place operators in some cases where
+        # the type promoted operator does not match the left-hand side
+        # operand. For example,
+
+        # >>> a = np.array(1, dtype=np.int8)
+        # >>> a += np.array(1, dtype=np.int16)
+
+        # The spec explicitly disallows this.
+        if res_dtype != dtype1:
+            raise TypeError(f"Cannot perform {op} with dtypes {dtype1} and {dtype2}")
+
+    return res_dtype
+
+
+@functools.lru_cache(maxsize=None)
+def _scalar_bounds(scalar_type: type, dtype: af.Dtype) -> tuple[int, int] | None:
+    """
+    Checks that a Python scalar type can be promoted to dtype and returns the bounds integer scalars must lie within,
+    if any.
+    """
+    from ._data_type_functions import iinfo
+
+    if issubclass(scalar_type, bool):
+        if dtype not in boolean_dtypes:
+            raise TypeError("Python bool scalars can only be promoted with bool arrays")
+
+    elif issubclass(scalar_type, int):
+        if dtype in boolean_dtypes:
+            raise TypeError("Python int scalars cannot be promoted with bool arrays")
+        if dtype in integer_dtypes:
+            info = iinfo(dtype)
+            return info.min, info.max
+
+    elif issubclass(scalar_type, float):
+        if dtype not in floating_dtypes:
+            raise TypeError("Python float scalars can only be promoted with floating-point arrays.")
+
+    elif issubclass(scalar_type, complex):
+        if dtype not in complex_floating_dtypes:
+            raise TypeError("Python complex scalars can only be promoted with complex floating-point arrays.")
+
+    else:
+        raise TypeError("'scalar' must be a Python scalar")
+
+    return None
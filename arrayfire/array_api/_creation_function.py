@@ -10,7 +10,7 @@ from ._constants import Device
 from ._dtypes import all_dtypes, float32, int32
 
 if TYPE_CHECKING:
-    from ._constants import NestedSequence, SupportsBufferProtocol
+    from ._constants import NestedSequence, SupportsBufferProtocol, SupportsDLPack
 
 
 def _check_valid_dtype(dtype: af.Dtype | None) -> None:
@@ -142,7 +142,7 @@ def asarray(
     if isinstance(obj, bool | int | float | complex):
         afarray = af.constant(obj, dtype=dtype)
     elif isinstance(obj, Array):
-        afarray = Array._array if not copy else af.copy_array(Array._array)
+        afarray = obj._array if not copy else af.copy_array(obj._array)
     elif isinstance(obj, list | tuple):
         afarray = _process_nested_sequence(obj)
     else:
@@ -388,6 +388,29 @@ def eye(
     return Array._new(shifted_array)
 
 
+def from_dlpack(x: SupportsDLPack, /) -> Array:
+    """
+    Returns a new array containing the data from another (array) object with a `__dlpack__` method.
+
+    Parameters
+    ----------
+    x : SupportsDLPack
+        Input (array) object, e.g. a NumPy array, a PyTorch or CuPy tensor, or another array.
+
+    Returns
+    -------
+    Array
+        An array containing the data in `x`, on the device of the current backend.
+
+    Notes
+    -----
+    - The data is copied once on the device. ArrayFire owns the buffers of its arrays, so it can not alias memory
+      allocated by another library.
+    - A `BufferError` is raised if `x` lives on a device that the current backend can not read.
+    """
+    return Array._new(af.from_dlpack(x))
+
+
 @manage_device
 def full(
     shape: int | tuple[int, ...],
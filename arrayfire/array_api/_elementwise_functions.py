@@ -105,8 +105,7 @@ def floor(x: Array, /) -> Array:
 
 
 def floor_divide(x1: Array, x2: Array, /) -> Array:
-    # TODO
-    return NotImplemented
+    return Array._new(x1._array // x2._array)
 
 
 def greater(x1: Array, x2: Array, /) -> Array:
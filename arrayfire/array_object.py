@@ -3,22 +3,52 @@ from __future__ import annotations
 __all__ = ["Array"]
 
 import array as _pyarray
+import ctypes
+import math
+import struct
+import sys
+import threading
+import time
+import traceback
+import weakref
 from collections.abc import Callable
 from functools import wraps
-from typing import TYPE_CHECKING, Any, ParamSpec, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, ParamSpec, TypeVar, cast
 
 import arrayfire_wrapper.lib as wrapper
+from arrayfire_wrapper import BackendType, get_backend
 from arrayfire_wrapper.defines import AFArray, ArrayBuffer, CType
+from arrayfire_wrapper.lib._utility import call_from_clib
 
-from .dtypes import Dtype
+from .dtypes import (
+    Dtype,
+)
 from .dtypes import bool as afbool
-from .dtypes import c_api_value_to_dtype, float32, str_to_dtype
+from .dtypes import (
+    c_api_value_to_dtype,
+    complex32,
+    complex64,
+    float16,
+    float32,
+    float64,
+    int16,
+    int32,
+    int64,
+    str_to_dtype,
+    uint8,
+    uint16,
+    uint32,
+    uint64,
+)
 
 if TYPE_CHECKING:
     from ctypes import Array as CArray
-    from enum import Enum
+    from enum import IntEnum
+
+    import numpy as np
 
 P = ParamSpec("P")
+T = TypeVar("T")
 
 
 def afarray_as_array(func: Callable[P, Array]) -> Callable[P, Array]:
@@ -45,6 +75,8 @@ def afarray_as_array(func: Callable[P, Array]) -> Callable[P, Array]:
 
 
 class Array:
+    __slots__ = ("_arr", "_metadata", "_host_view", "_handle_cell", "_depth", "_base", "__weakref__")
+
     def __init__(
         self,
         obj: None | Array | _pyarray.array | int | AFArray | list[bool | int | float] = None,
@@ -55,6 +87,11 @@ class Array:
         strides: tuple[int, ...] | None = None,
     ) -> None:
         self._arr = AFArray.create_null_pointer()
+        self._metadata: _ArrayMetadata | None = None
+        self._host_view: _HostView | None = None
+        self._handle_cell: list[AFArray] | None = None
+        self._depth = 0
+        self._base: _ViewBase | None = None
         _no_initial_dtype = False  # HACK, FIXME
 
         if len(shape) > 4:
@@ -69,14 +106,14 @@ class Array:
 
         if obj is None:
             if not shape:  # shape is None or empty tuple
-                self._arr = wrapper.create_handle((), dtype)
+                self._set_arr(wrapper.create_handle((), dtype))
                 return
 
-            self._arr = wrapper.create_handle(shape, dtype)
+            self._set_arr(wrapper.create_handle(shape, dtype))
             return
 
         if isinstance(obj, Array):
-            self._arr = wrapper.retain_array(obj.arr)
+            self._set_arr(wrapper.retain_array(obj.arr), obj._metadata)
             return
 
         if isinstance(obj, _pyarray.array):
@@ -121,15 +158,16 @@ class Array:
 
         if not (offset or strides):
             if not to_device:
-                self._arr = wrapper.create_array(shape, dtype, _array_buffer)
+                self._set_arr(wrapper.create_array(shape, dtype, _array_buffer))
                 return
 
-            self._arr = wrapper.device_array(shape, dtype, _array_buffer)
+            self._set_arr(wrapper.device_array(shape, dtype, _array_buffer))
             return
 
-        self._arr = wrapper.create_strided_array(
+        strided_arr = wrapper.create_strided_array(
             shape, dtype, _array_buffer, offset, strides, wrapper.PointerSource(to_device)  # type: ignore[arg-type]
         )
+        self._set_arr(strided_arr)
 
     # Arithmetic Operators
 
@@ -256,8 +294,29 @@ class Array:
         return process_c_function(self, other, wrapper.div)
 
     def __floordiv__(self, other: int | float | Array, /) -> Array:
-        # TODO
-        return NotImplemented
+        """
+        Evaluates self_i // other_i for each element of an array instance with the respective element of the
+        array other.
+
+        Parameters
+        ----------
+        self : Array
+            Array instance. Should have a real-valued data type.
+        other: int | float | Array
+            Other array. Must be compatible with self (see Broadcasting). Should have a real-valued data type.
+
+        Returns
+        -------
+        out : Array
+            An array containing the element-wise results, rounded toward negative infinity as in Python. The returned
+            array must have a data type determined by Type Promotion Rules.
+
+        Note
+        ----
+        - The result is computed as a single JIT expression. Integer operands never go through a floating-point
+        quotient, so int64 values keep their precision.
+        """
+        return _floor_divide(self, other)
 
     def __mod__(self, other: int | float | Array, /) -> Array:
         """
@@ -310,8 +369,38 @@ class Array:
     # Array Operators
 
     def __matmul__(self, other: Array, /) -> Array:
-        # TODO get from blas - make vanilla version and not copy af.matmul as is
-        return NotImplemented
+        """
+        Computes the matrix product of self and other.
+
+        Parameters
+        ----------
+        self : Array
+            Array instance. Should have a numeric data type. Must have at least one dimension.
+        other : Array
+            Other array. Should have a numeric data type. Must have at least one dimension.
+
+        Returns
+        -------
+        out : Array
+            - If both arrays are vectors, their inner product.
+            - If self is a vector, it is treated as a row vector and the result has one dimension less.
+            - If other is a vector, it is treated as a column vector.
+            - Otherwise, the matrix product, batched over the third and fourth dimensions. A 2-dimensional operand
+            is broadcast over the batch of the other one.
+
+        Raises
+        ------
+        ValueError
+            If the inner dimensions of self and other do not match.
+
+        Note
+        ----
+        - Operands that come from `.T` or `.H` are not transposed; the transpose is passed to BLAS as a flag.
+        """
+        if not isinstance(other, Array):
+            return NotImplemented
+
+        return _matmul(self, other)
 
     # Bitwise Operators
 
@@ -574,8 +663,10 @@ class Array:
         return process_c_function(other, self, wrapper.div)
 
     def __rfloordiv__(self, other: int | float | Array, /) -> Array:
-        # TODO
-        return NotImplemented
+        """
+        Return other // self.
+        """
+        return _floor_divide(other, self)
 
     def __rmod__(self, other: int | float | Array, /) -> Array:
         """
@@ -592,8 +683,13 @@ class Array:
     # Reflected Array Operators
 
     def __rmatmul__(self, other: Array, /) -> Array:
-        # TODO
-        return NotImplemented
+        """
+        Return other @ self.
+        """
+        if not isinstance(other, Array):
+            return NotImplemented
+
+        return _matmul(other, self)
 
     # Reflected Bitwise Operators
 
@@ -634,47 +730,54 @@ class Array:
         """
         Return self += other.
         """
-        return process_c_function(self, other, wrapper.add)
+        return _process_inplace_c_function(self, other, wrapper.add)
 
     def __isub__(self, other: int | float | Array, /) -> Array:
         """
         Return self -= other.
         """
-        return process_c_function(self, other, wrapper.sub)
+        return _process_inplace_c_function(self, other, wrapper.sub)
 
     def __imul__(self, other: int | float | Array, /) -> Array:
         """
         Return self *= other.
         """
-        return process_c_function(self, other, wrapper.mul)
+        return _process_inplace_c_function(self, other, wrapper.mul)
 
     def __itruediv__(self, other: int | float | Array, /) -> Array:
         """
         Return self /= other.
         """
-        return process_c_function(self, other, wrapper.div)
+        return _process_inplace_c_function(self, other, wrapper.div)
 
     def __ifloordiv__(self, other: int | float | Array, /) -> Array:
-        # TODO
-        return NotImplemented
+        """
+        Return self //= other.
+        """
+        return _take_over_result(self, _floor_divide(self, other))
 
     def __imod__(self, other: int | float | Array, /) -> Array:
         """
         Return self %= other.
         """
-        return process_c_function(self, other, wrapper.mod)
+        return _process_inplace_c_function(self, other, wrapper.mod)
 
     def __ipow__(self, other: int | float | Array, /) -> Array:
         """
         Return self **= other.
         """
-        return process_c_function(self, other, wrapper.pow)
+        return _process_inplace_c_function(self, other, wrapper.pow)
 
     # In-place Array Operators
 
     def __imatmul__(self, other: Array, /) -> Array:
-        # TODO
-        return NotImplemented
+        """
+        Return self @= other.
+        """
+        if not isinstance(other, Array):
+            return NotImplemented
+
+        return _take_over_result(self, _matmul(self, other))
 
     # In-place Bitwise Operators
 
@@ -682,31 +785,31 @@ class Array:
         """
         Return self &= other.
         """
-        return process_c_function(self, other, wrapper.bitand)
+        return _process_inplace_c_function(self, other, wrapper.bitand)
 
     def __ior__(self, other: int | bool | Array, /) -> Array:
         """
         Return self |= other.
         """
-        return process_c_function(self, other, wrapper.bitor)
+        return _process_inplace_c_function(self, other, wrapper.bitor)
 
     def __ixor__(self, other: int | bool | Array, /) -> Array:
         """
         Return self ^= other.
         """
-        return process_c_function(self, other, wrapper.bitxor)
+        return _process_inplace_c_function(self, other, wrapper.bitxor)
 
     def __ilshift__(self, other: int | Array, /) -> Array:
         """
         Return self <<= other.
         """
-        return process_c_function(self, other, wrapper.bitshiftl)
+        return _process_inplace_c_function(self, other, wrapper.bitshiftl)
 
     def __irshift__(self, other: int | Array, /) -> Array:
         """
         Return self >>= other.
         """
-        return process_c_function(self, other, wrapper.bitshiftr)
+        return _process_inplace_c_function(self, other, wrapper.bitshiftr)
 
     # Methods
 
@@ -726,13 +829,46 @@ class Array:
         # TODO
         return NotImplemented
 
-    def __dlpack__(self, *, stream: int | Any | None = None):  # type: ignore[no-untyped-def]
-        # TODO implementation and expected return type -> PyCapsule
-        return NotImplemented
+    def __dlpack__(self, *, stream: int | Any | None = None) -> Any:
+        """
+        Exports the array as a DLPack capsule that shares its buffer with the consumer.
 
-    def __dlpack_device__(self) -> tuple[Enum, int]:
-        # TODO
-        return NotImplemented
+        Parameters
+        ----------
+        stream : int | Any | None, optional
+            Stream the consumer will use. Pending ArrayFire work is synchronized before the capsule is returned.
+            Default is None.
+
+        Returns
+        -------
+        PyCapsule
+            Capsule holding a DLManagedTensor. The buffer is locked until the consumer releases the tensor.
+
+        Raises
+        ------
+        BufferError
+            If the array is empty or the current backend does not expose addressable device memory.
+
+        Note
+        ----
+        - Only the CPU and CUDA backends can be exported; OpenCL and oneAPI buffers are not plain pointers.
+        """
+        from arrayfire.library.dlpack import to_dlpack
+
+        return to_dlpack(self, stream=stream)
+
+    def __dlpack_device__(self) -> tuple[IntEnum, int]:
+        """
+        Returns the DLPack device type and device id of the array.
+
+        Raises
+        ------
+        BufferError
+            If the current backend does not expose addressable device memory.
+        """
+        from arrayfire.library.dlpack import dlpack_device
+
+        return dlpack_device(self)
 
     def __float__(self) -> float:
         # TODO
@@ -753,20 +889,39 @@ class Array:
         -------
         out : Array
             An array containing the accessed value(s). The returned array must have the same data type as self.
+
+        Note
+        ----
+        - A key of ints and slices with a step of 1 along the first axis of a linear array returns a view: it shares
+        the data of self at its `offset` and `strides`, see `base`. Other keys, and keys on arrays that are not
+        linear, such as a row of a matrix, return a copy.
+        - Views have value semantics. Writing to a view or to its base copies the shared data first, so neither
+        sees the writes of the other.
         """
         # TODO
         # API Specification - key: Union[int, slice, ellipsis, tuple[Union[int, slice, ellipsis], ...], array].
         # consider using af.span to replace ellipsis during refactoring
-        out = Array()
-        ndims = self.ndim
+        if isinstance(key, Array):
+            array_key = _array_key_indices(self, key)
+            if array_key is None:
+                return Array(dtype=self.dtype)
+
+            ndims, indices, _ = array_key
+            return Array.from_afarray(wrapper.index_gen(self._arr, ndims, indices))
+
+        pattern = _key_pattern(key)
+        if pattern is None:
+            # HACK known issue
+            indices = wrapper.get_indices(key)  # type: ignore[arg-type]
+        else:
+            indices = _compiled_index_key(pattern, self.shape).indices
 
-        if isinstance(key, Array) and key == afbool.c_api_value:
-            ndims = 1
-            if wrapper.count_all(key.arr) == 0:  # HACK was count() method before
-                return out
+        out = Array.from_afarray(wrapper.index_gen(self._arr, self.ndim, indices))
+        # NOTE other keys always copy, so only keys that can return a view pay for the is_owner call
+        if _is_view_pattern(pattern) and not wrapper.is_owner(out.arr):
+            base = self.base or self
+            out._base = _ViewBase(base, base._arr)
 
-        # HACK known issue
-        out._arr = wrapper.index_gen(self._arr, ndims, wrapper.get_indices(key))  # type: ignore[arg-type]
         return out
 
     def __index__(self) -> int:
@@ -781,57 +936,68 @@ class Array:
         return self.shape[0] if self.shape else 0
 
     def __setitem__(self, key: IndexKey, value: int | float | bool | Array, /) -> None:
-        ndims = self.ndim
+        if not isinstance(key, Array):
+            key = _mask_positions(key)
+            indices, dims = _get_index_key(key, self.shape)
 
-        is_array_with_bool = isinstance(key, Array) and type(key) is afbool
-
-        if is_array_with_bool:
-            ndims = 1
-            num = wrapper.count_all(key.arr)  # type: ignore[union-attr]
-            if num == 0:
+            if math.prod(dims) == 0:
                 return
 
-        if isinstance(value, int | float | complex | bool):
-            dims = _get_processed_index(key, self.shape)
-            if is_array_with_bool:
-                ndims = 1
-                other_arr = wrapper.create_constant_array(value, (int(num.real),), self.dtype)
+            if isinstance(value, Array) and value.size == math.prod(dims):
+                _assign_arr(self, indices, value.arr)
             else:
-                other_arr = wrapper.create_constant_array(value, dims, self.dtype)
-            del_other = True
+                # NOTE scalars and arrays with fewer elements are broadcast over the region, see _broadcast_assign
+                _broadcast_assign(self, key, indices, value, dims)
+            return
+
+        is_scalar = isinstance(value, int | float | complex | bool)
+
+        if (
+            isinstance(value, int | float | bool)
+            and key.dtype == afbool
+            and key.shape == self.shape
+            and (isinstance(value, float) or abs(value) <= _MAX_EXACT_DOUBLE_INT)
+        ):
+            # NOTE a single select on the device, the mask is never counted on the host. Select takes the value as a
+            # double, so larger integers go through a constant of the array dtype below instead.
+            self._replace_arr(wrapper.select_scalar_l(value, key.arr, self._arr))
+            return
+
+        array_key = _array_key_indices(self, key)
+        if array_key is None:
+            return
+
+        ndims, indices, dims = array_key
+
+        if is_scalar:
+            other_arr = wrapper.create_constant_array(value, dims, self.dtype)  # type: ignore[arg-type]
         else:
-            other_arr = value.arr
-            del_other = False
+            other_arr = value.arr  # type: ignore[union-attr]
 
-        indices = wrapper.get_indices(key)  # type: ignore[arg-type]  # FIXME
-        out = wrapper.assign_gen(self._arr, other_arr, ndims, indices)
+        try:
+            self._replace_arr(wrapper.assign_gen(self._arr, other_arr, ndims, indices))
+        finally:
+            if is_scalar:
+                wrapper.release_array(other_arr)
 
+    def _replace_arr(self, arr: AFArray) -> None:
+        # NOTE assign_gen copies the data of lhs if it is shared with another handle, e.g. of a view or its base, so
+        # the new handle of a view owns its data and the base is left as is
         wrapper.release_array(self._arr)
-        if del_other:
-            wrapper.release_array(other_arr)
-        self._arr = out
+        self._set_arr(arr)
 
     def __str__(self) -> str:
-        # TODO change the look of array str. E.g., like np.array
-        # if not _in_display_dims_limit(self.shape):
-        #     return _metadata_string(self.dtype, self.shape)
-        return _metadata_string(self.dtype) + _array_as_str(self)
+        """
+        Returns the array metadata followed by its (summarized) elements. See `af.set_printoptions`.
+        """
+        return _metadata_string(self.dtype, self.shape) + "\n" + _array_as_str(self)
 
     def __repr__(self) -> str:
-        # return _metadata_string(self.dtype, self.shape)
-        # TODO change the look of array representation. E.g., like np.array
+        """
+        Returns the (summarized) elements of the array in row-major order. See `af.set_printoptions`.
+        """
         return _array_as_str(self)
 
-    def __del__(self) -> None:
-        if not hasattr(self._arr, "value"):
-            return
-
-        if self._arr.value == 0:
-            return
-
-        wrapper.release_array(self._arr)
-        self._arr.value = 0
-
     def to_device(self, device: Any, /, *, stream: int | Any = None) -> Array:
         # TODO implementation and change device type from Any to Device
         return NotImplemented
@@ -848,7 +1014,7 @@ class Array:
         out : Dtype
             Array data type.
         """
-        return c_api_value_to_dtype(wrapper.get_type(self._arr))
+        return self._get_metadata().dtype
 
     @property
     def device(self) -> Any:
@@ -856,7 +1022,6 @@ class Array:
         return NotImplemented
 
     @property
-    @afarray_as_array
     def T(self) -> Array:
         """
         Transpose of the array.
@@ -871,17 +1036,24 @@ class Array:
         ----
         - The array instance must be two-dimensional. If the array instance is not two-dimensional, an error
         should be raised.
+        - The transpose is computed when its data is first needed. Matrix multiplication with `@` passes the
+        transpose to BLAS as a flag instead, so `a.T @ b` never materializes `a.T`.
         """
         if self.ndim < 2:
             raise TypeError(f"Array should be at least 2-dimensional. Got {self.ndim}-dimensional array")
 
-        # TODO add check if out.dtype == self.dtype
-        return cast(Array, wrapper.transpose(self._arr, False))
+        return _TransposedArray.from_source(self, conjugate=False)
 
     @property
-    @afarray_as_array
     def H(self) -> Array:
-        return cast(Array, wrapper.transpose(self._arr, True))
+        """
+        Conjugate (Hermitian) transpose of the array.
+
+        Note
+        ----
+        - As for `T`, the transpose is computed when its data is first needed and folded into `@`.
+        """
+        return _TransposedArray.from_source(self, conjugate=True)
 
     @property
     def size(self) -> int:
@@ -898,7 +1070,7 @@ class Array:
         - This must equal the product of the array's dimensions.
         """
         # NOTE previously - elements()
-        return wrapper.get_elements(self._arr)
+        return self._get_metadata().size
 
     @property
     def ndim(self) -> int:
@@ -908,7 +1080,7 @@ class Array:
         int
             Number of array dimensions (axes).
         """
-        return wrapper.get_numdims(self._arr)
+        return self._get_metadata().ndim
 
     @property
     def shape(self) -> tuple[int, ...]:
@@ -920,13 +1092,46 @@ class Array:
         tuple[int, ...]
             Array dimensions.
         """
-        # NOTE skipping passing any None values
-        return wrapper.get_dims(self._arr)[: self.ndim]
+        return self._get_metadata().shape
+
+    @property
+    def base(self) -> Array | None:
+        """
+        Array this array is a view of, or None if the array is not a view. The base of a view of a view is the
+        base of the latter.
+
+        Returns
+        -------
+        Array | None
+            The array whose data this array was indexed from without a copy.
+
+        Note
+        ----
+        - A view holds a reference to its base. It stops being a view once the handle of either array is replaced,
+        e.g. by `__setitem__` or an in-place operator, as the two no longer share data afterwards.
+        """
+        if self._base is None:
+            return None
+
+        # NOTE the base got a new handle, the view keeps the previous data of the base
+        if self._base.array._arr is not self._base.arr:
+            self._base = None
+            return None
+
+        return self._base.array
+
+    @property
+    def is_view(self) -> bool:
+        """
+        Returns True if the array shares the data of its `base`.
+        """
+        return self.base is not None
 
     @property
     def offset(self) -> int:
         """
-        Return the offset of the first element relative to the raw pointer.
+        Return the offset of the first element relative to the raw pointer. Nonzero for views that do not start
+        at the first element of their base.
 
         Returns
         -------
@@ -945,7 +1150,7 @@ class Array:
         tuple[int, ...]
             The strides for each dimension.
         """
-        return wrapper.get_strides(self._arr)[: self.ndim]
+        return wrapper.get_strides(self._arr)[: self._get_metadata().ndim]
 
     # TODO rename front_to_host or smth. Extend doc: move first element of array from gpu to cpu
     def scalar(self) -> int | float | bool | complex | None:  # FIXME
@@ -953,37 +1158,99 @@ class Array:
         Return the first element of the array
         """
         # TODO change the logic of this method
-        if self.is_empty():
+        metadata = self._get_metadata()
+
+        if metadata.size == 0:
             return None
 
-        return wrapper.get_scalar(self._arr, self.dtype)
+        return _host_sync(wrapper.get_scalar, self._arr, metadata.dtype)
 
     def is_empty(self) -> bool:
         """
         Check if the array is empty i.e. it has no elements.
         """
-        return wrapper.is_empty(self._arr)
+        return self._get_metadata().size == 0
+
+    def to_list(self, row_major: bool = False) -> list[Any]:
+        """
+        Returns the array data as a (nested) Python list.
+
+        Parameters
+        ----------
+        row_major : bool, optional
+            Nest the list in row-major order, so that `out[i][j]` is the element at `array[i, j]`. By default the list
+            follows the column-major layout of ArrayFire: the innermost lists are columns and `out[j][i]` is the
+            element at `array[i, j]`. Default is False.
+
+        Returns
+        -------
+        list
+            Flat list for vectors, nested list with one level per dimension otherwise.
 
-    def to_list(self, row_major: bool = False) -> list[int | float | bool | complex]:
+        Note
+        ----
+        - The data is copied to the host with a single transfer and the nested lists are cut out of it with slices,
+        so no element is indexed from Python.
+        """
         if self.is_empty():
             return []
 
+        values = _host_values(self._arr, self.size, self.dtype)
+
+        if self.ndim <= 1:
+            return values
+
+        shape = self.shape
+        strides = _column_major_strides(shape)
+
+        if row_major:
+            return _nest(values, 0, shape, strides)
+
+        return _nest(values, 0, shape[::-1], strides[::-1])
+
+    def to_bytes(self, row_major: bool = False) -> bytes:
+        """
+        Returns the raw array data copied to the host.
+
+        Parameters
+        ----------
+        row_major : bool, optional
+            Return the data in row-major (C) order instead of the column-major order of ArrayFire. Default is False.
+
+        Returns
+        -------
+        bytes
+            Native-endian element data. Empty for an empty array.
+        """
+        return bytes(self.to_memoryview(row_major))
+
+    def to_memoryview(self, row_major: bool = False) -> memoryview:
+        """
+        Returns a memoryview over a host copy of the array data, without converting elements to Python objects.
+
+        Parameters
+        ----------
+        row_major : bool, optional
+            Copy the data in row-major (C) order, so that the view has the shape of the array. By default the data
+            stays in the column-major order of ArrayFire and the view has the reversed shape. Default is False.
+
+        Returns
+        -------
+        memoryview
+            Typed view with one dimension per array dimension. float16 and complex data, which memoryview can not
+            describe, is returned as a flat view of unsigned bytes.
+        """
+        if self.is_empty():
+            return memoryview(b"")
+
         array = _reorder(self) if row_major else self
-        ctypes_array = wrapper.get_data_ptr(array.arr, array.size, array.dtype)
+        buffer = _host_buffer(array.arr, array.size * ctypes.sizeof(array.dtype.c_type))
 
-        if array.ndim == 1:
-            return cast(list, ctypes_array[:])  # HACK
-
-        out = []
-        for i in range(array.size):
-            idx = i
-            sub_list = []
-            for j in range(array.ndim):
-                div = array.shape[j]
-                sub_list.append(idx % div)
-                idx //= div
-            out.append(ctypes_array[tuple(sub_list)])  # type: ignore[call-overload]  # FIXME
-        return out
+        if array.dtype not in _MEMORYVIEW_FORMATS:
+            return memoryview(buffer)
+
+        shape = array.shape if row_major else array.shape[::-1]
+        return cast(memoryview, memoryview(buffer).cast(_MEMORYVIEW_FORMATS[array.dtype], shape or (1,)))
 
     def to_ctype_array(self, row_major: bool = False) -> CArray:
         if self.is_empty():
@@ -992,6 +1259,182 @@ class Array:
         array = _reorder(self) if row_major else self
         return wrapper.get_data_ptr(array.arr, array.size, array.dtype)
 
+    @classmethod
+    def from_numpy(cls, array: np.ndarray, /) -> Array:
+        """
+        Creates an Array from a NumPy array with a single bulk host-to-device copy.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            Source array with up to 4 dimensions and a dtype supported by ArrayFire.
+
+        Returns
+        -------
+        Array
+            Array with the same shape, dtype and values as `array`.
+
+        Note
+        ----
+        - Fortran-ordered arrays are copied as is. C-ordered arrays are copied with reversed dimensions and
+        reordered on the device, so no intermediate host copy is made in either case.
+        - ArrayFire always owns the memory of its arrays, so the data is copied even on the CPU backend.
+        """
+        np = _import_numpy()
+
+        if array.ndim > 4:
+            raise ValueError("Can not create 5 or more -dimensional arrays.")
+
+        dtype = str_to_dtype(array.dtype.name)
+
+        if not array.dtype.isnative:
+            array = array.astype(array.dtype.newbyteorder("="))
+
+        if array.size == 0:
+            return cls(dtype=dtype, shape=array.shape)
+
+        if array.ndim == 0:
+            array = array.reshape(1)
+
+        if array.flags.f_contiguous:
+            return cls.from_afarray(wrapper.create_array(array.shape, dtype, ArrayBuffer(array.ctypes.data)))
+
+        array = np.ascontiguousarray(array)
+        reversed_arr = wrapper.create_array(array.shape[::-1], dtype, ArrayBuffer(array.ctypes.data))
+
+        if array.ndim == 1:
+            return cls.from_afarray(reversed_arr)
+
+        out = wrapper.reorder(reversed_arr, *_reversed_axes(array.ndim))
+        wrapper.release_array(reversed_arr)
+        return cls.from_afarray(out)
+
+    def to_numpy(self, /, *, out: np.ndarray | None = None, pinned: bool = False) -> np.ndarray:
+        """
+        Returns the array data as a Fortran-ordered NumPy array.
+
+        Parameters
+        ----------
+        out : np.ndarray | None, optional
+            Writeable Fortran-contiguous array of the same shape and dtype to copy the data into. Default is None.
+        pinned : bool, optional
+            Copy into a newly allocated page-locked host buffer instead of pageable memory. Ignored on the CPU
+            backend and when `out` is given. Default is False.
+
+        Returns
+        -------
+        np.ndarray
+            On the CPU backend, a view over the array buffer that shares memory with the Array. On other backends,
+            or when `out` is given, an array filled by a single device-to-host copy.
+
+        Raises
+        ------
+        ValueError
+            If `out` does not match the shape or dtype of the array or is not a writeable Fortran-contiguous array.
+
+        Note
+        ----
+        - The CPU view keeps the buffer alive and locked until the view is garbage collected. Writes through it are
+        visible to ArrayFire.
+        """
+        np = _import_numpy()
+        dtype = np.dtype(self.dtype.name)
+
+        if out is not None:
+            if out.shape != self.shape or out.dtype != dtype:
+                raise ValueError(f"Expected out to have shape {self.shape} and dtype {dtype}.")
+
+            if not (out.flags.f_contiguous and out.flags.writeable):
+                raise ValueError("Expected out to be a writeable Fortran-contiguous array.")
+
+            if not self.is_empty():
+                _copy_to_host(self._arr, out.ctypes.data)
+
+            return out
+
+        if self.is_empty():
+            out = np.empty(self.shape or (0,), dtype=dtype)
+        elif _is_host_backend():
+            out = np.asarray(_HostView(self))
+        elif pinned:
+            out = np.asarray(_PinnedHostBuffer(self))
+        else:
+            out = np.empty(self.shape, dtype=dtype, order="F")
+            _copy_to_host(self._arr, out.ctypes.data)
+
+        return out
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        out = self.to_numpy()
+
+        if dtype is not None and out.dtype != dtype:
+            return out.astype(dtype)
+
+        if copy and _is_host_backend():
+            return out.copy(order="F")
+
+        return out
+
+    @property
+    def __array_interface__(self) -> dict[str, Any]:
+        """
+        NumPy array interface over the array buffer. Only available on the CPU backend for non-empty arrays, where
+        the buffer is directly addressable from the host. Elsewhere NumPy falls back to `__array__`.
+        """
+        if not _is_host_backend() or self.is_empty():
+            raise AttributeError("__array_interface__ is only available for non-empty arrays on the CPU backend.")
+
+        # NOTE
+        # Consumers only keep a reference to self, so the host view of every buffer that was exported stays alive
+        # with self, even after self switches to a new handle (e.g. after __setitem__).
+        if self._host_view is None or self._host_view.source != self._arr.value:
+            host_view = _HostView(self)
+            host_view.previous = self._host_view
+            self._host_view = host_view
+
+        return self._host_view.__array_interface__
+
+    def __buffer__(self, flags: int, /) -> memoryview:
+        return self.to_numpy().data
+
+    def _get_metadata(self) -> _ArrayMetadata:
+        """
+        Returns the metadata of the current handle, querying it from the C library on first use.
+        """
+        if self._metadata is None:
+            self._metadata = _ArrayMetadata.from_afarray(self._arr)
+
+        return self._metadata
+
+    def _set_arr(
+        self, arr: AFArray, metadata: _ArrayMetadata | None = None, depth: int = 0, *, created: bool | None = None
+    ) -> None:
+        """
+        Switches the array to another handle. Cached metadata belongs to the previous handle and is dropped, unless
+        the metadata of the new handle is already known, and the array is no longer a view. Depth is the JIT depth
+        of the new handle, see `_JitDepthPolicy`. Created tells observers whether this is the first handle of a new
+        array, by default it is if the array held no handle before.
+
+        The new handle is released once the array is garbage collected. The previous handle is no longer tracked,
+        the caller is responsible for releasing or handing it over.
+        """
+        if created is None:
+            created = self._handle_cell is None or not self._handle_cell[0].value
+
+        self._arr = arr
+        self._metadata = metadata
+        self._depth = depth
+        self._base = None
+
+        # NOTE the finalizer of the array is registered once and releases whichever handle the cell holds last
+        if self._handle_cell is not None:
+            self._handle_cell[0] = arr
+        elif arr.value:
+            self._handle_cell = _release_manager.track(self, arr)
+
+        if _observers.array_observers and arr.value:
+            _notify_observers(self, created)
+
     @afarray_as_array
     def copy(self) -> Array:
         """
@@ -1023,9 +1466,16 @@ class Array:
         -------
         Array
             An instance of Array wrapping the given array.
+
+        Note
+        ----
+        - The instance takes ownership of `arr`. It is created without going through `__init__`, which keeps this
+        constructor cheap for the results of operations.
         """
-        out = cls()
-        out._arr = arr
+        out = cls.__new__(cls)
+        out._host_view = None
+        out._handle_cell = None
+        out._set_arr(arr)
         return out
 
     @property
@@ -1038,7 +1488,7 @@ class Array:
 
     @property
     def is_bool(self) -> bool:
-        return wrapper.is_bool(self._arr)
+        return self.dtype == afbool
 
     @property
     def is_column(self) -> bool:
@@ -1050,35 +1500,35 @@ class Array:
 
     @property
     def is_complex(self) -> bool:
-        return wrapper.is_complex(self._arr)
+        return self.dtype in _COMPLEX_DTYPES
 
     @property
     def is_double(self) -> bool:
-        return wrapper.is_double(self._arr)
+        return self.dtype in (float64, complex64)
 
     @property
     def is_floating(self) -> bool:
-        return wrapper.is_floating(self._arr)
+        return self.dtype in _FLOATING_DTYPES
 
     @property
     def is_half(self) -> bool:
-        return wrapper.is_half(self._arr)
+        return self.dtype == float16
 
     @property
     def is_integer(self) -> bool:
-        return wrapper.is_integer(self._arr)
+        return self.dtype in _INTEGER_DTYPES
 
     @property
     def is_real(self) -> bool:
-        return wrapper.is_real(self._arr)
+        return self.dtype not in _COMPLEX_DTYPES
 
     @property
     def is_real_floating(self) -> bool:
-        return wrapper.is_realfloating(self._arr)
+        return self.dtype in _REAL_FLOATING_DTYPES
 
     @property
     def is_single(self) -> bool:
-        return wrapper.is_single(self._arr)
+        return self.dtype in (float32, complex32)
 
     @property
     def is_sparse(self) -> bool:
@@ -1105,46 +1555,822 @@ class Array:
 
 IndexKey = int | float | complex | bool | wrapper.ParallelRange | slice | tuple[int | slice, ...] | Array
 
-
-def _reorder(array: Array) -> Array:
+# NOTE struct formats of the dtypes that memoryview can describe; float16 and complex dtypes are not among them
+_MEMORYVIEW_FORMATS: dict[Dtype, Any] = {
+    int16: "h",
+    int32: "i",
+    int64: "q",
+    uint8: "B",
+    uint16: "H",
+    uint32: "I",
+    uint64: "Q",
+    float32: "f",
+    float64: "d",
+    afbool: "?",
+}
+
+
+_UNSIGNED_DTYPES = (uint8, uint16, uint32, uint64, afbool)
+_INTEGER_DTYPES = (int16, int32, int64, uint8, uint16, uint32, uint64)
+_REAL_FLOATING_DTYPES = (float16, float32, float64)
+_COMPLEX_DTYPES = (complex32, complex64)
+_FLOATING_DTYPES = _REAL_FLOATING_DTYPES + _COMPLEX_DTYPES
+
+
+class _ArrayMetadata(NamedTuple):
     """
-    Returns a reordered array to help interoperate with row major formats.
+    Dtype and dimensions of an array handle. ArrayFire never changes them for an existing handle, so they are
+    queried once per handle and cached on the Array.
     """
-    if array.ndim == 1:
-        return array
 
-    return Array(wrapper.reorder(array.arr, array.ndim))
+    dtype: Dtype
+    shape: tuple[int, ...]
+    ndim: int
+    size: int
 
+    @classmethod
+    def from_afarray(cls, arr: AFArray) -> _ArrayMetadata:
+        ndim = wrapper.get_numdims(arr)
+        # NOTE skipping passing any None values
+        shape = wrapper.get_dims(arr)[:ndim]
+        size = 1
+        for dim in shape:
+            size *= dim
+        return cls(c_api_value_to_dtype(wrapper.get_type(arr)), shape, ndim, size if ndim else 0)
 
-def _metadata_string(dtype: Dtype, dims: tuple[int, ...] | None = None) -> str:
+    def transposed(self) -> _ArrayMetadata:
+        dims = list(self.shape + (1,) * (4 - self.ndim))
+        dims[0], dims[1] = dims[1], dims[0]
+
+        ndim = 0
+        if self.size:
+            ndim = max((axis + 1 for axis, dim in enumerate(dims) if dim != 1), default=1)
+
+        return self._replace(shape=tuple(dims[:ndim]), ndim=ndim)
+
+
+class _TransposedArray(Array):
+    """
+    Result of `Array.T` and `Array.H`.
+
+    Keeps a reference to the source array and computes the transpose on first access to the handle. Matrix
+    multiplication reads the source instead and folds the transpose into the BLAS flags.
+    """
+
+    __slots__ = ("_source", "_conjugate")
+
+    _source: Array | None
+    _conjugate: bool
+
+    @classmethod
+    def from_source(cls, source: Array, conjugate: bool) -> Array:
+        if isinstance(source, _TransposedArray) and source._source is not None and source._conjugate == conjugate:
+            return Array(source._source)
+
+        out = cls.__new__(cls)
+        out._host_view = None
+        out._handle_cell = None
+        _ARR_SLOT.__set__(out, AFArray.create_null_pointer())
+        out._metadata = source._get_metadata().transposed()
+        out._depth = 0
+        out._base = None
+        # NOTE holds its own reference, so later in-place updates of source do not leak into the transpose
+        out._source = _internal_array(wrapper.retain_array(source.arr), source._get_metadata())
+        out._conjugate = conjugate
+
+        if _observers.array_observers:
+            _notify_observers(out, True)
+
+        return out
+
+    @property  # type: ignore[override]
+    def _arr(self) -> AFArray:
+        if self._source is not None:
+            self._set_arr(wrapper.transpose(self._source.arr, self._conjugate), self._metadata, created=False)
+
+        return cast(AFArray, _ARR_SLOT.__get__(self))
+
+    @_arr.setter
+    def _arr(self, arr: AFArray) -> None:
+        _ARR_SLOT.__set__(self, arr)
+        self._source = None
+
+
+class _LazyArray(Array):
+    """
+    Result of an operation recorded by `af.lazy()`.
+
+    Refers to a node of the recording graph. The first access to the handle of any pending result makes the graph
+    emit the wrapper calls for all of them.
+    """
+
+    __slots__ = ("_graph", "_node")
+
+    _graph: _LazyGraph
+    _node: int | None
+
+    @classmethod
+    def from_node(cls, graph: _LazyGraph, node: int, metadata: _ArrayMetadata) -> Array:
+        out = cls.__new__(cls)
+        out._host_view = None
+        out._handle_cell = None
+        _ARR_SLOT.__set__(out, AFArray.create_null_pointer())
+        out._metadata = metadata
+        out._depth = 0
+        out._base = None
+        out._graph = graph
+        out._node = node
+        graph.outputs.add(out)
+
+        if _observers.array_observers:
+            _notify_observers(out, True)
+
+        return out
+
+    @property  # type: ignore[override]
+    def _arr(self) -> AFArray:
+        if self._node is not None:
+            self._graph.materialize()
+
+        return cast(AFArray, _ARR_SLOT.__get__(self))
+
+    @_arr.setter
+    def _arr(self, arr: AFArray) -> None:
+        _ARR_SLOT.__set__(self, arr)
+        self._node = None
+
+
+class _ActiveGraph(threading.local):
+    """
+    Graph that records the element-wise operations of the current thread, set by `af.lazy()` and while `af.jit`
+    traces a function. Other threads keep running their operations eagerly.
+    """
+
+    graph: _LazyGraph | None = None
+
+
+# NOTE
+# Operands of recorded nodes: ("input", index), ("node", index) or ("scalar", value, type, dtype). The type keeps
+# 1, 1.0 and True apart, as they hash equal. A node is (c_function, *operands), a parameter node of a traced function
+# is (None, ("input", index)).
+_Operand = tuple[Any, ...]
+_Node = tuple[Any, ...]
+
+
+class _LazyGraph:
+    """
+    Records element-wise operations into a DAG instead of calling into the C library.
+
+    Identical operations on identical operands map to the same node (common subexpression elimination) and
+    operations with an identity scalar, such as x + 0 or x * 1, are folded away. Operations whose result dtype or
+    shape can not be inferred in Python are not recorded and run eagerly.
+
+    Each thread records into its own active graph, see `_active_graph`.
+    """
+
+    def __init__(self) -> None:
+        self.inputs: list[Array] = []
+        self.nodes: list[_Node] = []
+        self.outputs: weakref.WeakSet[_LazyArray] = weakref.WeakSet()
+        self.emitted: weakref.WeakSet[Array] = weakref.WeakSet()
+        self.materializations = 0
+        self._input_index: dict[int, int] = {}
+        self._node_index: dict[_Node, int] = {}
+
+    def record(
+        self, lhs: int | float | complex | Array, rhs: int | float | complex | Array, c_function: Any
+    ) -> Array | None:
+        # NOTE unwraps the functions af.debug.profile() hands out, so they match the recorded functions
+        c_function = getattr(c_function, "__wrapped__", c_function)
+        metadata = _lazy_result_metadata(lhs, rhs, c_function)
+        if metadata is None:
+            return None
+
+        identity = _RIGHT_IDENTITIES.get(c_function) if isinstance(lhs, Array) else _LEFT_IDENTITIES.get(c_function)
+        operand, scalar = (lhs, rhs) if isinstance(lhs, Array) else (rhs, lhs)
+        if identity is not None and not isinstance(scalar, Array) and scalar == identity and metadata.dtype != afbool:
+            return self._alias(cast(Array, operand), metadata)
+
+        return self._add_node(
+            (c_function, self._operand(lhs, metadata.dtype), self._operand(rhs, metadata.dtype)), metadata
+        )
+
+    def record_unary(self, array: Array, c_function: Any) -> Array | None:
+        c_function = getattr(c_function, "__wrapped__", c_function)
+        metadata = array._get_metadata()
+
+        if c_function in _BOOL_RESULT_FUNCTIONS:
+            metadata = metadata._replace(dtype=afbool)
+        elif metadata.dtype not in _REAL_FLOATING_DTYPES:
+            # NOTE e.g. integer inputs of sqrt are promoted to a floating point type by the C library
+            return None
+
+        return self._add_node((c_function, self._operand(array, metadata.dtype)), metadata)
+
+    def add_parameter(self, array: Array) -> Array:
+        """
+        Returns a placeholder for the array, so operations on it are recorded against the parameter position
+        instead of the handle.
+        """
+        index = len(self.inputs)
+        self.inputs.append(_internal_array(wrapper.retain_array(array.arr), array._get_metadata(), array._depth))
+        return self._add_node((None, ("input", index)), array._get_metadata())
+
+    def dependencies(self, roots: list[int]) -> list[int]:
+        """
+        Returns the nodes needed to compute the roots in topological order.
+        """
+        needed: set[int] = set()
+        stack = list(roots)
+        while stack:
+            index = stack.pop()
+            if index not in needed:
+                needed.add(index)
+                stack.extend(operand[1] for operand in self.nodes[index][1:] if operand[0] == "node")
+
+        # NOTE nodes are recorded after their operands, so index order is a topological order
+        return sorted(needed)
+
+    def materialize(self) -> None:
+        """
+        Emits one wrapper call per node needed by the pending results and hands each result its handle.
+        """
+        pending = [array for array in self.outputs if array._node is not None]
+        if not pending:
+            return
+
+        self.materializations += 1
+        handles: dict[int, AFArray] = {}
+        constants: dict[_Operand, AFArray] = {}
+        depths: dict[int, int] = {}
+
+        try:
+            for index in self.dependencies([cast(int, array._node) for array in pending]):
+                c_function, *operands = self.nodes[index]
+                args = [self._handle(operand, handles, constants) for operand in operands]
+                depths[index] = self._depth(operands, depths) + (0 if c_function is None else 1)
+
+                if c_function is None:
+                    handles[index] = wrapper.retain_array(args[0])
+                elif any(operand[0] == "scalar" for operand in operands):
+                    handles[index] = _call_broadcasting(c_function, *args)
+                else:
+                    handles[index] = c_function(*args)
+
+            for array in pending:
+                index = cast(int, array._node)
+                array._set_arr(wrapper.retain_array(handles[index]), array._metadata, created=False)
+                _limit_jit_depth(array, depths[index])
+                self.emitted.add(array)
+        finally:
+            for arr in [*handles.values(), *constants.values()]:
+                wrapper.release_array(arr)
+
+    def close(self) -> None:
+        """
+        Emits the pending results and evaluates all live results of the graph with a single eval_multiple call.
+        """
+        self.materialize()
+        arrays = [array.arr for array in self.emitted]
+
+        if arrays:
+            wrapper.eval_multiple(len(arrays), *arrays)
+
+        self.inputs.clear()
+        self._input_index.clear()
+
+    def _add_node(self, node: _Node, metadata: _ArrayMetadata) -> Array:
+        index = self._node_index.get(node)
+
+        if index is None:
+            index = len(self.nodes)
+            self.nodes.append(node)
+            self._node_index[node] = index
+
+        return _LazyArray.from_node(self, index, metadata)
+
+    def _alias(self, array: Array, metadata: _ArrayMetadata) -> Array:
+        if isinstance(array, _LazyArray) and array._node is not None and array._graph is self:
+            return _LazyArray.from_node(self, array._node, metadata)
+
+        return Array(array)
+
+    def _operand(self, value: int | float | complex | Array, dtype: Dtype) -> _Operand:
+        if isinstance(value, _LazyArray) and value._node is not None and value._graph is self:
+            return ("node", value._node)
+
+        if isinstance(value, Array):
+            # NOTE inputs are retained, so later updates of the caller's array do not change the recorded graph
+            key = value.arr.value or 0
+            if key not in self._input_index:
+                self._input_index[key] = len(self.inputs)
+                self.inputs.append(
+                    _internal_array(wrapper.retain_array(value.arr), value._get_metadata(), value._depth)
+                )
+
+            return ("input", self._input_index[key])
+
+        return ("scalar", value, type(value), dtype)
+
+    def _depth(self, operands: list[_Operand], depths: dict[int, int]) -> int:
+        depth = 0
+
+        for kind, index, *_ in operands:
+            if kind == "node":
+                depth = max(depth, depths[index])
+            elif kind == "input":
+                depth = max(depth, self.inputs[index]._depth)
+
+        return depth
+
+    def _handle(self, operand: _Operand, handles: dict[int, AFArray], constants: dict[_Operand, AFArray]) -> AFArray:
+        if operand[0] == "node":
+            return handles[operand[1]]
+
+        if operand[0] == "input":
+            return self.inputs[operand[1]].arr
+
+        if operand not in constants:
+            constants[operand] = wrapper.create_constant_array(operand[1], (1,), operand[3])
+
+        return constants[operand]
+
+
+def _lazy_result_metadata(
+    lhs: int | float | complex | Array, rhs: int | float | complex | Array, c_function: Any
+) -> _ArrayMetadata | None:
+    arrays = [operand for operand in (lhs, rhs) if isinstance(operand, Array)]
+
+    if not arrays or not all(isinstance(operand, Array | int | float) for operand in (lhs, rhs)):
+        return None
+
+    metadata = arrays[0]._get_metadata()
+
+    if len(arrays) == 2:
+        other = arrays[1]._get_metadata()
+        # NOTE broadcasting of two arrays is left to the C library
+        if other.shape != metadata.shape:
+            return None
+
+        if other.dtype != metadata.dtype:
+            if c_function not in _PROMOTING_FUNCTIONS:
+                return None
+
+            metadata = metadata._replace(dtype=_implicit_dtype(metadata.dtype, other.dtype))
+
+    if c_function in _BOOL_RESULT_FUNCTIONS:
+        return metadata._replace(dtype=afbool)
+
+    return metadata
+
+
+def _implicit_dtype(lhs: Dtype, rhs: Dtype) -> Dtype:
+    """
+    Returns the dtype ArrayFire promotes two array operands of different dtypes to.
+    """
+    return _IMPLICIT_DTYPES[lhs, rhs]
+
+
+_BOOL_RESULT_FUNCTIONS = {
+    wrapper.lt,
+    wrapper.le,
+    wrapper.gt,
+    wrapper.ge,
+    wrapper.eq,
+    wrapper.neq,
+    wrapper.and_,
+    wrapper.or_,
+    wrapper.not_,
+    wrapper.iszero,
+    wrapper.isinf,
+    wrapper.isnan,
+}
+_PROMOTING_FUNCTIONS = {
+    wrapper.add,
+    wrapper.sub,
+    wrapper.mul,
+    wrapper.div,
+    wrapper.lt,
+    wrapper.le,
+    wrapper.gt,
+    wrapper.ge,
+    wrapper.eq,
+    wrapper.neq,
+    wrapper.and_,
+    wrapper.or_,
+}
+_IMPLICIT_PROMOTION_ORDER = (
+    complex64,
+    complex32,
+    float64,
+    float32,
+    float16,
+    uint64,
+    int64,
+    uint32,
+    int32,
+    uint16,
+    int16,
+    uint8,
+    afbool,
+)
+# NOTE precomputed for every dtype pair, the result is the operand dtype that comes first in the order above
+_IMPLICIT_DTYPES = {
+    (lhs, rhs): min(lhs, rhs, key=_IMPLICIT_PROMOTION_ORDER.index)
+    for lhs in _IMPLICIT_PROMOTION_ORDER
+    for rhs in _IMPLICIT_PROMOTION_ORDER
+}
+_IMPLICIT_DTYPES[complex32, float64] = _IMPLICIT_DTYPES[float64, complex32] = complex64
+_RIGHT_IDENTITIES = {wrapper.add: 0, wrapper.sub: 0, wrapper.mul: 1, wrapper.div: 1, wrapper.pow: 1}
+_LEFT_IDENTITIES = {wrapper.add: 0, wrapper.mul: 1}
+
+_ARR_SLOT = Array.__dict__["_arr"]
+
+
+def _reorder(array: Array) -> Array:
+    """
+    Returns a reordered array to help interoperate with row major formats.
+    """
+    if array.ndim <= 1:
+        return array
+
+    return Array.from_afarray(wrapper.reorder(array.arr, *_reversed_axes(array.ndim)))
+
+
+def _metadata_string(dtype: Dtype, dims: tuple[int, ...] | None = None) -> str:
     return "arrayfire.Array()\n" f"Type: {dtype.name}\n" f"Dims: {str(dims) if dims else ''}"
 
 
-@afarray_as_array
-def process_c_function(lhs: int | float | Array, rhs: int | float | Array, c_function: Any) -> Array:
-    if isinstance(lhs, Array) and isinstance(rhs, Array):
-        lhs_array = lhs.arr
-        rhs_array = rhs.arr
+def process_c_function(
+    lhs: int | float | complex | Array, rhs: int | float | complex | Array, c_function: Any
+) -> Array:
+    graph = _active_graph.graph
+    if graph is not None:
+        out = graph.record(lhs, rhs, c_function)
+        if out is not None:
+            return out
 
-    elif isinstance(lhs, Array) and isinstance(rhs, int | float):
-        lhs_array = lhs.arr
-        rhs_array = wrapper.create_constant_array(rhs, lhs.shape, lhs.dtype)
+    # NOTE one dict lookup on the operand types replaces the isinstance checks of every operation
+    operand_types = (type(lhs), type(rhs))
+    handler = _binary_handlers.get(operand_types) or _binary_handler(*operand_types)
+    return handler(lhs, rhs, c_function)
 
-    elif isinstance(lhs, int | float) and isinstance(rhs, Array):
-        lhs_array = wrapper.create_constant_array(lhs, rhs.shape, rhs.dtype)
-        rhs_array = rhs.arr
 
+def _binary_array_array(lhs: Array, rhs: Array, c_function: Any) -> Array:
+    out = Array.from_afarray(c_function(lhs.arr, rhs.arr))
+    return _limit_jit_depth(out, max(lhs._depth, rhs._depth) + 1)
+
+
+def _binary_array_scalar(lhs: Array, rhs: int | float | complex, c_function: Any) -> Array:
+    out = Array.from_afarray(_process_scalar_operand(lhs.arr, rhs, lhs.dtype, c_function, scalar_is_lhs=False))
+    return _limit_jit_depth(out, lhs._depth + 1)
+
+
+def _binary_scalar_array(lhs: int | float | complex, rhs: Array, c_function: Any) -> Array:
+    out = Array.from_afarray(_process_scalar_operand(rhs.arr, lhs, rhs.dtype, c_function, scalar_is_lhs=True))
+    return _limit_jit_depth(out, rhs._depth + 1)
+
+
+def _binary_unsupported(lhs: Any, rhs: Any, c_function: Any) -> Array:
+    raise TypeError(f"{type(rhs)} is not supported and can not be passed to C binary function.")
+
+
+def _binary_handler(lhs_type: type, rhs_type: type) -> Callable[[Any, Any, Any], Array]:
+    """
+    Returns the function that applies a binary C function to operands of the given types and adds it to the dispatch
+    table, so subclasses of Array and of the Python scalar types are classified once.
+    """
+    lhs_is_array = issubclass(lhs_type, Array)
+    rhs_is_array = issubclass(rhs_type, Array)
+
+    handler: Callable[[Any, Any, Any], Array]
+    if lhs_is_array and rhs_is_array:
+        handler = _binary_array_array
+    elif lhs_is_array and issubclass(rhs_type, _SCALAR_TYPES):
+        handler = _binary_array_scalar
+    elif rhs_is_array and issubclass(lhs_type, _SCALAR_TYPES):
+        handler = _binary_scalar_array
     else:
-        raise TypeError(f"{type(rhs)} is not supported and can not be passed to C binary function.")
+        handler = _binary_unsupported
 
-    return cast(Array, c_function(lhs_array, rhs_array))
+    _binary_handlers[lhs_type, rhs_type] = handler
+    return handler
 
 
-def _get_processed_index(key: IndexKey, shape: tuple[int, ...]) -> tuple[int, ...]:
-    if isinstance(key, tuple):
-        return tuple(_index_to_afindex(key[i], shape[i]) for i in range(len(key)))
+def process_unary_c_function(array: Array, c_function: Any) -> Array:
+    graph = _active_graph.graph
+    if graph is not None:
+        out = graph.record_unary(array, c_function)
+        if out is not None:
+            return out
+
+    return _limit_jit_depth(Array.from_afarray(c_function(array.arr)), array._depth + 1)
+
+
+def _process_inplace_c_function(lhs: Array, rhs: int | float | Array, c_function: Any) -> Array:
+    """
+    Applies a binary C function in place of lhs.
+
+    If lhs owns its data and the result keeps its dtype and shape, lhs takes over the result handle and its previous
+    buffer is released right away, so `acc += x` in a loop does not hold an extra buffer per iteration. Otherwise the
+    result is returned as a new Array, as for the out-of-place operator.
+    """
+    return _take_over_result(lhs, process_c_function(lhs, rhs, c_function))
+
+
+def _take_over_result(lhs: Array, out: Array) -> Array:
+    """
+    Moves the handle of out into lhs if both have the same dtype and shape and lhs owns its data.
+    """
+    if isinstance(out, _LazyArray):
+        # NOTE taking over the handle would emit the recorded graph, so lazy results are rebound instead
+        return out
+
+    if not lhs.is_owner or out.dtype != lhs.dtype or out.shape != lhs.shape:
+        return out
+
+    wrapper.release_array(lhs.arr)
+    lhs._set_arr(out.arr, out._get_metadata(), out._depth)
+    out._set_arr(AFArray.create_null_pointer())
+    return lhs
+
+
+def _floor_divide(lhs: int | float | Array, rhs: int | float | Array) -> Array:
+    """
+    Computes lhs // rhs with Python rounding. Every step is a lazy element-wise node, so ArrayFire evaluates the
+    whole expression in one JIT kernel without materializing the quotient.
+    """
+    quotient = process_c_function(lhs, rhs, wrapper.div)
+
+    if quotient.is_complex:
+        raise TypeError("Floor division is not defined for complex data types.")
+
+    if quotient.is_floating:
+        return process_unary_c_function(quotient, wrapper.floor)
+
+    if quotient.dtype in _UNSIGNED_DTYPES:
+        return quotient
+
+    # NOTE
+    # Integer division truncates toward zero and the remainder takes the sign of lhs. The truncated quotient is one
+    # too large exactly where the remainder is nonzero and its sign differs from the sign of rhs.
+    remainder = process_c_function(lhs, rhs, wrapper.rem)
+
+    if not isinstance(rhs, Array):
+        needs_correction = remainder > 0 if rhs < 0 else remainder < 0
+    else:
+        needs_correction = (remainder != 0) & ((remainder < 0) != (rhs < 0))
+
+    correction = Array.from_afarray(wrapper.cast(needs_correction.arr, quotient.dtype))
+    return process_c_function(quotient, correction, wrapper.sub)
+
+
+def _matmul(lhs: Array, rhs: Array) -> Array:
+    from arrayfire.library.array_functions import moddims
+    from arrayfire.library.constants import MatProp
+    from arrayfire.library.linear_algebra import dot, matmul
+
+    lhs_inner = lhs.shape[0] if lhs.ndim == 1 else lhs.shape[1] if lhs.ndim > 1 else 0
+    rhs_inner = rhs.shape[0] if rhs.ndim else 0
+
+    if lhs_inner != rhs_inner or not lhs_inner:
+        raise ValueError(f"Inner dimensions of {lhs.shape} and {rhs.shape} do not match for matrix multiplication.")
+
+    if lhs.ndim == 1 and rhs.ndim == 1:
+        return dot(lhs, rhs)
+
+    rhs_source, rhs_opts = _matmul_operand(rhs)
+
+    if lhs.ndim == 1:
+        # NOTE a vector on the left is a row vector, as in NumPy
+        out = matmul(lhs, rhs_source, MatProp.TRANS, rhs_opts)
+        return moddims(out, out.shape[1:])
+
+    lhs_source, lhs_opts = _matmul_operand(lhs)
+    out = matmul(lhs_source, rhs_source, lhs_opts, rhs_opts)
+
+    if rhs.ndim == 1 and out.ndim > 2:
+        return moddims(out, (out.shape[0],) + out.shape[2:])
+
+    return out
+
+
+def _matmul_operand(array: Array) -> tuple[Array, Any]:
+    """
+    Returns the array to pass to matmul and its MatProp flag, unwrapping a pending transpose.
+    """
+    from arrayfire.library.constants import MatProp
+
+    if isinstance(array, _TransposedArray) and array._source is not None:
+        return array._source, MatProp.CTRANS if array._conjugate else MatProp.TRANS
+
+    return array, MatProp.NONE
+
+
+def _process_scalar_operand(
+    array: AFArray, scalar: int | float | complex, dtype: Dtype, c_function: Any, *, scalar_is_lhs: bool
+) -> AFArray:
+    """
+    Applies a binary C function to an array and a Python scalar without building a full-size constant operand.
+
+    The scalar becomes a 1-element constant node of the array dtype and the C function is called in batch mode,
+    so the backend broadcasts it over the array inside the JIT kernel instead of materialising a temporary of
+    the array shape.
+    """
+    scalar_array = wrapper.create_constant_array(scalar, (1,), dtype)
+
+    try:
+        if scalar_is_lhs:
+            return _call_broadcasting(c_function, scalar_array, array)
+
+        return _call_broadcasting(c_function, array, scalar_array)
+    finally:
+        # NOTE the result keeps its own reference to the constant node
+        wrapper.release_array(scalar_array)
+
+
+def _call_broadcasting(c_function: Any, *args: AFArray) -> AFArray:
+    """
+    Calls a binary C function in batch mode, so 1-element operands are broadcast inside the JIT kernel.
+    """
+    return cast(AFArray, getattr(_batch_library, c_function.__name__)(*args))
+
+
+class _BatchLibrary:
+    """
+    Binary functions of the wrapper that always run in batch mode.
+
+    The functions of the wrapper read the batch flag from a process-wide variable when called, so setting it around
+    a call would race with the binary operations of other threads. These functions pass the flag to the C library
+    directly instead.
+    """
+
+    def __getattr__(self, name: str) -> Callable[[AFArray, AFArray], AFArray]:
+        # NOTE the C functions of and_ and or_ have no trailing underscore
+        c_name = name.rstrip("_")
+
+        def batch_function(lhs: AFArray, rhs: AFArray, /) -> AFArray:
+            out = AFArray.create_null_pointer()
+            call_from_clib(c_name, ctypes.pointer(out), lhs, rhs, True)
+            return out
+
+        batch_function.__name__ = name
+        setattr(self, name, batch_function)
+        return batch_function
+
+
+def _mask_positions(key: IndexKey) -> IndexKey:
+    """
+    Replaces the boolean masks in a tuple key by the positions of their true elements.
+
+    `where` reads back the number of positions, which is the size of the indexed region, so the key costs one host
+    sync per mask. Indexing by the mask itself would count it on the host first and run `where` again in the C
+    library.
+    """
+    if not isinstance(key, tuple) or not any(isinstance(item, Array) and item.dtype == afbool for item in key):
+        return key
+
+    return tuple(
+        (
+            Array.from_afarray(_host_sync(wrapper.where, item.arr))
+            if isinstance(item, Array) and item.dtype == afbool
+            else item
+        )
+        for item in key
+    )
+
+
+def _array_key_indices(array: Array, key: Array) -> tuple[int, wrapper.CIndexStructure, tuple[int, ...]] | None:
+    """
+    Returns the number of indexed dimensions, the indices and the shape of the indexed elements for an array key, or
+    None if the key is a boolean mask without true elements.
+
+    A boolean mask of the shape of array selects elements in column-major order, any other key indexes the first
+    dimension. The positions of the true elements of a mask are computed by `where` on the device and the number of
+    selected elements comes with its result, so the mask is not counted separately. `where` still reads the count
+    back to size its result, which is a host sync.
+    """
+    if key.dtype == afbool:
+        arr = _host_sync(wrapper.where, key.arr)
+        num = wrapper.get_elements(arr)
+
+        if num == 0:
+            wrapper.release_array(arr)
+            return None
+    else:
+        arr = wrapper.retain_array(key.arr)
+        num = key.size
+
+    # NOTE the wrapper only builds sequence indices, the index takes over arr and releases it once it is collected
+    index = wrapper.IndexStructure(slice(None))
+    index.idx.arr = arr.value
+    index.isSeq = False
+
+    indices = wrapper.CIndexStructure()
+    indices[0] = index
+
+    if key.dtype == afbool and key.shape == array.shape:
+        return 1, indices, (num,)
+
+    return array.ndim, indices, (num,) + array.shape[1:]
+
+
+class _ViewBase(NamedTuple):
+    """
+    Array a view was indexed from and the handle the array had at the time. The view shares the data of that
+    handle only.
+    """
+
+    array: Array
+    arr: AFArray
+
+
+class _IndexKey(NamedTuple):
+    """
+    Index structs of a key and the shape of the region it indexes in an array.
+    """
+
+    indices: wrapper.CIndexStructure
+    dims: tuple[int, ...]
+
+
+def _key_pattern(key: IndexKey) -> tuple[Any, ...] | None:
+    """
+    Returns a hashable pattern of a key made of at most 4 ints and slices with int or None bounds, or None for any
+    other key. Ints are kept as is and slices become (start, stop, step) tuples, as slices are not hashable before
+    Python 3.12.
+    """
+    if type(key) is int:
+        return (key,)
+
+    keys = key if type(key) is tuple else (key,)
+    if len(keys) > 4:  # type: ignore[arg-type]
+        return None
+
+    pattern: list[Any] = []
+    for item in keys:  # type: ignore[union-attr]
+        if type(item) is int:
+            pattern.append(item)
+        elif (
+            type(item) is slice
+            and type(item.start) in _SLICE_BOUND_TYPES
+            and type(item.stop) in _SLICE_BOUND_TYPES
+            and type(item.step) in _SLICE_BOUND_TYPES
+        ):
+            pattern.append((item.start, item.stop, item.step))
+        else:
+            return None
+
+    return tuple(pattern)
+
+
+def _is_view_pattern(pattern: tuple[Any, ...] | None) -> bool:
+    """
+    Returns True if a key pattern indexes the first axis with an int or a slice with a step of 1, the only keys that
+    index a linear array without a copy.
+    """
+    if pattern is None:
+        return False
 
-    return (_index_to_afindex(key, shape[0]),) + shape[1:]
+    return not pattern or type(pattern[0]) is int or pattern[0][2] in (None, 1)
+
+
+def _compiled_index_key(pattern: tuple[Any, ...], shape: tuple[int, ...]) -> _IndexKey:
+    """
+    Returns the index key of a key pattern, see _key_pattern, for an array of the given shape. The index structs are
+    built once per pattern and shape and reused by every later index with the same pattern.
+    """
+    cache_key = (pattern, shape)
+    index_key = _index_keys.get(cache_key)
+
+    if index_key is None:
+        key = tuple(item if type(item) is int else slice(*item) for item in pattern)
+        index_key = _IndexKey(wrapper.get_indices(key), _get_processed_index(key, shape))
+
+        if len(_index_keys) >= _INDEX_KEYS_SIZE:
+            _index_keys.clear()
+        _index_keys[cache_key] = index_key
+
+    return index_key
+
+
+def _get_index_key(key: IndexKey, shape: tuple[int, ...]) -> _IndexKey:
+    pattern = _key_pattern(key)
+    if pattern is not None:
+        return _compiled_index_key(pattern, shape)
+
+    return _IndexKey(wrapper.get_indices(key), _get_processed_index(key, shape))  # type: ignore[arg-type]  # FIXME
+
+
+def _get_processed_index(key: IndexKey, shape: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    Returns the shape of the region of an array of the given shape that key indexes, dimensions the key leaves out
+    are spanned entirely.
+    """
+    keys = key if isinstance(key, tuple) else (key,)
+    dims = tuple(_index_to_afindex(item, axis) for item, axis in zip(keys, shape))
+    ndims = len(dims)
+    return dims + shape[ndims:]
 
 
 def _index_to_afindex(key: int | float | complex | bool | slice | wrapper.ParallelRange | Array, axis: int) -> int:
@@ -1153,12 +2379,10 @@ def _index_to_afindex(key: int | float | complex | bool | slice | wrapper.Parall
     elif isinstance(key, slice):
         out = _slice_to_length(key, axis)
     elif isinstance(key, wrapper.ParallelRange):
-        out = _slice_to_length(key.S, axis)
+        out = _slice_to_length(key.chunk, axis)
     elif isinstance(key, Array):
         if key.dtype == afbool:
-            from arrayfire.library.vector_algorithms import sum as af_sum
-
-            out = int(af_sum(key))  # type: ignore[arg-type]
+            out = int(_host_sync(wrapper.count_all, key.arr).real)
         else:
             out = key.size
     else:
@@ -1168,21 +2392,362 @@ def _index_to_afindex(key: int | float | complex | bool | slice | wrapper.Parall
 
 
 def _slice_to_length(key: slice, axis: int) -> int:
-    if key.start is None:
-        start = 0
-    elif key.start < 0:
-        start = axis - key.start
+    return len(range(*key.indices(axis)))
+
+
+def _broadcast_assign(
+    array: Array,
+    key: IndexKey,
+    indices: wrapper.CIndexStructure,
+    value: int | float | complex | bool | Array,
+    dims: tuple[int, ...],
+) -> None:
+    """
+    Assigns a scalar or an array with fewer elements than the indexed region of shape dims, broadcasting it along the
+    dimensions where its shape is 1 or missing.
+
+    ArrayFire constants and tiles are lazy, but assign_gen evaluates its right-hand side into a temporary of the size
+    of the region. Large regions are therefore assigned in chunks along the outermost broadcast dimension, so the
+    broadcast value is evaluated once into a tile of at most _ASSIGN_TILE_ELEMENTS elements that every chunk reuses.
+    """
+    value_shape = (1,) * len(dims) if not isinstance(value, Array) else value.shape + (1,) * (len(dims) - value.ndim)
+
+    if len(value_shape) > len(dims) or any(size not in (1, dim) for size, dim in zip(value_shape, dims)):
+        raise ValueError(f"Can not broadcast a value of shape {value_shape} to the indexed shape {dims}.")
+
+    keys: list[Any] = list(key) if isinstance(key, tuple) else [key]
+    broadcast_axes = [axis for axis, (size, dim) in enumerate(zip(value_shape, dims)) if size == 1 and dim > 1]
 
-    if key.stop is None:
-        stop = axis
-    elif key.stop < 0:
-        stop = axis - key.stop
+    axis = broadcast_axes[-1] if broadcast_axes else 0
+    axis_key = keys[axis] if axis < len(keys) else slice(None)
+    chunk = max(1, _ASSIGN_TILE_ELEMENTS // (math.prod(dims) // dims[axis])) if dims[axis] else 1
 
-    if key.step is None:
-        step = 1
+    if not broadcast_axes or not isinstance(axis_key, slice) or chunk >= dims[axis] or (axis_key.step or 1) < 0:
+        tile = _broadcast_tile(array, value, value_shape, dims)
+        try:
+            _assign_arr(array, indices, tile)
+        finally:
+            wrapper.release_array(tile)
+        return
 
-    return int(((stop - start - 1) / step) + 1)
+    keys += [slice(None)] * (axis + 1 - len(keys))
+    positions = range(*axis_key.indices(array.shape[axis]))
+    tiles: dict[int, AFArray] = {}
+
+    try:
+        for start in range(0, len(positions), chunk):
+            stop = start + chunk
+            part = positions[start:stop]
+            keys[axis] = slice(part.start, part.stop, part.step)
+
+            # NOTE only the last chunk can be shorter, so at most two tiles are evaluated
+            if len(part) not in tiles:
+                tile_dims = list(dims)
+                tile_dims[axis] = len(part)
+                tiles[len(part)] = _broadcast_tile(array, value, value_shape, tuple(tile_dims))
+                wrapper.eval(tiles[len(part)])
+
+            _assign_arr(array, _get_index_key(tuple(keys), array.shape).indices, tiles[len(part)])
+    finally:
+        for tile in tiles.values():
+            wrapper.release_array(tile)
+
+
+def _broadcast_tile(
+    array: Array, value: int | float | complex | bool | Array, value_shape: tuple[int, ...], dims: tuple[int, ...]
+) -> AFArray:
+    if isinstance(value, Array):
+        return wrapper.tile(value.arr, *(dim // size for dim, size in zip(dims, value_shape)))
+
+    return wrapper.create_constant_array(value, dims, array.dtype)
+
+
+def _assign_arr(array: Array, indices: wrapper.CIndexStructure, arr: AFArray) -> None:
+    array._replace_arr(wrapper.assign_gen(array._arr, arr, array.ndim, indices))
 
 
 def _array_as_str(array: Array) -> str:
-    return wrapper.array_to_string("", array.arr, 4, True)
+    from arrayfire.library.printing import array_to_summary_string
+
+    return array_to_summary_string(array)
+
+
+def _reversed_axes(ndim: int) -> tuple[int, ...]:
+    """
+    Returns the reorder axes that reverse the first ndim dimensions and keep the remaining ones in place.
+    """
+    return tuple(range(ndim - 1, -1, -1)) + tuple(range(ndim, 4))
+
+
+def _column_major_strides(shape: tuple[int, ...]) -> tuple[int, ...]:
+    strides = [1]
+    for dim in shape[:-1]:
+        strides.append(strides[-1] * dim)
+    return tuple(strides)
+
+
+def _nest(values: list[Any], offset: int, shape: tuple[int, ...], strides: tuple[int, ...]) -> list[Any]:
+    """
+    Cuts a nested list out of flat values, one level per dimension. The innermost lists are (strided) slices.
+    """
+    if len(shape) == 1:
+        step = strides[0]
+        stop = offset + shape[0] * step
+        return values[offset:stop:step]
+
+    return [_nest(values, offset + i * strides[0], shape[1:], strides[1:]) for i in range(shape[0])]
+
+
+def _host_buffer(arr: AFArray, nbytes: int) -> bytearray:
+    buffer = bytearray(nbytes)
+    _copy_to_host(arr, ctypes.addressof((ctypes.c_char * nbytes).from_buffer(buffer)))
+    return buffer
+
+
+def _host_values(arr: AFArray, size: int, dtype: Dtype) -> list[Any]:
+    """
+    Copies the array data to the host and converts it to Python scalars in column-major order.
+    """
+    buffer = _host_buffer(arr, size * ctypes.sizeof(dtype.c_type))
+
+    if dtype == float16:
+        return list(struct.unpack(f"={size}e", buffer))
+
+    if dtype in (complex32, complex64):
+        parts = memoryview(buffer).cast(_MEMORYVIEW_FORMATS[float32 if dtype == complex32 else float64]).tolist()
+        return [complex(real, imag) for real, imag in zip(parts[::2], parts[1::2])]
+
+    return cast(list, memoryview(buffer).cast(_MEMORYVIEW_FORMATS[dtype]).tolist())
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Please install arrayfire[numpy] or numpy directly to use NumPy interoperability.")
+
+    return numpy
+
+
+def _is_host_backend() -> bool:
+    return get_backend().backend_type == BackendType.cpu
+
+
+def _copy_to_host(arr: AFArray, address: int) -> None:
+    """
+    Copies the array data in column-major order into host memory at the given address.
+    """
+    _host_sync(call_from_clib, "get_data_ptr", ctypes.c_void_p(address), arr)
+
+
+class _Observers(threading.local):
+    """
+    Trackers and observers registered by the current thread. Each thread only reports its own syncs and arrays to
+    them, like the profilers of af.debug.profile().
+    """
+
+    def __init__(self) -> None:
+        # NOTE trackers registered by af.debug.track_syncs(), each has a record(name, duration, stack) method
+        self.sync_trackers: list[Any] = []
+
+        # NOTE
+        # Observers registered by af.debug.track_memory() and af.scope(). Their track(array, created) method is
+        # called for every new handle, created is False if the array held another handle before, e.g. after an
+        # in-place operation.
+        self.array_observers: list[Any] = []
+
+
+_observers = _Observers()
+
+
+def _internal_array(arr: AFArray, metadata: _ArrayMetadata | None = None, depth: int = 0) -> Array:
+    """
+    Wraps a handle held by another object of the library, e.g. the source of a lazy transpose. Unlike
+    `Array.from_afarray` the array is not reported to observers, so `af.scope()` never releases it.
+    """
+    out = Array.__new__(Array)
+    out._host_view = None
+    _ARR_SLOT.__set__(out, arr)
+    out._metadata = metadata
+    out._depth = depth
+    out._base = None
+    out._handle_cell = _release_manager.track(out, arr)
+    return out
+
+
+def _notify_observers(array: Array, created: bool) -> None:
+    for observer in _observers.array_observers:
+        observer.track(array, created)
+
+
+def _host_sync(c_function: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Calls a C function that waits for the device to finish computing its inputs before returning data to the host.
+    While `af.debug.track_syncs()` is active the call is timed and reported with the stack of its caller.
+    """
+    sync_trackers = _observers.sync_trackers
+    if not sync_trackers:
+        return c_function(*args, **kwargs)
+
+    start = time.perf_counter()
+
+    try:
+        return c_function(*args, **kwargs)
+    finally:
+        duration = time.perf_counter() - start
+        # NOTE drops the frame of _host_sync itself
+        stack = traceback.StackSummary.from_list(traceback.extract_stack()[:-1])
+        name = args[0] if c_function is call_from_clib else getattr(c_function, "__name__", repr(c_function))
+
+        for tracker in sync_trackers:
+            tracker.record(name, duration, stack)
+
+
+def _array_interface(address: int, shape: tuple[int, ...], dtype: Dtype) -> dict[str, Any]:
+    itemsize = ctypes.sizeof(dtype.c_type)
+
+    if dtype == afbool:
+        typestr = f"|b{itemsize}"
+    else:
+        kind = "c" if "complex" in dtype.name else "f" if "float" in dtype.name else dtype.name[0]
+        typestr = f"{'<' if sys.byteorder == 'little' else '>'}{kind}{itemsize}"
+
+    strides = [itemsize]
+    for dim in shape[:-1]:
+        strides.append(strides[-1] * dim)
+
+    return {
+        "version": 3,
+        "shape": shape,
+        "typestr": typestr,
+        "data": (address, False),
+        "strides": tuple(strides),
+    }
+
+
+class _HostView:
+    """
+    Host mapping of an array buffer on the CPU backend.
+
+    Holds its own reference to the buffer and keeps it locked, so the memory manager does not reuse it while any
+    consumer of the view is alive.
+    """
+
+    def __init__(self, array: Array) -> None:
+        # NOTE get_device_ptr detaches a shared buffer first, so it has to run before the buffer is retained
+        self.source = array.arr.value
+        address = wrapper.get_device_ptr(array.arr)
+        self._arr = wrapper.retain_array(array.arr)
+        self.previous: _HostView | None = None
+        self.__array_interface__ = _array_interface(address, array.shape, array.dtype)
+
+    def __del__(self) -> None:
+        wrapper.unlock_array(self._arr)
+        wrapper.release_array(self._arr)
+
+
+class _PinnedHostBuffer:
+    """
+    Page-locked host buffer filled with a single device-to-host copy of an array.
+    """
+
+    def __init__(self, array: Array) -> None:
+        self.address = wrapper.alloc_pinned(array.size * ctypes.sizeof(array.dtype.c_type))
+        _copy_to_host(array.arr, self.address)
+        self.__array_interface__ = _array_interface(self.address, array.shape, array.dtype)
+
+    def __del__(self) -> None:
+        if getattr(self, "address", None):
+            wrapper.free_pinned(self.address)
+
+
+class _JitDepthPolicy:
+    """
+    Evaluates results of element-wise operations once their JIT tree gets deeper than max_depth.
+
+    Every element-wise operation on arrays returns an unevaluated node that references the nodes of its operands, so
+    loops like `x = x * y` grow the kernel ArrayFire has to compile on evaluation without bound. The depth of an array
+    counts the element-wise operations since the last evaluated or non element-wise array along the deepest path, it
+    is an upper bound of the depth of the JIT tree behind the handle.
+    """
+
+    __slots__ = ("max_depth", "operations", "auto_evals")
+
+    def __init__(self, max_depth: int | None) -> None:
+        self.max_depth = max_depth
+        self.operations = 0
+        self.auto_evals = 0
+
+
+def _limit_jit_depth(out: Array, depth: int) -> Array:
+    policy = _jit_depth_policy
+    policy.operations += 1
+
+    if policy.max_depth is not None and depth > policy.max_depth:
+        wrapper.eval(out.arr)
+        policy.auto_evals += 1
+        depth = 0
+
+    out._depth = depth
+    return out
+
+
+class _ReleaseManager:
+    """
+    Releases the handles of garbage collected arrays.
+
+    Every Array registers a `weakref.finalize` callback that releases its handle as soon as the array is garbage
+    collected, so dropping the last reference to an array frees its device memory right away. Finalizers do not run
+    at interpreter exit: the process is about to free all device memory and the C library may already be unloaded.
+    """
+
+    def track(self, array: Array, arr: AFArray) -> list[AFArray]:
+        """
+        Registers the finalizer of array and returns the cell with the handle it releases. Storing another handle in
+        the cell hands the finalizer over to it, so in-place operations do not register a new one.
+        """
+        cell = [arr]
+        finalizer = weakref.finalize(array, _release_cell, cell)
+        finalizer.atexit = False
+        return cell
+
+    def release(self, array: Array) -> None:
+        # NOTE reads the slot directly, so a pending transpose is dropped instead of computed
+        arr = _ARR_SLOT.__get__(array)
+        array._set_arr(AFArray.create_null_pointer())
+
+        if arr.value:
+            wrapper.release_array(arr)
+
+
+def _release_cell(cell: list[AFArray]) -> None:
+    if cell[0].value:
+        wrapper.release_array(cell[0])
+
+
+_release_manager = _ReleaseManager()
+_active_graph = _ActiveGraph()
+# NOTE swapped by af.debug.profile() like the wrapper module
+_batch_library: Any = _BatchLibrary()
+# NOTE upper bound of the temporary that assigning a broadcast value evaluates, see _broadcast_assign
+_ASSIGN_TILE_ELEMENTS = 1 << 22
+# NOTE compiled index keys by key pattern and array shape, see _compiled_index_key. The cache is cleared once full, so
+# loops that index with a different int on every iteration do not grow it without bound.
+_index_keys: dict[tuple[tuple[Any, ...], tuple[int, ...]], _IndexKey] = {}
+_INDEX_KEYS_SIZE = 1024
+_SLICE_BOUND_TYPES = (int, type(None))
+# NOTE integers up to 2**53 convert to a double exactly
+_MAX_EXACT_DOUBLE_INT = 1 << 53
+_jit_depth_policy = _JitDepthPolicy(max_depth=64)
+
+# NOTE Python scalars are applied as 1-element constants of the array dtype, bool is a subclass of int
+_SCALAR_TYPES = (int, float, complex)
+# Binary operation handlers by the types of the left and right operand, see process_c_function. Types that are not
+# listed here are classified on their first use.
+_binary_handlers: dict[tuple[type, type], Callable[[Any, Any, Any], Array]] = {}
+
+for _lhs_type in (Array, _LazyArray, _TransposedArray, bool, int, float, complex):
+    for _rhs_type in (Array, _LazyArray, _TransposedArray, bool, int, float, complex):
+        _binary_handler(_lhs_type, _rhs_type)
+
+del _lhs_type, _rhs_type
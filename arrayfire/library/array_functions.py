@@ -10,8 +10,14 @@ __all__ = [
     "isinf",
     "isnan",
     "iszero",
+    "get_manual_eval_flag",
     "set_manual_eval_flag",
     "eval",
+    "lazy",
+    "get_max_jit_depth",
+    "set_max_jit_depth",
+    "get_jit_depth_stats",
+    "reset_jit_depth_stats",
     "copy_array",
     "flat",
     "flip",
@@ -24,16 +30,26 @@ __all__ = [
     "tile",
     "transpose",
     "lookup",
+    "as_strided",
+    "sliding_window_view",
 ]
 
 import warnings
-from typing import cast
+from contextlib import contextmanager
+from typing import Iterator, cast
 
 import arrayfire_wrapper.lib as wrapper
-from arrayfire_wrapper.lib import set_manual_eval_flag
-
-from arrayfire.array_object import Array, afarray_as_array
-from arrayfire.dtypes import Dtype, float32
+from arrayfire_wrapper.lib import get_manual_eval_flag, set_manual_eval_flag
+
+from arrayfire.array_object import (
+    Array,
+    _active_graph,
+    _column_major_strides,
+    _jit_depth_policy,
+    _LazyGraph,
+    afarray_as_array,
+)
+from arrayfire.dtypes import Dtype, float32, int32, int64
 from arrayfire.library.constants import Pad
 
 # Array creation
@@ -638,6 +654,114 @@ def eval(*arrays: Array) -> None:
     wrapper.eval_multiple(len(arrays), *arrs)
 
 
+@contextmanager
+def lazy() -> Iterator[None]:
+    """
+    Records element-wise operations into an expression graph and evaluates them together when the context exits.
+
+    Inside the context, arithmetic, comparison, logical and bitwise operators between arrays of the same dtype and
+    shape, or between an array and a Python scalar, are not passed to ArrayFire right away. Identical
+    subexpressions are recorded once and operations with an identity scalar, such as `x + 0` or `x * 1`, are
+    dropped. Automatic evaluation is disabled with `set_manual_eval_flag` for the duration of the context.
+
+    Note
+    ----
+    - Accessing the data of a recorded result, e.g. printing it or passing it to any other function, emits the
+      recorded operations early, with one wrapper call per distinct operation.
+    - On exit the remaining operations are emitted and all live results are evaluated with a single
+      `eval_multiple` call, so they can share one kernel launch.
+    - Operations that need type promotion or broadcasting between two arrays are executed eagerly.
+
+    Examples
+    --------
+    >>> import arrayfire as af
+    >>> a = af.randu((3, 3))
+    >>> b = af.randu((3, 3))
+    >>> with af.lazy():
+    ...     c = (a + b) * (a + b)  # a + b is computed once
+    ...     d = (a + b) * 1 - b  # * 1 is folded away
+    """
+    graph = _LazyGraph()
+    previous_graph = _active_graph.graph
+    previous_flag = get_manual_eval_flag()
+
+    _active_graph.graph = graph
+    set_manual_eval_flag(True)
+
+    try:
+        yield
+    finally:
+        _active_graph.graph = previous_graph
+
+        try:
+            graph.close()
+        finally:
+            set_manual_eval_flag(previous_flag)
+
+
+def get_max_jit_depth() -> int | None:
+    """
+    Returns the JIT depth above which results of element-wise operations are evaluated automatically.
+
+    Returns
+    -------
+    int | None
+        Maximum depth, or None if results are never evaluated automatically.
+    """
+    return _jit_depth_policy.max_depth
+
+
+def set_max_jit_depth(max_depth: int | None) -> None:
+    """
+    Sets the JIT depth above which results of element-wise operations are evaluated automatically.
+
+    Element-wise operations are not computed right away, ArrayFire builds a tree of pending operations and compiles
+    it into a single kernel once the result is needed. In loops like `x = x * y` the tree behind x grows with every
+    iteration, and so does the compilation time of the kernel. The depth of a result counts the element-wise
+    operations since the last evaluated array along its deepest path; a result deeper than max_depth is evaluated
+    right after it is created.
+
+    Parameters
+    ----------
+    max_depth : int | None
+        Maximum depth, initially 64. None disables automatic evaluation.
+
+    Raises
+    ------
+    ValueError
+        If max_depth is not a positive integer.
+
+    Note
+    ----
+    - Use `get_jit_depth_stats` to check how often results were evaluated automatically.
+    """
+    if max_depth is not None and max_depth < 1:
+        raise ValueError("max_depth must be a positive integer or None.")
+
+    _jit_depth_policy.max_depth = max_depth
+
+
+def get_jit_depth_stats() -> dict[str, int]:
+    """
+    Returns the counters of the automatic JIT depth control.
+
+    Returns
+    -------
+    dict[str, int]
+        "operations": number of element-wise operations whose depth was tracked.
+        "auto_evals": number of results evaluated because their depth exceeded the maximum depth.
+    """
+    return {"operations": _jit_depth_policy.operations, "auto_evals": _jit_depth_policy.auto_evals}
+
+
+def reset_jit_depth_stats() -> None:
+    """
+    Resets the counters returned by `get_jit_depth_stats` to zero.
+    """
+    _jit_depth_policy.operations = 0
+    _jit_depth_policy.auto_evals = 0
+
+
 # Move and reorder
 
 
@@ -1262,3 +1386,140 @@ def lookup(array: Array, indices: Array, /, *, axis: int = 0) -> Array:
     - The dimension specified by `axis` must not exceed the number of dimensions in `array`.
     """
     return cast(Array, wrapper.lookup(array.arr, indices.arr, axis))
+
+
+def as_strided(array: Array, /, shape: tuple[int, ...], strides: tuple[int, ...], *, offset: int = 0) -> Array:
+    """
+    Create an array of the given shape whose elements are read from the input array at the given strides.
+
+    Element (i0, i1, ...) of the result is element `offset + i0 * strides[0] + i1 * strides[1] + ...` of the input
+    array in column-major order. Strides may be zero or make elements overlap, e.g. to repeat elements or to build
+    sliding windows.
+
+    Parameters
+    ----------
+    array : Array
+        The input array to read the elements from.
+
+    shape : tuple[int, ...]
+        The shape of the output array, at most 4 dimensions.
+
+    strides : tuple[int, ...]
+        The distance in elements of the input array between consecutive elements of the output array along each
+        dimension.
+
+    offset : int, optional, keyword-only, default: 0
+        The position in the input array of the first element of the output array.
+
+    Returns
+    -------
+    Array
+        An array of the given shape with the same data type as the input array.
+
+    Raises
+    ------
+    ValueError
+        If shape and strides differ in length or the output array would read elements outside of the input array.
+
+    Examples
+    --------
+    >>> import arrayfire as af
+    >>> a = af.Array([1, 2, 3, 4, 5])
+    >>> af.as_strided(a, (3, 2), (1, 2))
+    [[1.0000 3.0000]
+     [2.0000 4.0000]
+     [3.0000 5.0000]]
+
+    Note
+    ----
+    - ArrayFire frees the device pointer of an array created by `wrapper.create_strided_array` once the array is
+      released, so the output array can not share the buffer of the input array. Its elements are gathered on the
+      device with a single lookup instead, without a round trip through the host, and writes to either array are
+      not seen by the other.
+    """
+    if len(shape) != len(strides):
+        raise ValueError(f"Expected a stride for each dimension, got shape {shape} and strides {strides}.")
+
+    if len(shape) > 4:
+        raise ValueError("Can not create 5 or more -dimensional arrays.")
+
+    if 0 in shape:
+        return Array(dtype=array.dtype, shape=shape)
+
+    first = offset + sum((dim - 1) * stride for dim, stride in zip(shape, strides) if stride < 0)
+    last = offset + sum((dim - 1) * stride for dim, stride in zip(shape, strides) if stride > 0)
+    if first < 0 or last >= array.size:
+        raise ValueError(f"Strided shape {shape} reads elements outside of an array of {array.size} elements.")
+
+    # NOTE the positions are computed by JIT kernels and evaluated once by the lookup
+    index_dtype = int32 if array.size < 2**31 else int64
+    indices = constant(offset, shape, index_dtype)
+    for axis, (dim, stride) in enumerate(zip(shape, strides)):
+        if dim > 1 and stride != 0:
+            indices += range(shape, axis=axis, dtype=index_dtype) * stride
+
+    return moddims(lookup(flat(array), flat(indices)), shape)
+
+
+def sliding_window_view(array: Array, window: int, /, *, axis: int = 0) -> Array:
+    """
+    Create an array of all windows of the given length along an axis of the input array.
+
+    The output array has the shape of the input array, with the length n of the axis replaced by the number of
+    windows n - window + 1, and an additional last dimension of length window. Element [..., i, ..., k] of the output
+    array is element [..., i + k, ...] of the input array.
+
+    Parameters
+    ----------
+    array : Array
+        The input array with at most 3 dimensions.
+
+    window : int
+        The length of the windows.
+
+    axis : int, optional, keyword-only, default: 0
+        The axis along which the windows slide.
+
+    Returns
+    -------
+    Array
+        An array of the windows with the same data type as the input array.
+
+    Raises
+    ------
+    ValueError
+        If the input array has 4 dimensions, axis is not a dimension of the input array or window is not between 1
+        and the length of axis.
+
+    Examples
+    --------
+    >>> import arrayfire as af
+    >>> a = af.Array([1, 2, 3, 4, 5])
+    >>> windows = af.sliding_window_view(a, 3)
+    >>> windows
+    [[1.0000 2.0000 3.0000]
+     [2.0000 3.0000 4.0000]
+     [3.0000 4.0000 5.0000]]
+
+    >>> af.sum(windows, axis=1)  # Rolling sum
+    [ 6.0000  9.0000 12.0000]
+
+    Note
+    ----
+    - The windows are gathered by `af.as_strided`, see its notes. Unlike `af.unwrap` the windows may slide along any
+      axis and no padding is added.
+    """
+    if array.ndim > 3:
+        raise ValueError("Can not create windows of a 4-dimensional array, the windows add a dimension.")
+
+    if not 0 <= axis < array.ndim:
+        raise ValueError(f"Axis {axis} is out of bounds for an array of {array.ndim} dimensions.")
+
+    if not 1 <= window <= array.shape[axis]:
+        raise ValueError(f"Window length {window} is not between 1 and the length {array.shape[axis]} of axis {axis}.")
+
+    strides = _column_major_strides(array.shape)
+    shape = list(array.shape)
+    shape[axis] -= window - 1
+
+    return as_strided(array, (*shape, window), (*strides, strides[axis]))
@@ -0,0 +1,743 @@
+__all__ = [
+    "LiveArray",
+    "MemorySnapshot",
+    "MemoryTracker",
+    "ProfileEvent",
+    "Profiler",
+    "SyncEvent",
+    "SyncTracker",
+    "profile",
+    "track_memory",
+    "track_syncs",
+]
+
+import ctypes
+import importlib
+import json
+import os
+import pkgutil
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, NamedTuple
+
+import arrayfire_wrapper.lib as wrapper
+from arrayfire_wrapper.defines import AFArray
+
+from arrayfire import Array, array_object
+from arrayfire.array_object import _ArrayMetadata, _observers
+
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class SyncEvent(NamedTuple):
+    """
+    A call that blocked the host until the device finished computing its inputs.
+
+    Attributes
+    ----------
+    name : str
+        Name of the C function that synchronized, e.g. "count_all" or "get_scalar".
+    duration : float
+        Wall time of the call in seconds, including the time spent waiting for the device.
+    stack : traceback.StackSummary
+        Stack of the call, innermost frame last.
+    """
+
+    name: str
+    duration: float
+    stack: traceback.StackSummary
+
+    @property
+    def call_site(self) -> traceback.FrameSummary:
+        """
+        Innermost frame outside of the arrayfire package, i.e. the user code that caused the synchronization.
+        """
+        return _user_frame(self.stack)
+
+
+class SyncTracker:
+    """
+    Collects the host synchronizations made while `track_syncs` is active.
+
+    Attributes
+    ----------
+    events : list[SyncEvent]
+        Synchronizations in the order they happened.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[SyncEvent] = []
+
+    def record(self, name: str, duration: float, stack: traceback.StackSummary) -> None:
+        self.events.append(SyncEvent(name, duration, stack))
+
+    @property
+    def count(self) -> int:
+        """
+        Number of recorded synchronizations.
+        """
+        return len(self.events)
+
+    @property
+    def total_time(self) -> float:
+        """
+        Wall time spent in all recorded synchronizations, in seconds.
+        """
+        return sum(event.duration for event in self.events)
+
+    def summary(self, top: int | None = None) -> str:
+        """
+        Formats the synchronizations grouped by function and call site, sorted by the total time spent.
+
+        Parameters
+        ----------
+        top : int | None, optional
+            Maximum number of rows. Default is None (all rows).
+
+        Returns
+        -------
+        str
+            One row per call site with the number of calls and the total and mean time in milliseconds.
+        """
+        groups: dict[tuple[str, str, int | None], list[float]] = {}
+
+        for event in self.events:
+            site = event.call_site
+            groups.setdefault((event.name, site.filename, site.lineno), []).append(event.duration)
+
+        rows = sorted(groups.items(), key=lambda item: sum(item[1]), reverse=True)[:top]
+        lines = [f"{'function':<20} {'calls':>7} {'total ms':>10} {'mean ms':>10}  call site"]
+
+        for (name, filename, lineno), durations in rows:
+            total = sum(durations) * 1000
+            lines.append(
+                f"{name:<20} {len(durations):>7} {total:>10.3f} {total / len(durations):>10.3f}  {filename}:{lineno}"
+            )
+
+        return "\n".join(lines)
+
+
+@contextmanager
+def track_syncs() -> Iterator[SyncTracker]:
+    """
+    Records every call that makes the host wait for the device, with its call stack and the time spent.
+
+    Element-wise operations and most library functions return immediately and leave the work queued on the device.
+    Functions that return Python values, such as `Array.scalar`, reductions with `axis=None`, boolean mask indexing
+    or copies to the host, have to wait for the queued work first and stall the pipeline.
+
+    Yields
+    ------
+    SyncTracker
+        Tracker that collects the synchronizations of the context.
+
+    Note
+    ----
+    - Trackers can be nested, every active tracker records the synchronizations.
+    - Only the synchronizations of the thread that starts the tracker are recorded.
+    - Synchronizations are only timed and their stacks extracted while a tracker is active.
+
+    Examples
+    --------
+    >>> import arrayfire as af
+    >>> a = af.randu((100,))
+    >>> with af.debug.track_syncs() as syncs:
+    ...     total = af.sum(a)
+    ...     first = a.scalar()
+    >>> syncs.count
+    2
+    >>> print(syncs.summary())  # doctest: +SKIP
+    """
+    tracker = SyncTracker()
+    _observers.sync_trackers.append(tracker)
+
+    try:
+        yield tracker
+    finally:
+        _observers.sync_trackers.remove(tracker)
+
+
+class ProfileEvent(NamedTuple):
+    """
+    A call into the C library made while `profile` is active.
+
+    Attributes
+    ----------
+    name : str
+        Name of the wrapper function, e.g. "add" or "matmul".
+    start : float
+        Start of the call in seconds since the profiler was started.
+    duration : float
+        Wall time of the call in seconds. With sync=True it includes the time until the device finished all queued
+        work.
+    shapes : tuple[tuple[int, ...], ...]
+        Shapes of the array arguments.
+    dtypes : tuple[str, ...]
+        Names of the dtypes of the array arguments.
+    allocated_bytes : int
+        Change of the allocated bytes counter of the ArrayFire memory manager over the call. This is not the memory
+        the call itself allocated: buffers reused from the cache of the memory manager do not count, and memory
+        allocated or freed by other threads during the call does.
+    thread_id : int
+        Identifier of the thread that made the call.
+    """
+
+    name: str
+    start: float
+    duration: float
+    shapes: tuple[tuple[int, ...], ...]
+    dtypes: tuple[str, ...]
+    allocated_bytes: int
+    thread_id: int
+
+
+class Profiler:
+    """
+    Collects the calls into the C library made by one thread while `profile` is active.
+
+    Attributes
+    ----------
+    events : list[ProfileEvent]
+        Calls in the order they finished.
+    sync : bool
+        Whether the device is synchronized after every call.
+    thread_id : int
+        Identifier of the thread whose calls are collected.
+    """
+
+    def __init__(self, sync: bool = False) -> None:
+        self.events: list[ProfileEvent] = []
+        self.sync = sync
+        self.origin = time.perf_counter()
+        self.thread_id = threading.get_ident()
+
+    def record(self, event: ProfileEvent) -> None:
+        self.events.append(event._replace(start=event.start - self.origin))
+
+    def table(self, top: int | None = 10) -> str:
+        """
+        Formats the calls grouped by function, sorted by the total time spent.
+
+        Parameters
+        ----------
+        top : int | None, optional
+            Maximum number of rows. Default is 10, None formats all functions.
+
+        Returns
+        -------
+        str
+            One row per function with the number of calls, the total and mean time in milliseconds and the sum of
+            the `ProfileEvent.allocated_bytes` of its calls.
+        """
+        groups: dict[str, list[ProfileEvent]] = {}
+
+        for event in self.events:
+            groups.setdefault(event.name, []).append(event)
+
+        rows = sorted(groups.items(), key=lambda item: sum(event.duration for event in item[1]), reverse=True)[:top]
+        lines = [f"{'function':<24} {'calls':>7} {'total ms':>10} {'mean ms':>10} {'alloc delta':>12}"]
+
+        for name, events in rows:
+            total = sum(event.duration for event in events) * 1000
+            allocated = sum(event.allocated_bytes for event in events)
+            lines.append(f"{name:<24} {len(events):>7} {total:>10.3f} {total / len(events):>10.3f} {allocated:>12}")
+
+        return "\n".join(lines)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Converts the calls to the Chrome trace event format, viewable in chrome://tracing or Perfetto.
+
+        Returns
+        -------
+        dict[str, Any]
+            Trace with one complete event per call, timestamps and durations in microseconds.
+        """
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": event.name,
+                "cat": "arrayfire",
+                "ph": "X",
+                "ts": event.start * 1e6,
+                "dur": event.duration * 1e6,
+                "pid": pid,
+                "tid": event.thread_id,
+                "args": {
+                    "shapes": [list(shape) for shape in event.shapes],
+                    "dtypes": list(event.dtypes),
+                    "allocated_bytes": event.allocated_bytes,
+                },
+            }
+            for event in self.events
+        ]
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | os.PathLike) -> None:
+        """
+        Writes the calls to a JSON file in the Chrome trace event format.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Path of the file to write.
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+
+@contextmanager
+def profile(*, sync: bool = False) -> Iterator[Profiler]:
+    """
+    Records every call into the C library made by `Array` and the functions of arrayfire on the current thread, with
+    the shapes and dtypes of the array arguments, the time spent and the change of the allocated device memory.
+
+    Parameters
+    ----------
+    sync : bool, optional
+        Synchronize the device after every call, so the duration includes the device time of the work the call
+        enqueued. Default is False, which measures the time until the call returned to Python.
+
+    Yields
+    ------
+    Profiler
+        Profiler that collects the calls of the context.
+
+    Note
+    ----
+    - Element-wise operations only add nodes to a JIT tree, their device time shows up in the call that evaluates
+      the tree, e.g. `eval` or a reduction.
+    - While a profiler is active every call also queries the argument metadata and the memory manager, so absolute
+      times are higher than without profiling.
+    - Profiles are scoped to the thread that starts them, nested profiles on one thread all record the same calls.
+      The wrapper module is swapped in every arrayfire module while any profile is active, so calls from other
+      threads pay a small check but are not recorded.
+    - The device is shared by all threads: durations with sync=True and `ProfileEvent.allocated_bytes` include
+      work and allocations of other threads that overlap the call.
+
+    Examples
+    --------
+    >>> import arrayfire as af
+    >>> a = af.randu((1000, 1000))
+    >>> with af.debug.profile(sync=True) as profiler:
+    ...     b = af.matmul(a, a)
+    ...     af.eval(b + 1)
+    >>> print(profiler.table())  # doctest: +SKIP
+    >>> profiler.export_chrome_trace("trace.json")  # doctest: +SKIP
+    """
+    global _num_active_profilers
+
+    profiler = Profiler(sync)
+
+    with _patch_lock:
+        if not _num_active_profilers:
+            _import_library_modules()
+            _patch_modules(profiled=True)
+
+        _num_active_profilers += 1
+
+    _state.profilers.append(profiler)
+
+    try:
+        yield profiler
+    finally:
+        _state.profilers.remove(profiler)
+
+        with _patch_lock:
+            _num_active_profilers -= 1
+
+            if not _num_active_profilers:
+                _patch_modules(profiled=False)
+
+
+class _ProfiledLibrary:
+    """
+    Stands in for the wrapper module, or the batch functions of arrayfire, while a profiler is active.
+    """
+
+    def __init__(self, library: Any) -> None:
+        self._library = library
+        self._functions: dict[str, Callable[..., Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._library, name)
+
+        if not callable(attribute) or isinstance(attribute, type):
+            return attribute
+
+        if name not in self._functions:
+            self._functions[name] = _profiled(attribute, name)
+
+        return self._functions[name]
+
+
+def _profiled(function: Callable[..., Any], name: str) -> Callable[..., Any]:
+    @wraps(function)
+    def profiled_function(*args: Any, **kwargs: Any) -> Any:
+        profilers = _state.profilers
+        if not profilers or _state.busy:
+            return function(*args, **kwargs)
+
+        _state.busy = True
+        try:
+            arrays = [_ArrayMetadata.from_afarray(arg) for arg in args if isinstance(arg, AFArray) and arg.value]
+            allocated = _allocated_bytes()
+            start = time.perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                if any(profiler.sync for profiler in profilers):
+                    wrapper.sync(wrapper.get_device())
+
+                event = ProfileEvent(
+                    name,
+                    start,
+                    time.perf_counter() - start,
+                    tuple(array.shape for array in arrays),
+                    tuple(array.dtype.name for array in arrays),
+                    _allocated_bytes() - allocated,
+                    threading.get_ident(),
+                )
+
+                for profiler in profilers:
+                    profiler.record(event)
+        finally:
+            _state.busy = False
+
+    return profiled_function
+
+
+def _allocated_bytes() -> int:
+    return int(wrapper.device_mem_info()["alloc"]["bytes"])
+
+
+def _import_library_modules() -> None:
+    # NOTE arrayfire imports its library modules on first use, a module imported while profiling would otherwise
+    # keep calling the C library directly
+    package = importlib.import_module("arrayfire.library")
+    for module in pkgutil.iter_modules(package.__path__):
+        importlib.import_module(f"{package.__name__}.{module.name}")
+
+
+def _patch_modules(profiled: bool) -> None:
+    # NOTE the modules call the C library through their global "wrapper", so swapping it profiles every call site
+    library = _profiled_library if profiled else wrapper
+    array_object._batch_library = _profiled_batch_library if profiled else _batch_library
+
+    for name, module in list(sys.modules.items()):
+        if name != __name__ and (name == "arrayfire.array_object" or name.startswith("arrayfire.library.")):
+            if any(getattr(module, "wrapper", None) is candidate for candidate in (wrapper, _profiled_library)):
+                setattr(module, "wrapper", library)
+
+
+class _ProfilerState(threading.local):
+    """
+    Active profilers of the current thread.
+    """
+
+    busy = False
+
+    def __init__(self) -> None:
+        self.profilers: list[Profiler] = []
+
+
+# NOTE number of active profilers of all threads, the wrapper module stays swapped while it is nonzero
+_num_active_profilers = 0
+_patch_lock = threading.Lock()
+_profiled_library = _ProfiledLibrary(wrapper)
+_batch_library = array_object._batch_library
+_profiled_batch_library = _ProfiledLibrary(_batch_library)
+_state = _ProfilerState()
+
+
+class LiveArray(NamedTuple):
+    """
+    An array alive at the time of the report of a `MemoryTracker`.
+
+    Attributes
+    ----------
+    nbytes : int
+        Size of the array data in bytes. Arrays that share a buffer, e.g. indexed views, report their own size.
+        Updated when an in-place operation swaps the buffer of the array, unlike the other attributes.
+    shape : tuple[int, ...]
+        Shape of the array.
+    dtype : str
+        Name of the dtype of the array.
+    scope : str | None
+        Innermost `MemoryTracker.scope` active when the array was created, None outside of any scope.
+    stack : traceback.StackSummary
+        Stack of the code that created the array, innermost frame last.
+    sequence : int
+        Creation order of the tracked arrays, compared with `MemorySnapshot.sequence`.
+    """
+
+    nbytes: int
+    shape: tuple[int, ...]
+    dtype: str
+    scope: str | None
+    stack: traceback.StackSummary
+    sequence: int
+
+    @property
+    def call_site(self) -> traceback.FrameSummary:
+        """
+        Innermost frame outside of the arrayfire package, i.e. the user code that created the array.
+        """
+        return _user_frame(self.stack)
+
+
+class MemorySnapshot(NamedTuple):
+    """
+    Device memory usage at one point in time, see `MemoryTracker.snapshot`.
+
+    Attributes
+    ----------
+    label : str | None
+        Label given to the snapshot.
+    alloc_bytes : int
+        Bytes allocated by the ArrayFire memory manager, including freed buffers kept for reuse.
+    alloc_buffers : int
+        Number of buffers allocated by the ArrayFire memory manager.
+    lock_bytes : int
+        Bytes of the buffers in use.
+    lock_buffers : int
+        Number of buffers in use.
+    live_arrays : int
+        Number of tracked arrays alive.
+    live_bytes : int
+        Total size of the tracked arrays alive.
+    sequence : int
+        Number of arrays tracked before the snapshot.
+    """
+
+    label: str | None
+    alloc_bytes: int
+    alloc_buffers: int
+    lock_bytes: int
+    lock_buffers: int
+    live_arrays: int
+    live_bytes: int
+    sequence: int
+
+
+class MemoryTracker:
+    """
+    Keeps a weak registry of the arrays created while `track_memory` is active.
+
+    Attributes
+    ----------
+    snapshots : list[MemorySnapshot]
+        Snapshots in the order they were taken.
+    """
+
+    def __init__(self, stack_limit: int | None = None) -> None:
+        self.snapshots: list[MemorySnapshot] = []
+        self._stack_limit = stack_limit
+        self._scopes: list[str] = []
+        self._sequence = 0
+        self._arrays: dict[int, tuple[weakref.ref[Array], LiveArray]] = {}
+
+    def track(self, array: Array, created: bool) -> None:
+        metadata = array._get_metadata()
+        key = id(array)
+        nbytes = metadata.size * ctypes.sizeof(metadata.dtype.c_type)
+
+        # NOTE an in-place operation swaps the handle of a tracked array, which keeps the site it was created at
+        entry = None if created else self._arrays.get(key)
+        if entry is not None and entry[0]() is array:
+            self._arrays[key] = (
+                entry[0],
+                entry[1]._replace(nbytes=nbytes, shape=metadata.shape, dtype=metadata.dtype.name),
+            )
+            return
+
+        # NOTE drops the frames of track and Array._set_arr
+        stack = traceback.StackSummary.from_list(traceback.extract_stack(limit=self._stack_limit)[:-2])
+        record = LiveArray(
+            nbytes,
+            metadata.shape,
+            metadata.dtype.name,
+            self._scopes[-1] if self._scopes else None,
+            stack,
+            self._sequence,
+        )
+        self._sequence += 1
+
+        arrays = self._arrays
+        self._arrays[key] = (weakref.ref(array, lambda _: arrays.pop(key, None)), record)
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[None]:
+        """
+        Labels the arrays created inside the context with name.
+
+        Parameters
+        ----------
+        name : str
+            Name reported as the scope of the arrays, e.g. the name of a request handler.
+        """
+        self._scopes.append(name)
+
+        try:
+            yield
+        finally:
+            self._scopes.pop()
+
+    def live_arrays(self, top: int | None = None, *, since: MemorySnapshot | None = None) -> list[LiveArray]:
+        """
+        Returns the tracked arrays that are still alive, largest first.
+
+        Parameters
+        ----------
+        top : int | None, optional
+            Maximum number of arrays. Default is None (all arrays).
+        since : MemorySnapshot | None, optional
+            Only return arrays created after this snapshot. Default is None (all arrays).
+
+        Returns
+        -------
+        list[LiveArray]
+            Live arrays sorted by size in descending order.
+        """
+        first = 0 if since is None else since.sequence
+        arrays = [
+            record for ref, record in list(self._arrays.values()) if ref() is not None and record.sequence >= first
+        ]
+        return sorted(arrays, key=lambda record: record.nbytes, reverse=True)[:top]
+
+    def snapshot(self, label: str | None = None) -> MemorySnapshot:
+        """
+        Records the memory usage reported by `device_mem_info` together with the tracked live arrays.
+
+        Parameters
+        ----------
+        label : str | None, optional
+            Label of the snapshot. Default is None.
+
+        Returns
+        -------
+        MemorySnapshot
+            The snapshot, also appended to `snapshots`.
+        """
+        info = wrapper.device_mem_info()
+        arrays = self.live_arrays()
+        snapshot = MemorySnapshot(
+            label,
+            info["alloc"]["bytes"],
+            info["alloc"]["buffers"],
+            info["lock"]["bytes"],
+            info["lock"]["buffers"],
+            len(arrays),
+            sum(record.nbytes for record in arrays),
+            self._sequence,
+        )
+        self.snapshots.append(snapshot)
+        return snapshot
+
+    def report(self, top: int = 10) -> str:
+        """
+        Formats the largest live arrays and the growth between consecutive snapshots.
+
+        For every pair of consecutive snapshots the growth of the memory manager counters is listed together with the
+        call sites that created the arrays still alive from that interval.
+
+        Parameters
+        ----------
+        top : int, optional
+            Maximum number of arrays and call sites listed per section. Default is 10.
+
+        Returns
+        -------
+        str
+            Multi-line report.
+        """
+        arrays = self.live_arrays()
+        lines = [f"{len(arrays)} live arrays, {sum(record.nbytes for record in arrays)} bytes"]
+        lines.append(f"{'bytes':>12} {'dtype':<10} {'shape':<20} {'scope':<16} created at")
+
+        for record in arrays[:top]:
+            site = record.call_site
+            lines.append(
+                f"{record.nbytes:>12} {record.dtype:<10} {str(record.shape):<20} {str(record.scope):<16} "
+                f"{site.filename}:{site.lineno}"
+            )
+
+        for previous, current in zip(self.snapshots, self.snapshots[1:]):
+            lines.append("")
+            lines.append(
+                f"{previous.label} -> {current.label}: "
+                f"alloc {current.alloc_bytes - previous.alloc_bytes:+} bytes, "
+                f"lock {current.lock_bytes - previous.lock_bytes:+} bytes, "
+                f"live arrays {current.live_bytes - previous.live_bytes:+} bytes"
+            )
+
+            sites: dict[tuple[str, int | None], list[LiveArray]] = {}
+            for record in self.live_arrays(since=previous):
+                if record.sequence < current.sequence:
+                    site = record.call_site
+                    sites.setdefault((site.filename, site.lineno), []).append(record)
+
+            ranked = sorted(sites.items(), key=lambda item: sum(record.nbytes for record in item[1]), reverse=True)
+            for (filename, lineno), records in ranked[:top]:
+                lines.append(
+                    f"{sum(record.nbytes for record in records):>12} bytes in {len(records)} arrays held from "
+                    f"{filename}:{lineno}"
+                )
+
+        return "\n".join(lines)
+
+
+@contextmanager
+def track_memory(*, stack_limit: int | None = 32) -> Iterator[MemoryTracker]:
+    """
+    Tracks the arrays that get a device buffer while the context is active, with their size, creation stack and
+    scope, to find the code paths that hold on to device memory.
+
+    Parameters
+    ----------
+    stack_limit : int | None, optional
+        Maximum number of frames recorded per array. Default is 32, None records the full stack.
+
+    Yields
+    ------
+    MemoryTracker
+        Tracker with the registry of the arrays created in the context.
+
+    Note
+    ----
+    - The registry only holds weak references, tracking does not keep arrays alive.
+    - The tracker can still be queried after the context exits, arrays created afterwards are not tracked.
+    - Only the arrays of the thread that starts the tracker are tracked.
+
+    Examples
+    --------
+    >>> import arrayfire as af
+    >>> with af.debug.track_memory() as memory:
+    ...     memory.snapshot("start")
+    ...     cache = [af.randu((1000, 1000)) for _ in range(4)]
+    ...     memory.snapshot("end")
+    >>> print(memory.report(top=3))  # doctest: +SKIP
+    """
+    tracker = MemoryTracker(stack_limit)
+    _observers.array_observers.append(tracker)
+
+    try:
+        yield tracker
+    finally:
+        _observers.array_observers.remove(tracker)
+
+
+def _user_frame(stack: traceback.StackSummary) -> traceback.FrameSummary:
+    for frame in reversed(stack):
+        if not os.path.abspath(frame.filename).startswith(_PACKAGE_DIR):
+            return frame
+
+    return stack[-1]
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 __all__ = [
     "alloc_device",
     "alloc_host",
@@ -18,12 +20,22 @@ __all__ = [
     "info_string",
     "init",
     "print_mem_info",
+    "release",
+    "Scope",
+    "scope",
     "set_device",
     "sync",
     "set_kernel_cache_directory",
     "set_mem_step_size",
 ]
 
+import threading
+import weakref
+from collections.abc import Callable
+from functools import wraps
+from types import TracebackType
+from typing import Any, TypeVar, cast
+
 from arrayfire_wrapper.lib import (
     alloc_device,
     alloc_host,
@@ -50,6 +62,11 @@ from arrayfire_wrapper.lib import (
 )
 from arrayfire_wrapper.lib import sync as wrapper_sync
 
+from arrayfire import Array
+from arrayfire.array_object import _observers, _release_manager
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
 
 def sync(device_id: int | None = None) -> None:
     """
@@ -69,3 +86,153 @@ def sync(device_id: int | None = None) -> None:
         device_id = get_device()
 
     wrapper_sync(device_id)
+
+
+def release(*arrays: Array) -> None:
+    """
+    Releases the device memory held by the given arrays right away, without waiting for them to be garbage
+    collected.
+
+    Parameters
+    ----------
+    *arrays : Array
+        Arrays to release. They hold a null handle afterwards and must not be used anymore.
+
+    Note
+    ----
+    - Memory may still be cached by the memory manager for reuse. Call `device_gc` to return it to the device.
+    """
+    for array in arrays:
+        _release_manager.release(array)
+
+
+class Scope:
+    """
+    Arena that releases the arrays created while it is active, see `scope`.
+    """
+
+    def __init__(self, gc_threshold: int | None = None) -> None:
+        self.gc_threshold = gc_threshold
+        self._arrays: dict[int, weakref.ref[Array]] = {}
+
+    def track(self, array: Array, created: bool) -> None:
+        # NOTE arrays that only got a new handle, e.g. in an in-place operation, belong to the scope that created them
+        if created:
+            self._arrays[id(array)] = weakref.ref(array)
+
+    def keep(self, *arrays: Array) -> None:
+        """
+        Excludes arrays from the release on exit. Inside a nested scope they are handed to the enclosing scope.
+
+        Parameters
+        ----------
+        *arrays : Array
+            Arrays created inside the scope that have to outlive it.
+        """
+        parent = _scope_stack.scopes[-2] if len(_scope_stack.scopes) > 1 and _scope_stack.scopes[-1] is self else None
+
+        for array in arrays:
+            ref = self._arrays.pop(id(array), None)
+            if parent is not None and ref is not None:
+                parent._arrays[id(array)] = ref
+
+    def __enter__(self) -> Scope:
+        if not _scope_stack.scopes:
+            _observers.array_observers.append(_scope_stack)
+
+        _scope_stack.scopes.append(self)
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        _scope_stack.scopes.remove(self)
+
+        if not _scope_stack.scopes:
+            _observers.array_observers.remove(_scope_stack)
+
+        arrays = [array for array in (ref() for ref in self._arrays.values()) if array is not None]
+        self._arrays.clear()
+        release(*arrays)
+
+        if self.gc_threshold is not None and device_mem_info()["alloc"]["bytes"] > self.gc_threshold:
+            device_gc()
+
+    def __call__(self, function: _F) -> _F:
+        def scoped_function(*args: Any, **kwargs: Any) -> Any:
+            with Scope(self.gc_threshold) as inner:
+                result = function(*args, **kwargs)
+                inner.keep(*_arrays_in(result))
+                return result
+
+        return cast(_F, wraps(function)(scoped_function))
+
+
+def scope(*, gc_threshold: int | None = None) -> Scope:
+    """
+    Creates an arena that collects every array created while it is active and releases them together on exit.
+
+    Releasing does not depend on reference counting or garbage collection of the Python objects: the arrays hold a
+    null handle afterwards and must not be used anymore. Arrays that have to outlive the scope are excluded with
+    `Scope.keep`. Used as a decorator, a new scope is entered on every call and the arrays in the return value (an
+    array, or a tuple, list or dict of arrays) are kept.
+
+    Parameters
+    ----------
+    gc_threshold : int | None, optional
+        Number of bytes allocated by the memory manager above which `device_gc` is called on exit, after the arrays
+        are released. Default is None, which never calls `device_gc`.
+
+    Returns
+    -------
+    Scope
+        Context manager and decorator.
+
+    Note
+    ----
+    - Arrays created before the scope are never released, even if they are updated in place inside of it.
+    - Kept arrays of a nested scope are handed to the enclosing scope.
+    - Each thread has its own stack of scopes.
+
+    Examples
+    --------
+    >>> import arrayfire as af
+    >>> a = af.randu((1000, 1000))
+    >>> with af.scope() as arena:
+    ...     centered = a - af.mean(a)
+    ...     result = af.matmul(centered, centered.T)
+    ...     arena.keep(result)
+    >>> @af.scope(gc_threshold=2**30)
+    ... def handle_request(x):
+    ...     return af.sum(x * x, axis=0)
+    """
+    return Scope(gc_threshold)
+
+
+def _arrays_in(value: Any) -> list[Array]:
+    if isinstance(value, Array):
+        return [value]
+
+    if isinstance(value, tuple | list):
+        return [array for item in value for array in _arrays_in(item)]
+
+    if isinstance(value, dict):
+        return [array for item in value.values() for array in _arrays_in(item)]
+
+    return []
+
+
+class _ScopeStack(threading.local):
+    """
+    Routes new arrays to the innermost active scope of the thread that created them.
+    """
+
+    def __init__(self) -> None:
+        self.scopes: list[Scope] = []
+
+    def track(self, array: Array, created: bool) -> None:
+        if self.scopes:
+            self.scopes[-1].track(array, created)
+
+
+_scope_stack = _ScopeStack()
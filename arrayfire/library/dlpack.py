@@ -0,0 +1,347 @@
+__all__ = ["DLDeviceType", "from_dlpack"]
+
+import ctypes
+from enum import IntEnum
+from typing import Any
+
+import arrayfire_wrapper.lib as wrapper
+from arrayfire_wrapper import BackendType, get_backend
+from arrayfire_wrapper.defines import AFArray
+from arrayfire_wrapper.lib._utility import call_from_clib
+
+from arrayfire import Array
+from arrayfire.array_object import _column_major_strides
+from arrayfire.dtypes import (
+    Dtype,
+)
+from arrayfire.dtypes import bool as afbool
+from arrayfire.dtypes import (
+    complex32,
+    complex64,
+    float16,
+    float32,
+    float64,
+    int16,
+    int32,
+    int64,
+    uint8,
+    uint16,
+    uint32,
+    uint64,
+)
+
+
+class DLDeviceType(IntEnum):
+    CPU = 1
+    CUDA = 2
+    CUDA_HOST = 3
+    OPENCL = 4
+    VULKAN = 7
+    METAL = 8
+    VPI = 9
+    ROCM = 10
+    ROCM_HOST = 11
+    EXT_DEV = 12
+    CUDA_MANAGED = 13
+    ONE_API = 14
+
+
+class _DLDataTypeCode(IntEnum):
+    INT = 0
+    UINT = 1
+    FLOAT = 2
+    COMPLEX = 5
+    BOOL = 6
+
+
+class _DLDevice(ctypes.Structure):
+    _fields_ = [("device_type", ctypes.c_int32), ("device_id", ctypes.c_int32)]
+
+
+class _DLDataType(ctypes.Structure):
+    _fields_ = [("code", ctypes.c_uint8), ("bits", ctypes.c_uint8), ("lanes", ctypes.c_uint16)]
+
+
+class _DLTensor(ctypes.Structure):
+    _fields_ = [
+        ("data", ctypes.c_void_p),
+        ("device", _DLDevice),
+        ("ndim", ctypes.c_int32),
+        ("dtype", _DLDataType),
+        ("shape", ctypes.POINTER(ctypes.c_int64)),
+        ("strides", ctypes.POINTER(ctypes.c_int64)),
+        ("byte_offset", ctypes.c_uint64),
+    ]
+
+
+class _DLManagedTensor(ctypes.Structure):
+    pass
+
+
+_DLManagedTensorDeleter = ctypes.CFUNCTYPE(None, ctypes.POINTER(_DLManagedTensor))
+
+_DLManagedTensor._fields_ = [
+    ("dl_tensor", _DLTensor),
+    ("manager_ctx", ctypes.c_void_p),
+    ("deleter", _DLManagedTensorDeleter),
+]
+
+_PyCapsuleDestructor = ctypes.CFUNCTYPE(None, ctypes.c_void_p)
+
+_CAPSULE_NAME = b"dltensor"
+_USED_CAPSULE_NAME = b"used_dltensor"
+
+_pycapsule_new = ctypes.pythonapi.PyCapsule_New
+_pycapsule_new.restype = ctypes.py_object
+_pycapsule_new.argtypes = [ctypes.c_void_p, ctypes.c_char_p, _PyCapsuleDestructor]
+
+_pycapsule_is_valid = ctypes.pythonapi.PyCapsule_IsValid
+_pycapsule_is_valid.restype = ctypes.c_int
+_pycapsule_is_valid.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+
+_pycapsule_get_pointer = ctypes.pythonapi.PyCapsule_GetPointer
+_pycapsule_get_pointer.restype = ctypes.c_void_p
+_pycapsule_get_pointer.argtypes = [ctypes.py_object, ctypes.c_char_p]
+
+# NOTE the capsule destructor only receives a raw PyObject pointer
+_pycapsule_get_pointer_from_address = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p)(
+    ("PyCapsule_GetPointer", ctypes.pythonapi)
+)
+
+_pycapsule_set_name = ctypes.pythonapi.PyCapsule_SetName
+_pycapsule_set_name.restype = ctypes.c_int
+_pycapsule_set_name.argtypes = [ctypes.py_object, ctypes.c_char_p]
+
+_DTYPE_TO_DL: dict[Dtype, tuple[_DLDataTypeCode, int]] = {
+    int16: (_DLDataTypeCode.INT, 16),
+    int32: (_DLDataTypeCode.INT, 32),
+    int64: (_DLDataTypeCode.INT, 64),
+    uint8: (_DLDataTypeCode.UINT, 8),
+    uint16: (_DLDataTypeCode.UINT, 16),
+    uint32: (_DLDataTypeCode.UINT, 32),
+    uint64: (_DLDataTypeCode.UINT, 64),
+    float16: (_DLDataTypeCode.FLOAT, 16),
+    float32: (_DLDataTypeCode.FLOAT, 32),
+    float64: (_DLDataTypeCode.FLOAT, 64),
+    complex32: (_DLDataTypeCode.COMPLEX, 64),
+    complex64: (_DLDataTypeCode.COMPLEX, 128),
+    afbool: (_DLDataTypeCode.BOOL, 8),
+}
+
+_DL_TO_DTYPE = {value: key for key, value in _DTYPE_TO_DL.items()}
+
+_BACKEND_TO_DL_DEVICE = {
+    BackendType.cpu: DLDeviceType.CPU,
+    BackendType.cuda: DLDeviceType.CUDA,
+}
+
+# NOTE
+# Exported tensors are kept alive here by id of their manager context until the consumer calls the deleter.
+_exported_tensors: dict[int, tuple[_DLManagedTensor, AFArray, Any, Any]] = {}
+
+
+def dlpack_device(array: Array, /) -> tuple[DLDeviceType, int]:
+    """
+    Returns the DLPack device type and device id of the array.
+
+    Raises
+    ------
+    BufferError
+        If the current backend has no DLPack device with directly addressable memory.
+    """
+    backend_type = get_backend().backend_type
+
+    if backend_type not in _BACKEND_TO_DL_DEVICE:
+        raise BufferError(f"DLPack export is not supported on the {backend_type.name} backend.")
+
+    return _BACKEND_TO_DL_DEVICE[backend_type], wrapper.get_device()
+
+
+def to_dlpack(array: Array, /, *, stream: int | Any | None = None) -> Any:
+    """
+    Exports the array as a DLPack capsule that shares the array buffer.
+
+    Parameters
+    ----------
+    array : Array
+        Array to export.
+    stream : int | Any | None, optional
+        Stream the consumer will use. Pending ArrayFire work is synchronized before the capsule is returned, so any
+        consumer stream sees the data. Default is None.
+
+    Returns
+    -------
+    PyCapsule
+        Capsule named "dltensor" holding a DLManagedTensor. The buffer stays locked until the consumer calls the
+        deleter, or until the unused capsule is garbage collected.
+
+    Raises
+    ------
+    BufferError
+        If the array is empty or the current backend has no DLPack device with directly addressable memory.
+    """
+    device_type, device_id = dlpack_device(array)
+
+    if array.is_empty():
+        raise BufferError("Can not export an empty array with DLPack.")
+
+    if device_type == DLDeviceType.CPU and stream is not None:
+        raise BufferError("The stream argument is not supported for CPU arrays.")
+
+    shape = array.shape
+    dtype = array.dtype
+
+    # NOTE get_device_ptr detaches a shared buffer first, so it has to run before the buffer is retained
+    data = wrapper.get_device_ptr(array.arr)
+    arr = wrapper.retain_array(array.arr)
+
+    if device_type != DLDeviceType.CPU:
+        wrapper.sync(device_id)
+
+    c_shape = (ctypes.c_int64 * len(shape))(*shape)
+    c_strides = (ctypes.c_int64 * len(shape))(*_column_major_strides(shape))
+    code, bits = _DTYPE_TO_DL[dtype]
+
+    managed_tensor = _DLManagedTensor()
+    managed_tensor.dl_tensor.data = data
+    managed_tensor.dl_tensor.device = _DLDevice(device_type, device_id)
+    managed_tensor.dl_tensor.ndim = len(shape)
+    managed_tensor.dl_tensor.dtype = _DLDataType(code, bits, 1)
+    managed_tensor.dl_tensor.shape = c_shape
+    managed_tensor.dl_tensor.strides = c_strides
+    managed_tensor.dl_tensor.byte_offset = 0
+    managed_tensor.manager_ctx = id(managed_tensor)
+    managed_tensor.deleter = _managed_tensor_deleter
+
+    _exported_tensors[id(managed_tensor)] = (managed_tensor, arr, c_shape, c_strides)
+    return _pycapsule_new(ctypes.addressof(managed_tensor), _CAPSULE_NAME, _capsule_destructor)
+
+
+def from_dlpack(x: Any, /) -> Array:
+    """
+    Creates an Array from an object that supports the DLPack protocol.
+
+    Parameters
+    ----------
+    x : Any
+        Object implementing `__dlpack__`, e.g. a NumPy array, a PyTorch or CuPy tensor, or another Array.
+
+    Returns
+    -------
+    Array
+        Array with the same shape, dtype and values as `x`.
+
+    Raises
+    ------
+    BufferError
+        If the tensor lives on a device that does not match the current backend, or its dtype or layout is not
+        supported.
+
+    Note
+    ----
+    - The data is copied once on the device, without a round trip through the host. ArrayFire frees the buffers
+    of the arrays it creates, so it can not adopt memory owned by another framework.
+    - Row-major tensors are copied with reversed dimensions and reordered on the device.
+    """
+    backend_type = get_backend().backend_type
+
+    if backend_type not in _BACKEND_TO_DL_DEVICE:
+        raise BufferError(f"DLPack import is not supported on the {backend_type.name} backend.")
+
+    device_type = _BACKEND_TO_DL_DEVICE[backend_type]
+
+    if device_type == DLDeviceType.CPU:
+        capsule = x.__dlpack__()
+    else:
+        # NOTE legacy default stream, ArrayFire synchronizes with it before using the data
+        capsule = x.__dlpack__(stream=1)
+
+    managed_tensor = ctypes.cast(
+        _pycapsule_get_pointer(capsule, _CAPSULE_NAME), ctypes.POINTER(_DLManagedTensor)
+    ).contents
+    tensor = managed_tensor.dl_tensor
+
+    try:
+        if tensor.device.device_type != device_type:
+            raise BufferError(
+                f"Can not import a tensor from device type {tensor.device.device_type} on the {backend_type.name} "
+                "backend."
+            )
+
+        dl_dtype = (tensor.dtype.code, tensor.dtype.bits)
+        if tensor.dtype.lanes != 1 or dl_dtype not in _DL_TO_DTYPE:
+            raise BufferError(f"Unsupported DLPack dtype {dl_dtype} with {tensor.dtype.lanes} lanes.")
+
+        if tensor.ndim > 4:
+            raise BufferError("Can not create 5 or more -dimensional arrays.")
+
+        dtype = _DL_TO_DTYPE[dl_dtype]
+        shape = tuple(tensor.shape[i] for i in range(tensor.ndim)) or (1,)
+        address = (tensor.data or 0) + tensor.byte_offset
+        out = _copy_tensor(address, shape, tensor, dtype, device_type)
+    finally:
+        _pycapsule_set_name(capsule, _USED_CAPSULE_NAME)
+        if managed_tensor.deleter:
+            managed_tensor.deleter(ctypes.pointer(managed_tensor))
+
+    return out
+
+
+def _copy_tensor(address: int, shape: tuple[int, ...], tensor: _DLTensor, dtype: Dtype, device_type: int) -> Array:
+    if 0 in shape:
+        return Array(dtype=dtype, shape=shape)
+
+    strides = tuple(tensor.strides[i] for i in range(tensor.ndim)) if tensor.strides else None
+
+    if strides is None or _has_strides(shape, strides, _row_major_strides(shape)):
+        af_shape = shape[::-1]
+        is_row_major = len(shape) > 1
+    elif _has_strides(shape, strides, _column_major_strides(shape)):
+        af_shape = shape
+        is_row_major = False
+    else:
+        raise BufferError("Only contiguous DLPack tensors are supported.")
+
+    arr = wrapper.create_handle(af_shape, dtype)
+    num_bytes = ctypes.sizeof(dtype.c_type)
+    for dim in shape:
+        num_bytes *= dim
+
+    # NOTE write_array copies from device memory without staging through the host
+    source = wrapper.PointerSource.host if device_type == DLDeviceType.CPU else wrapper.PointerSource.device
+    call_from_clib("write_array", arr, ctypes.c_void_p(address), ctypes.c_size_t(num_bytes), source.value)
+
+    if not is_row_major:
+        return Array.from_afarray(arr)
+
+    out = wrapper.reorder(arr, *tuple(range(len(shape) - 1, -1, -1)) + tuple(range(len(shape), 4)))
+    wrapper.release_array(arr)
+    return Array.from_afarray(out)
+
+
+def _has_strides(shape: tuple[int, ...], strides: tuple[int, ...], expected: tuple[int, ...]) -> bool:
+    # NOTE the stride of a dimension of length 1 is never used, producers such as PyTorch report arbitrary values
+    return all(dim == 1 or stride == other for dim, stride, other in zip(shape, strides, expected))
+
+
+def _row_major_strides(shape: tuple[int, ...]) -> tuple[int, ...]:
+    return _column_major_strides(shape[::-1])[::-1]
+
+
+@_DLManagedTensorDeleter
+def _managed_tensor_deleter(managed_tensor_ptr: Any) -> None:
+    _, arr, _, _ = _exported_tensors.pop(managed_tensor_ptr.contents.manager_ctx)
+    wrapper.unlock_array(arr)
+    wrapper.release_array(arr)
+
+
+@_PyCapsuleDestructor
+def _capsule_destructor(capsule: int) -> None:
+    # NOTE a consumer renames the capsule once it owns the tensor and calls the deleter itself
+    if not _pycapsule_is_valid(capsule, _CAPSULE_NAME):
+        return
+
+    managed_tensor = ctypes.cast(
+        _pycapsule_get_pointer_from_address(capsule, _CAPSULE_NAME), ctypes.POINTER(_DLManagedTensor)
+    ).contents
+    managed_tensor.deleter(ctypes.pointer(managed_tensor))
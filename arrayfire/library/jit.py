@@ -0,0 +1,209 @@
+__all__ = ["jit"]
+
+from functools import wraps
+from typing import Any, Callable, TypeVar, cast
+
+import arrayfire_wrapper.lib as wrapper
+from arrayfire_wrapper.defines import AFArray
+
+from arrayfire import Array
+from arrayfire.array_object import (
+    _active_graph,
+    _ArrayMetadata,
+    _call_broadcasting,
+    _internal_array,
+    _LazyArray,
+    _LazyGraph,
+    _limit_jit_depth,
+    _Operand,
+)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def jit(function: _F) -> _F:
+    """
+    Traces an element-wise function of arrays and scalars on its first call and replays the recorded operations on
+    later calls with the same signature.
+
+    The signature of a call is the dtype and shape of every array argument and the type and value of every scalar
+    argument. A replay calls the C functions of the recorded operations directly: the Python operators, type checks
+    and scalar constant creation of the traced function are skipped.
+
+    Parameters
+    ----------
+    function : Callable
+        Function taking arrays and Python scalars as positional arguments and returning an array or a tuple or list
+        of arrays.
+
+    Returns
+    -------
+    Callable
+        Function with the same arguments and results as function.
+
+    Note
+    ----
+    - Only arithmetic, comparison, logical and bitwise operators and dtype preserving element-wise functions, such
+      as `af.exp` or `af.sqrt`, can be traced. A function that uses other operations, reads data of its arguments,
+      captures arrays from an enclosing scope or is called with keyword arguments is called as is instead.
+    - Scalar arguments are part of the signature, so pass values that change on every call as arrays.
+
+    Examples
+    --------
+    >>> import arrayfire as af
+    >>> @af.jit
+    ... def in_circle(x, y):
+    ...     return (x * x + y * y) < 1
+    >>> x = af.randu((1000,))
+    >>> y = af.randu((1000,))
+    >>> inside = in_circle(x, y)  # traced
+    >>> inside = in_circle(y, x)  # replayed
+    """
+    cache: dict[tuple[Any, ...], _TracedFunction | None] = {}
+
+    @wraps(function)
+    def traced_function(*args: Any, **kwargs: Any) -> Any:
+        signature = _signature(args)
+
+        # NOTE inside af.lazy() the operations are recorded into the active graph instead
+        if kwargs or signature is None or _active_graph.graph is not None:
+            return function(*args, **kwargs)
+
+        if signature in cache:
+            traced = cache[signature]
+            return function(*args) if traced is None else traced.replay(args)
+
+        traced, result = _trace(function, args)
+        cache[signature] = traced
+        return result if traced is None else traced.replay(args)
+
+    return cast(_F, traced_function)
+
+
+class _TracedFunction:
+    """
+    Operations of a traced call, compiled to a flat list of steps over registers.
+
+    The first registers hold the handles of the array arguments, followed by the handles of the scalar constants and
+    one register per step.
+    """
+
+    def __init__(self, graph: _LazyGraph, outputs: list[_LazyArray], container: type | None) -> None:
+        nodes = graph.dependencies([cast(int, output._node) for output in outputs])
+        registers: dict[int, int] = {}
+        constants: dict[_Operand, int] = {}
+        depths: dict[int, int] = {}
+
+        for index in nodes:
+            c_function, *operands = graph.nodes[index]
+            if c_function is None:
+                registers[index] = operands[0][1]
+                depths[index] = 0
+
+            for operand in operands:
+                if operand[0] == "scalar" and operand not in constants:
+                    constants[operand] = len(graph.inputs) + len(constants)
+
+        self.constants = [
+            _internal_array(wrapper.create_constant_array(operand[1], (1,), operand[3])) for operand in constants
+        ]
+        self.steps: list[tuple[Any, bool, list[int]]] = []
+
+        for index in nodes:
+            c_function, *operands = graph.nodes[index]
+            if c_function is None:
+                continue
+
+            slots = [constants[operand] if operand[0] == "scalar" else registers[operand[1]] for operand in operands]
+            registers[index] = len(graph.inputs) + len(constants) + len(self.steps)
+            depths[index] = max((depths[operand[1]] for operand in operands if operand[0] == "node"), default=0) + 1
+            self.steps.append((c_function, any(operand[0] == "scalar" for operand in operands), slots))
+
+        self.outputs = [registers[cast(int, output._node)] for output in outputs]
+        self.metadata: list[_ArrayMetadata] = [output._get_metadata() for output in outputs]
+        # NOTE JIT depths of the results relative to the deepest argument
+        self.depths = [depths[cast(int, output._node)] for output in outputs]
+        self.container = container
+
+    def replay(self, args: tuple[Any, ...]) -> Any:
+        arrays = [arg for arg in args if isinstance(arg, Array)]
+        registers = [array.arr for array in arrays]
+        registers.extend(constant.arr for constant in self.constants)
+        first_temporary = len(registers)
+
+        try:
+            for c_function, broadcast, slots in self.steps:
+                operands = [registers[slot] for slot in slots]
+                registers.append(_call_broadcasting(c_function, *operands) if broadcast else c_function(*operands))
+        except Exception:
+            _release(registers[first_temporary:])
+            raise
+
+        temporaries = set(range(first_temporary, len(registers)))
+        results = []
+
+        base_depth = max((array._depth for array in arrays), default=0)
+
+        for slot, metadata, depth in zip(self.outputs, self.metadata, self.depths):
+            if slot in temporaries:
+                # NOTE the result takes over the handle of the step
+                temporaries.discard(slot)
+                out = Array.from_afarray(registers[slot])
+            else:
+                out = Array.from_afarray(wrapper.retain_array(registers[slot]))
+
+            out._metadata = metadata
+            results.append(_limit_jit_depth(out, base_depth + depth))
+
+        _release([registers[slot] for slot in temporaries])
+        return results[0] if self.container is None else self.container(results)
+
+
+def _signature(args: tuple[Any, ...]) -> tuple[Any, ...] | None:
+    signature: list[tuple[Any, ...]] = []
+
+    for arg in args:
+        if isinstance(arg, Array):
+            signature.append((arg.dtype, arg.shape))
+        elif isinstance(arg, int | float):
+            signature.append((type(arg), arg))
+        else:
+            return None
+
+    return tuple(signature)
+
+
+def _trace(function: Callable[..., Any], args: tuple[Any, ...]) -> tuple[_TracedFunction | None, Any]:
+    graph = _LazyGraph()
+    parameters = [graph.add_parameter(arg) if isinstance(arg, Array) else arg for arg in args]
+    num_parameters = len(graph.inputs)
+
+    previous_graph = _active_graph.graph
+    _active_graph.graph = graph
+
+    try:
+        result = function(*parameters)
+    finally:
+        _active_graph.graph = previous_graph
+
+    container = (tuple if isinstance(result, tuple) else list) if isinstance(result, tuple | list) else None
+    outputs = list(result) if container is not None else [result]
+
+    # NOTE the trace is only valid if nothing was evaluated while tracing and all results only depend on the
+    # parameters, otherwise the pending results of the trace are returned and computed on access
+    if (
+        graph.materializations
+        or len(graph.inputs) != num_parameters
+        or not all(
+            isinstance(output, _LazyArray) and output._graph is graph and output._node is not None
+            for output in outputs
+        )
+    ):
+        return None, result
+
+    return _TracedFunction(graph, outputs, container), result
+
+
+def _release(arrs: list[AFArray]) -> None:
+    for arr in arrs:
+        wrapper.release_array(arr)
@@ -21,7 +21,7 @@ import arrayfire_wrapper.lib as wrapper
 from arrayfire_wrapper.lib import is_lapack_available
 
 from arrayfire import Array
-from arrayfire.array_object import afarray_as_array
+from arrayfire.array_object import _host_sync, afarray_as_array
 from arrayfire.library.constants import MatProp, Norm
 
 # TODO
@@ -78,7 +78,7 @@ def dot(
     rhs_opts: MatProp = MatProp.NONE
 
     if return_scalar:
-        return wrapper.dot_all(lhs.arr, rhs.arr, lhs_opts, rhs_opts)
+        return _host_sync(wrapper.dot_all, lhs.arr, rhs.arr, lhs_opts, rhs_opts)
 
     return Array.from_afarray(wrapper.dot(lhs.arr, rhs.arr, lhs_opts, rhs_opts))
 
@@ -253,7 +253,7 @@ def svd(array: Array, /, *, inplace: bool = False) -> tuple[Array, ...]:
 
 
 def det(array: Array, /) -> int | float | complex:
-    return wrapper.det(array.arr)
+    return _host_sync(wrapper.det, array.arr)
 
 
 @afarray_as_array
@@ -262,7 +262,7 @@ def inverse(array: Array, /, *, options: MatProp = MatProp.NONE) -> Array:
 
 
 def norm(array: Array, /, *, norm_type: Norm = Norm.EUCLID, p: float = 1.0, q: float = 1.0) -> float:
-    return wrapper.norm(array.arr, norm_type, p, q)
+    return _host_sync(wrapper.norm, array.arr, norm_type, p, q)
 
 
 @afarray_as_array
@@ -271,7 +271,7 @@ def pinverse(array: Array, /, *, tol: float = 1e-6, options: MatProp = MatProp.N
 
 
 def rank(array: Array, /, *, tol: float = 1e-5) -> int:
-    return wrapper.rank(array.arr, tol)
+    return _host_sync(wrapper.rank, array.arr, tol)
 
 
 @afarray_as_array
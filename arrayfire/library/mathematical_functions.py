@@ -73,7 +73,7 @@ from typing import cast
 
 import arrayfire_wrapper.lib as wrapper
 
-from arrayfire.array_object import Array, afarray_as_array, process_c_function
+from arrayfire.array_object import Array, afarray_as_array, process_c_function, process_unary_c_function
 
 
 def add(x1: Array | int | float, x2: Array | int | float, /) -> Array:
@@ -187,9 +187,8 @@ def rem(x1: int | float | Array, x2: int | float | Array, /) -> Array:
     return process_c_function(x1, x2, wrapper.rem)
 
 
-@afarray_as_array
 def abs(x: Array, /) -> Array:
-    return cast(Array, wrapper.abs_(x.arr))
+    return process_unary_c_function(x, wrapper.abs_)
 
 
 @afarray_as_array
@@ -197,76 +196,63 @@ def arg(x: Array, /) -> Array:
     return cast(Array, wrapper.arg(x.arr))
 
 
-@afarray_as_array
 def sign(x: Array, /) -> Array:
-    return cast(Array, wrapper.sign(x.arr))
+    return process_unary_c_function(x, wrapper.sign)
 
 
-@afarray_as_array
 def round(x: Array, /) -> Array:
-    return cast(Array, wrapper.round_(x.arr))
+    return process_unary_c_function(x, wrapper.round_)
 
 
-@afarray_as_array
 def trunc(x: Array, /) -> Array:
-    return cast(Array, wrapper.trunc(x.arr))
+    return process_unary_c_function(x, wrapper.trunc)
 
 
-@afarray_as_array
 def floor(x: Array, /) -> Array:
-    return cast(Array, wrapper.floor(x.arr))
+    return process_unary_c_function(x, wrapper.floor)
 
 
-@afarray_as_array
 def ceil(x: Array, /) -> Array:
-    return cast(Array, wrapper.ceil(x.arr))
+    return process_unary_c_function(x, wrapper.ceil)
 
 
-@afarray_as_array
 def hypot(x1: int | float | Array, x2: int | float | Array, /) -> Array:
     return process_c_function(x1, x2, wrapper.hypot)
 
 
-@afarray_as_array
 def sin(x: Array, /) -> Array:
-    return cast(Array, wrapper.sin(x.arr))
+    return process_unary_c_function(x, wrapper.sin)
 
 
-@afarray_as_array
 def cos(x: Array, /) -> Array:
-    return cast(Array, wrapper.cos(x.arr))
+    return process_unary_c_function(x, wrapper.cos)
 
 
-@afarray_as_array
 def tan(x: Array, /) -> Array:
-    return cast(Array, wrapper.tan(x.arr))
+    return process_unary_c_function(x, wrapper.tan)
 
 
-@afarray_as_array
 def asin(x: Array, /) -> Array:
-    return cast(Array, wrapper.asin(x.arr))
+    return process_unary_c_function(x, wrapper.asin)
 
 
-@afarray_as_array
 def acos(x: Array, /) -> Array:
-    return cast(Array, wrapper.acos(x.arr))
+    return process_unary_c_function(x, wrapper.acos)
 
 
-@afarray_as_array
 def atan(x: Array, /) -> Array:
-    return cast(Array, wrapper.atan(x.arr))
+    return process_unary_c_function(x, wrapper.atan)
 
 
 def atan2(x1: int | float | Array, x2: int | float | Array, /) -> Array:
     return process_c_function(x1, x2, wrapper.atan2)
 
 
-@afarray_as_array
 def cplx(x1: int | float | Array, /, x2: int | float | Array | None = None) -> Array:
     if x2 is None:
         if not isinstance(x1, Array):
             raise TypeError("x1 can not be int or tuple when x2 is None.")
-        return cast(Array, wrapper.cplx(x1.arr))
+        return Array.from_afarray(wrapper.cplx(x1.arr))
     else:
         return process_c_function(x1, x2, wrapper.cplx2)
 
@@ -286,133 +272,108 @@ def conjg(x: Array, /) -> Array:
     return cast(Array, wrapper.conjg(x.arr))
 
 
-@afarray_as_array
 def sinh(x: Array, /) -> Array:
-    return cast(Array, wrapper.sinh(x.arr))
+    return process_unary_c_function(x, wrapper.sinh)
 
 
-@afarray_as_array
 def cosh(x: Array, /) -> Array:
-    return cast(Array, wrapper.cosh(x.arr))
+    return process_unary_c_function(x, wrapper.cosh)
 
 
-@afarray_as_array
 def tanh(x: Array, /) -> Array:
-    return cast(Array, wrapper.tanh(x.arr))
+    return process_unary_c_function(x, wrapper.tanh)
 
 
-@afarray_as_array
 def asinh(x: Array, /) -> Array:
-    return cast(Array, wrapper.asinh(x.arr))
+    return process_unary_c_function(x, wrapper.asinh)
 
 
-@afarray_as_array
 def acosh(x: Array, /) -> Array:
-    return cast(Array, wrapper.acosh(x.arr))
+    return process_unary_c_function(x, wrapper.acosh)
 
 
-@afarray_as_array
 def atanh(x: Array, /) -> Array:
-    return cast(Array, wrapper.atanh(x.arr))
+    return process_unary_c_function(x, wrapper.atanh)
 
 
 def root(x1: int | float | Array, x2: int | float | Array, /) -> Array:
     return process_c_function(x1, x2, wrapper.root)
 
 
-@afarray_as_array
 def pow2(x: Array, /) -> Array:
-    return cast(Array, wrapper.pow2(x.arr))
+    return process_unary_c_function(x, wrapper.pow2)
 
 
-@afarray_as_array
 def sigmoid(x: Array, /) -> Array:
-    return cast(Array, wrapper.sigmoid(x.arr))
+    return process_unary_c_function(x, wrapper.sigmoid)
 
 
-@afarray_as_array
 def exp(x: Array, /) -> Array:
-    return cast(Array, wrapper.exp(x.arr))
+    return process_unary_c_function(x, wrapper.exp)
 
 
-@afarray_as_array
 def expm1(x: Array, /) -> Array:
-    return cast(Array, wrapper.expm1(x.arr))
+    return process_unary_c_function(x, wrapper.expm1)
 
 
-@afarray_as_array
 def erf(x: Array, /) -> Array:
-    return cast(Array, wrapper.erf(x.arr))
+    return process_unary_c_function(x, wrapper.erf)
 
 
-@afarray_as_array
 def erfc(x: Array, /) -> Array:
-    return cast(Array, wrapper.erfc(x.arr))
+    return process_unary_c_function(x, wrapper.erfc)
 
 
-@afarray_as_array
 def log(x: Array, /) -> Array:
-    return cast(Array, wrapper.log(x.arr))
+    return process_unary_c_function(x, wrapper.log)
 
 
-@afarray_as_array
 def log1p(x: Array, /) -> Array:
-    return cast(Array, wrapper.log1p(x.arr))
+    return process_unary_c_function(x, wrapper.log1p)
 
 
-@afarray_as_array
 def log10(x: Array, /) -> Array:
-    return cast(Array, wrapper.log10(x.arr))
+    return process_unary_c_function(x, wrapper.log10)
 
 
-@afarray_as_array
 def log2(x: Array, /) -> Array:
-    return cast(Array, wrapper.log2(x.arr))
+    return process_unary_c_function(x, wrapper.log2)
 
 
-@afarray_as_array
 def sqrt(x: Array, /) -> Array:
-    return cast(Array, wrapper.sqrt(x.arr))
+    return process_unary_c_function(x, wrapper.sqrt)
 
 
-@afarray_as_array
 def rsqrt(x: Array, /) -> Array:
-    return cast(Array, wrapper.rsqrt(x.arr))
+    return process_unary_c_function(x, wrapper.rsqrt)
 
 
-@afarray_as_array
 def cbrt(x: Array, /) -> Array:
-    return cast(Array, wrapper.cbrt(x.arr))
+    return process_unary_c_function(x, wrapper.cbrt)
 
 
-@afarray_as_array
 def factorial(x: Array, /) -> Array:
-    return cast(Array, wrapper.factorial(x.arr))
+    return process_unary_c_function(x, wrapper.factorial)
 
 
-@afarray_as_array
 def tgamma(x: Array, /) -> Array:
-    return cast(Array, wrapper.tgamma(x.arr))
+    return process_unary_c_function(x, wrapper.tgamma)
 
 
-@afarray_as_array
 def lgamma(x: Array, /) -> Array:
-    return cast(Array, wrapper.lgamma(x.arr))
+    return process_unary_c_function(x, wrapper.lgamma)
 
 
-@afarray_as_array
 def iszero(x: Array, /) -> Array:
-    return cast(Array, wrapper.iszero(x.arr))
+    return process_unary_c_function(x, wrapper.iszero)
 
 
-@afarray_as_array
 def isinf(x: Array, /) -> Array:
-    return cast(Array, wrapper.isinf(x.arr))
+    return process_unary_c_function(x, wrapper.isinf)
 
 
-@afarray_as_array
 def isnan(x: Array, /) -> Array:
-    return cast(Array, wrapper.isnan(x.arr))
+    return process_unary_c_function(x, wrapper.isnan)
 
 
 def logical_and(x1: Array | int | float, x2: Array | int | float, /) -> Array:
@@ -423,11 +384,9 @@ def logical_or(x1: Array | int | float, x2: Array | int | float, /) -> Array:
     return process_c_function(x1, x2, wrapper.or_)
 
 
-@afarray_as_array
 def logical_not(x: Array, /) -> Array:
-    return cast(Array, wrapper.not_(x.arr))
+    return process_unary_c_function(x, wrapper.not_)
 
 
-@afarray_as_array
 def neg(x: Array, /) -> Array:
-    return cast(Array, wrapper.neg(x.arr))
+    return process_unary_c_function(x, wrapper.neg)
@@ -0,0 +1,133 @@
+__all__ = ["get_printoptions", "set_printoptions"]
+
+from typing import Any
+
+from arrayfire import Array
+from arrayfire.dtypes import bool as afbool
+from arrayfire.dtypes import complex32, complex64, float16, float32, float64, int32
+from arrayfire.library.array_functions import lookup
+
+_printoptions = {"threshold": 1000, "edgeitems": 3, "precision": 4}
+
+
+def get_printoptions() -> dict[str, int]:
+    """
+    Returns the current print options.
+
+    Returns
+    -------
+    dict[str, int]
+        Copy of the options, with the keys "threshold", "edgeitems" and "precision".
+    """
+    return dict(_printoptions)
+
+
+def set_printoptions(
+    *, threshold: int | None = None, edgeitems: int | None = None, precision: int | None = None
+) -> None:
+    """
+    Sets how arrays are printed by `str` and `repr`.
+
+    Parameters
+    ----------
+    threshold : int | None, optional
+        Total number of elements above which the printed array is summarized. Default is None (unchanged, initially
+        1000).
+    edgeitems : int | None, optional
+        Number of elements printed at the beginning and the end of each summarized dimension. Default is None
+        (unchanged, initially 3).
+    precision : int | None, optional
+        Number of digits printed after the decimal point of floating point elements. Default is None (unchanged,
+        initially 4).
+
+    Raises
+    ------
+    ValueError
+        If any of the options is negative or edgeitems is 0.
+
+    Note
+    ----
+    - A summarized array only transfers the printed elements from the device, so printing large arrays stays cheap.
+    """
+    options = {"threshold": threshold, "edgeitems": edgeitems, "precision": precision}
+
+    for name, value in options.items():
+        if value is not None and value < 0:
+            raise ValueError(f"{name} must be a non-negative integer.")
+
+    if edgeitems == 0:
+        raise ValueError("edgeitems must be a positive integer.")
+
+    _printoptions.update({name: value for name, value in options.items() if value is not None})
+
+
+def array_to_summary_string(array: Array) -> str:
+    """
+    Formats the array in row-major order, replacing the middle of every dimension longer than 2 * edgeitems with
+    "..." once the array has more than threshold elements.
+    """
+    if array.is_empty():
+        return "[]"
+
+    edgeitems = _printoptions["edgeitems"]
+    summarized = array.size > _printoptions["threshold"]
+    cut = [summarized and dim > 2 * edgeitems for dim in array.shape]
+
+    displayed = array
+    for axis, dim in enumerate(array.shape):
+        if cut[axis]:
+            edges: list[bool | int | float] = [*range(edgeitems), *range(dim - edgeitems, dim)]
+            displayed = lookup(displayed, Array(edges, dtype=int32), axis=axis)
+
+    # NOTE a single device to host transfer of the displayed elements only
+    values = displayed.to_list(row_major=True)
+    strings = _format_values(values, array.ndim, _element_formatter(array))
+    width = max(len(string) for string in _flatten(strings, array.ndim))
+
+    return _join_nested(strings, cut, edgeitems, width, 0)
+
+
+def _element_formatter(array: Array) -> Any:
+    precision = _printoptions["precision"]
+    dtype = array.dtype
+
+    if dtype in (complex32, complex64):
+        return lambda x: f"{x.real:.{precision}f}{x.imag:+.{precision}f}j"
+
+    if dtype in (float16, float32, float64):
+        return lambda x: f"{x:.{precision}f}"
+
+    if dtype == afbool:
+        return lambda x: str(bool(x))
+
+    return str
+
+
+def _format_values(values: list[Any], ndim: int, formatter: Any) -> list[Any]:
+    if ndim <= 1:
+        return [formatter(value) for value in values]
+
+    return [_format_values(value, ndim - 1, formatter) for value in values]
+
+
+def _flatten(values: list[Any], ndim: int) -> list[str]:
+    if ndim <= 1:
+        return values
+
+    return [item for value in values for item in _flatten(value, ndim - 1)]
+
+
+def _join_nested(values: list[Any], cut: list[bool], edgeitems: int, width: int, depth: int) -> str:
+    if len(cut) <= 1:
+        items = [value.rjust(width) for value in values]
+    else:
+        items = [_join_nested(value, cut[1:], edgeitems, width, depth + 1) for value in values]
+
+    if cut and cut[0]:
+        items = items[:edgeitems] + ["..."] + items[edgeitems:]
+
+    if len(cut) <= 1:
+        return "[" + " ".join(items) + "]"
+
+    separator = "\n" * (len(cut) - 1) + " " * (depth + 1)
+    return "[" + separator.join(items) + "]"
@@ -5,7 +5,7 @@ from typing import cast, overload
 import arrayfire_wrapper.lib as wrapper
 
 from arrayfire import Array
-from arrayfire.array_object import afarray_as_array
+from arrayfire.array_object import _host_sync, afarray_as_array
 from arrayfire.library.constants import TopK, VarianceBias
 
 # TODO
@@ -13,7 +13,7 @@ from arrayfire.library.constants import TopK, VarianceBias
 
 
 def corrcoef(x: Array, y: Array, /) -> int | float | complex:
-    return wrapper.corrcoef(x.arr, y.arr)
+    return _host_sync(wrapper.corrcoef, x.arr, y.arr)
 
 
 @afarray_as_array
@@ -40,12 +40,12 @@ def mean(x: Array, /, axis: int, *, weights: Array) -> Array: ...
 def mean(x: Array, /, axis: None | int = None, *, weights: None | Array = None) -> int | float | complex | Array:
     if weights:
         if axis is None:
-            return wrapper.mean_all_weighted(x.arr, weights.arr)
+            return _host_sync(wrapper.mean_all_weighted, x.arr, weights.arr)
 
         return Array.from_afarray(wrapper.mean_weighted(x.arr, weights.arr, axis))
 
     if axis is None:
-        return wrapper.mean_all(x.arr)
+        return _host_sync(wrapper.mean_all, x.arr)
 
     return Array.from_afarray(wrapper.mean(x.arr, axis))
 
@@ -60,7 +60,7 @@ def median(x: Array, /, axis: int) -> Array: ...
 
 def median(x: Array, /, axis: None | int = None) -> int | float | complex | Array:
     if axis is None:
-        return wrapper.median_all(x.arr)
+        return _host_sync(wrapper.median_all, x.arr)
 
     return Array.from_afarray(wrapper.median(x.arr, axis))
 
@@ -77,7 +77,7 @@ def stdev(
     x: Array, /, axis: None | int = None, *, bias: VarianceBias = VarianceBias.DEFAULT
 ) -> int | float | complex | Array:
     if axis is None:
-        return wrapper.stdev_all(x.arr, bias)
+        return _host_sync(wrapper.stdev_all, x.arr, bias)
 
     return Array.from_afarray(wrapper.stdev(x.arr, axis, bias))
 
@@ -117,11 +117,11 @@ def var(
 ) -> int | float | complex | Array:
     if weights:
         if axis is None:
-            return wrapper.var_all_weighted(x.arr, weights.arr)
+            return _host_sync(wrapper.var_all_weighted, x.arr, weights.arr)
 
         return Array.from_afarray(wrapper.var_weighted(x.arr, weights.arr, axis))
 
     if axis is None:
-        return wrapper.var_all(x.arr, bias)
+        return _host_sync(wrapper.var_all, x.arr, bias)
 
     return Array.from_afarray(wrapper.var(x.arr, axis, bias))
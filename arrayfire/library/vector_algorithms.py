@@ -25,7 +25,7 @@ from typing import Literal, cast, overload
 from arrayfire_wrapper import lib as wrapper
 
 from arrayfire import Array
-from arrayfire.array_object import afarray_as_array
+from arrayfire.array_object import _host_sync, afarray_as_array
 from arrayfire.library.constants import BinaryOperator
 
 
@@ -147,7 +147,7 @@ def all_true(array: Array, axis: int | None = None) -> bool | Array:
     If `axis` is `None`, output is True if the array does not have any zeros, else False.
     """
     if axis is None:
-        return bool(wrapper.all_true_all(array.arr))
+        return bool(_host_sync(wrapper.all_true_all, array.arr))
 
     return Array.from_afarray(wrapper.all_true(array.arr, axis))
 
@@ -183,7 +183,7 @@ def any_true(array: Array, axis: int | None = None) -> bool | Array:
     If `axis` is `None`, output is True if the array does not have any zeros, else False.
     """
     if axis is None:
-        return bool(wrapper.any_true_all(array.arr))
+        return bool(_host_sync(wrapper.any_true_all, array.arr))
 
     return Array.from_afarray(wrapper.any_true(array.arr, axis))
 
@@ -234,9 +234,9 @@ def sum(array: Array, /, *, axis: int | None = None, nan_value: float | None = N
 
     if axis is None:
         if nan_value is None:
-            return wrapper.sum_all(array.arr)
+            return _host_sync(wrapper.sum_all, array.arr)
 
-        return wrapper.sum_nan_all(array.arr, nan_value)
+        return _host_sync(wrapper.sum_nan_all, array.arr, nan_value)
 
     if nan_value is None:
         return Array.from_afarray(wrapper.sum(array.arr, axis))
@@ -288,9 +288,9 @@ def product(
     """
     if axis is None:
         if nan_value is None:
-            return wrapper.product_all(array.arr)
+            return _host_sync(wrapper.product_all, array.arr)
 
-        return wrapper.product_nan_all(array.arr, nan_value)
+        return _host_sync(wrapper.product_nan_all, array.arr, nan_value)
 
     if nan_value is None:
         return Array.from_afarray(wrapper.product(array.arr, axis))
@@ -376,7 +376,7 @@ def count(
         return Array.from_afarray(key), Array.from_afarray(value)
 
     if axis is None:
-        return wrapper.count_all(array.arr)
+        return _host_sync(wrapper.count_all, array.arr)
 
     return Array.from_afarray(wrapper.count(array.arr, axis))
 
@@ -446,7 +446,7 @@ def imax(array: Array, /, *, axis: int | None = None) -> tuple[int | float | com
     - The maximum values and their locations are returned as separate arrays when an axis is specified.
     """
     if axis is None:
-        return wrapper.imax_all(array.arr)
+        return _host_sync(wrapper.imax_all, array.arr)
 
     maximum, location = wrapper.imax(array.arr, axis)
     return Array.from_afarray(maximum), Array.from_afarray(location)
@@ -528,7 +528,7 @@ def max(
         return Array.from_afarray(values), Array.from_afarray(indices)
 
     if axis is None:
-        return wrapper.max_all(array.arr)
+        return _host_sync(wrapper.max_all, array.arr)
 
     return Array.from_afarray(wrapper.max(array.arr, axis))
 
@@ -586,7 +586,7 @@ def imin(array: Array, /, *, axis: int | None = None) -> tuple[int | float | com
             1          1          0 )
     """
     if axis is None:
-        return wrapper.imin_all(array.arr)
+        return _host_sync(wrapper.imin_all, array.arr)
 
     minimum, location = wrapper.imin(array.arr, axis)
     return Array.from_afarray(minimum), Array.from_afarray(location)
@@ -644,7 +644,7 @@ def min(array: Array, /, *, axis: int | None = None) -> int | float | complex |
       IEEE standards.
     """
     if axis is None:
-        return wrapper.min_all(array.arr)
+        return _host_sync(wrapper.min_all, array.arr)
 
     return Array.from_afarray(wrapper.min(array.arr, axis))
 
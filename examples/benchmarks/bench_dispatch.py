@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2024, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import sys
+from time import time
+from typing import Any, Callable
+
+import arrayfire_wrapper.lib as wrapper
+
+import arrayfire as af
+from arrayfire.array_api._array_object import Array as ArrayAPIArray
+from arrayfire.array_object import _call_broadcasting, _process_scalar_operand
+
+
+def isinstance_chain(x: af.Array, y: af.Array) -> Any:
+    # Reference path: operand classification with isinstance checks on every call
+    if isinstance(x, af.Array) and isinstance(y, af.Array):
+        return af.Array.from_afarray(wrapper.add(x.arr, y.arr))
+    elif isinstance(x, af.Array) and isinstance(y, int | float):
+        return af.Array.from_afarray(_process_scalar_operand(x.arr, y, x.dtype, wrapper.add, scalar_is_lhs=False))
+    raise TypeError
+
+
+def dispatch_table(x: af.Array, y: af.Array) -> Any:
+    return x + y
+
+
+def reflected_scalar(x: af.Array, y: af.Array) -> Any:
+    return 2 * x
+
+
+def constant_scalar(x: af.Array, y: af.Array) -> Any:
+    # Reference path: the array_api scalar promotion, which wrapped the scalar in a 1-element constant Array first
+    scalar = af.constant(2.0, dtype=x.dtype, shape=(1,))
+    return af.Array.from_afarray(_call_broadcasting(wrapper.add, x.arr, scalar.arr))
+
+
+def bench(calc: Callable[[Any, Any], Any], x: Any, y: Any, iters: int = 10000) -> None:
+    start = time()
+    for _ in range(iters):
+        calc(x, y)
+    t = (time() - start) / iters
+
+    print("%-26s %5d elements: %8.2f us per call" % (calc.__name__, x.size, t * 1e6))
+
+
+def array_api_array(x: Any, y: Any) -> Any:
+    return x + y
+
+
+def array_api_scalar(x: Any, y: Any) -> Any:
+    return x + 2.0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        af.set_device(int(sys.argv[1]))
+
+    af.info()
+
+    print("Benchmark operand dispatch and scalar promotion overhead per operation")
+    for n in (4, 4096):
+        x = af.randu((n,))
+        y = af.randu((n,))
+        af.eval(x, y)
+        af.sync()
+
+        bench(isinstance_chain, x, y)
+        bench(dispatch_table, x, y)
+        bench(reflected_scalar, x, y)
+        bench(constant_scalar, x, y)
+
+        bench(array_api_array, ArrayAPIArray._new(x), ArrayAPIArray._new(y))
+        bench(array_api_scalar, ArrayAPIArray._new(x), ArrayAPIArray._new(y))
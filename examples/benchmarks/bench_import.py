@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2024, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import subprocess
+import sys
+
+# NOTE every statement runs in a fresh interpreter and prints the time it took and the arrayfire modules it loaded
+TEMPLATE = """
+import sys
+from time import perf_counter
+start = perf_counter()
+{statement}
+t = perf_counter() - start
+print(t, sum(name.startswith("arrayfire.library.") for name in sys.modules))
+"""
+
+STATEMENTS = {
+    "import arrayfire": "import arrayfire",
+    "af.Array": "import arrayfire as af; af.Array",
+    "af.exp": "import arrayfire as af; af.exp",
+    "af.fft": "import arrayfire as af; af.fft",
+    "from arrayfire import *": "from arrayfire import *",
+    "import arrayfire.array_api": "import arrayfire.array_api",
+}
+
+
+def bench(name: str, statement: str, runs: int = 10) -> int:
+    times = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", TEMPLATE.format(statement=statement)], text=True)
+        t, modules = output.split()
+        times.append(float(t))
+
+    print("%-28s: %8.1f ms (best of %d), %2d library modules loaded" % (name, min(times) * 1000, runs, int(modules)))
+    return int(modules)
+
+
+if __name__ == "__main__":
+    print("Benchmark import time of arrayfire")
+    results = {name: bench(name, statement) for name, statement in STATEMENTS.items()}
+
+    # NOTE the library modules are imported on first use, a plain import loading any of them is a regression
+    if results["import arrayfire"] != 0:
+        sys.exit("import arrayfire loaded library modules eagerly")
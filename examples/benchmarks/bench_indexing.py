@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2024, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import sys
+from time import time
+from typing import Any, Callable
+
+import arrayfire_wrapper.lib as wrapper
+
+import arrayfire as af
+from arrayfire.array_object import _get_processed_index
+
+KEYS = {
+    "int": 3,
+    "slice": slice(1, 5),
+    "int, slice": (2, slice(None, None, 2)),
+    "slice, int, slice": (slice(1, -1), 4, slice(None)),
+}
+
+
+def generic_getitem(a: af.Array, key: Any) -> Any:
+    # Reference path: the index structs are built from the key on every call
+    return af.Array.from_afarray(wrapper.index_gen(a.arr, a.ndim, wrapper.get_indices(key)))
+
+
+def cached_getitem(a: af.Array, key: Any) -> Any:
+    return a[key]
+
+
+def generic_setitem(a: af.Array, key: Any) -> Any:
+    # Reference path: the region shape and the index structs are computed on every call
+    dims = _get_processed_index(key, a.shape)
+    value = wrapper.create_constant_array(1.0, dims, a.dtype)
+    a._replace_arr(wrapper.assign_gen(a.arr, value, a.ndim, wrapper.get_indices(key)))
+    wrapper.release_array(value)
+
+
+def cached_setitem(a: af.Array, key: Any) -> Any:
+    a[key] = 1.0
+
+
+def bench(calc: Callable[[af.Array, Any], Any], name: str, key: Any, iters: int = 10000) -> None:
+    a = af.randu((8, 8, 8))
+    af.eval(a)
+    af.sync()
+
+    start = time()
+    for _ in range(iters):
+        calc(a, key)
+    t = (time() - start) / iters
+
+    print("%-16s %-18s: %8.2f us per call" % (calc.__name__, name, t * 1e6))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        af.set_device(int(sys.argv[1]))
+
+    af.info()
+
+    print("Benchmark index key processing overhead of a[key] and a[key] = value")
+    for name, key in KEYS.items():
+        bench(generic_getitem, name, key)
+        bench(cached_getitem, name, key)
+        bench(generic_setitem, name, key)
+        bench(cached_setitem, name, key)
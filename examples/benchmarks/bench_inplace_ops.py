@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2024, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import sys
+from time import time
+from typing import Callable
+
+import arrayfire as af
+
+
+def accumulate_rebind(acc: af.Array, x: af.Array, iters: int) -> af.Array:
+    for _ in range(iters):
+        acc = acc + x
+        af.eval(acc)
+    return acc
+
+
+def accumulate_inplace(acc: af.Array, x: af.Array, iters: int) -> af.Array:
+    for _ in range(iters):
+        acc += x
+        af.eval(acc)
+    return acc
+
+
+def bench(calc: Callable[[af.Array, af.Array, int], af.Array], n: int, iters: int = 200) -> None:
+    acc = af.constant(0, (n, n))
+    x = af.randu((n, n))
+    af.eval(acc, x)
+    af.sync()
+    af.device_gc()
+
+    mem_before = af.device_mem_info()
+    peak_lock_bytes = 0
+    start = time()
+    for _ in range(iters // 10):
+        acc = calc(acc, x, 10)
+        peak_lock_bytes = max(peak_lock_bytes, af.device_mem_info()["lock"]["bytes"])
+    af.sync()
+    t = (time() - start) / iters
+    mem_after = af.device_mem_info()
+
+    buffers = mem_after["alloc"]["buffers"] - mem_before["alloc"]["buffers"]
+    print(
+        "%-20s %5d x %5d: %8.4f ms per step, %4d new buffers, peak locked %.1f MiB"
+        % (calc.__name__, n, n, t * 1000, buffers, peak_lock_bytes / 2**20)
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        af.set_device(int(sys.argv[1]))
+
+    af.info()
+
+    print("Benchmark accumulation loops on N x N arrays")
+    for n in (512, 1024, 2048):
+        bench(accumulate_rebind, n)
+        bench(accumulate_inplace, n)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2024, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import math
+import sys
+from time import time
+from typing import Callable
+
+import arrayfire as af
+
+
+def cumulative_normal_distribution(x: af.Array) -> af.Array:
+    condition = x > 0
+    lhs = condition * (0.5 + af.erf(x / math.sqrt(2.0)) / 2)
+    rhs = (1 - condition) * (0.5 - af.erf((-x) / math.sqrt(2.0)) / 2)
+    return lhs + rhs
+
+
+def black_scholes(S: af.Array, X: af.Array, R: af.Array, V: af.Array, T: af.Array) -> tuple[af.Array, af.Array]:
+    d1 = (af.log(S / X) + (R + 0.5 * V**2) * T) / (V * af.sqrt(T))
+    d2 = d1 - V * af.sqrt(T)
+
+    cnd_d1 = cumulative_normal_distribution(d1)
+    cnd_d2 = cumulative_normal_distribution(d2)
+
+    C = S * cnd_d1 - X * af.exp(-R * T) * cnd_d2
+    P = X * af.exp(-R * T) * (1 - cnd_d2) - S * (1 - cnd_d1)
+    return C, P
+
+
+def bench(name: str, calc: Callable[..., tuple[af.Array, af.Array]], n: int, iters: int = 200) -> None:
+    S, X, R, V, T = (af.randu((n,)) for _ in range(5))
+    C, P = calc(S, X, R, V, T)
+    af.eval(C, P)
+    af.sync()
+
+    start = time()
+    for _ in range(iters):
+        C, P = calc(S, X, R, V, T)
+        af.eval(C, P)
+    af.sync()
+    t = (time() - start) / iters
+
+    print("%-14s %8d elements: %8.2f us per call" % (name, n, t * 1e6))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        af.set_device(int(sys.argv[1]))
+
+    af.info()
+
+    print("Benchmark per-call overhead of traced element-wise functions")
+    for n in (1000, 100000):
+        bench("black_scholes", black_scholes, n)
+        bench("af.jit", af.jit(black_scholes), n)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2024, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import sys
+import tracemalloc
+from time import time
+from typing import Any, Callable
+
+import arrayfire_wrapper.lib as wrapper
+
+import arrayfire as af
+
+
+def wrap_with_init(x: af.Array, y: af.Array) -> Any:
+    # Reference path: goes through the argument parsing of Array.__init__
+    return af.Array(x)
+
+
+def wrap_from_afarray(x: af.Array, y: af.Array) -> Any:
+    return af.Array.from_afarray(wrapper.retain_array(x.arr))
+
+
+def elementwise_chain(x: af.Array, y: af.Array) -> Any:
+    return (x + y) * y - x
+
+
+def bench(calc: Callable[[af.Array, af.Array], Any], n: int, iters: int = 20000) -> None:
+    x = af.randu((n, n))
+    y = af.randu((n, n))
+    af.eval(x, y)
+    af.sync()
+
+    start = time()
+    for _ in range(iters):
+        calc(x, y)
+    t = time() - start
+
+    tracemalloc.start()
+    results = [calc(x, y) for _ in range(100)]
+    python_bytes = tracemalloc.get_traced_memory()[0] / len(results)
+    tracemalloc.stop()
+
+    print(
+        "%-20s %3d x %3d: %10.0f calls/s, %6.0f Python bytes per result"
+        % (calc.__name__, n, n, iters / t, python_bytes)
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        af.set_device(int(sys.argv[1]))
+
+    af.info()
+
+    print("Benchmark Array object creation and small element-wise op throughput")
+    for n in (2, 8):
+        bench(wrap_with_init, n)
+        bench(wrap_from_afarray, n)
+        bench(elementwise_chain, n)
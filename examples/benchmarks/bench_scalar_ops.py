@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2024, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import sys
+from time import time
+from typing import Callable
+
+import arrayfire as af
+
+
+def scalar_full_size(x: af.Array) -> af.Array:
+    # Reference path: the scalar is expanded to a constant array of the same shape as x
+    return x * af.constant(0.5, x.shape, x.dtype) + af.constant(1.0, x.shape, x.dtype)
+
+
+def scalar_broadcast(x: af.Array) -> af.Array:
+    # Fast path: the scalar is passed as a 1-element node and broadcast by the backend
+    return x * 0.5 + 1.0
+
+
+def bench(calc: Callable[[af.Array], af.Array], n: int, iters: int = 100) -> None:
+    x = af.randu((n, n))
+    af.eval(calc(x))
+    af.sync()
+    af.device_gc()
+
+    mem_before = af.device_mem_info()
+    start = time()
+    for _ in range(iters):
+        y = calc(x)
+        af.eval(y)
+    af.sync()
+    t = (time() - start) / iters
+    mem_after = af.device_mem_info()
+
+    buffers = mem_after["alloc"]["buffers"] - mem_before["alloc"]["buffers"]
+    mbytes = (mem_after["alloc"]["bytes"] - mem_before["alloc"]["bytes"]) / 2**20
+    print(
+        "%-16s %5d x %5d: %8.4f ms per op, %4d new buffers (%.1f MiB)"
+        % (calc.__name__, n, n, t * 1000, buffers, mbytes)
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        af.set_device(int(sys.argv[1]))
+
+    af.info()
+
+    print("Benchmark scalar operands on N x N arrays")
+    for n in (512, 1024, 2048, 4096):
+        bench(scalar_full_size, n)
+        bench(scalar_broadcast, n)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2024, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import sys
+from time import time
+from typing import Any, Callable
+
+import arrayfire_wrapper.lib as wrapper
+
+import arrayfire as af
+from arrayfire.array_object import _assign_arr, _get_index_key
+
+KEY = (slice(None), slice(1, None))
+
+
+def full_constant(a: af.Array, column: af.Array) -> None:
+    # Reference path: a constant array of the full region assigned in one go
+    indices, dims = _get_index_key(KEY, a.shape)
+    value = wrapper.create_constant_array(0.0, dims, a.dtype)
+    _assign_arr(a, indices, value)
+    wrapper.release_array(value)
+
+
+def scalar_fill(a: af.Array, column: af.Array) -> None:
+    a[KEY] = 0.0
+
+
+def column_broadcast(a: af.Array, column: af.Array) -> None:
+    a[KEY] = column
+
+
+def bench(calc: Callable[[af.Array, af.Array], Any], n: int, iters: int = 20) -> None:
+    a = af.randu((n, n))
+    column = af.randu((n,))
+    af.eval(a, column)
+    af.sync()
+    af.device_gc()
+
+    mem_before = af.device_mem_info()
+    peak_alloc_bytes = 0
+    start = time()
+    for _ in range(iters):
+        calc(a, column)
+        af.eval(a)
+        peak_alloc_bytes = max(peak_alloc_bytes, af.device_mem_info()["alloc"]["bytes"])
+    af.sync()
+    t = (time() - start) / iters
+
+    extra_bytes = peak_alloc_bytes - mem_before["alloc"]["bytes"]
+    print(
+        "%-18s %5d x %5d: %8.3f ms per fill, %7.1f MiB extra allocated"
+        % (calc.__name__, n, n, t * 1000, extra_bytes / 2**20)
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        af.set_device(int(sys.argv[1]))
+
+    af.info()
+
+    print("Benchmark large slice fills with a scalar and a broadcast column")
+    for n in (1024, 4096, 8192):
+        bench(full_constant, n)
+        bench(scalar_fill, n)
+        bench(column_broadcast, n)
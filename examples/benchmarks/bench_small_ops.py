@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+#######################################################
+# Copyright (c) 2024, ArrayFire
+# All rights reserved.
+#
+# This file is distributed under 3-clause BSD license.
+# The complete license agreement can be obtained at:
+# http://arrayfire.com/licenses/BSD-3-Clause
+########################################################
+
+import sys
+from time import time
+from typing import Any, Callable
+
+import arrayfire_wrapper.lib as wrapper
+
+import arrayfire as af
+
+
+def query_metadata_ffi(x: af.Array, y: af.Array) -> Any:
+    # Reference path: every attribute read goes through the C library
+    ndim = wrapper.get_numdims(x.arr)
+    return wrapper.get_dims(x.arr)[:ndim], wrapper.get_type(x.arr), wrapper.get_elements(x.arr)
+
+
+def query_metadata(x: af.Array, y: af.Array) -> Any:
+    return x.shape, x.dtype, x.size
+
+
+def binary_op(x: af.Array, y: af.Array) -> Any:
+    return x + y
+
+
+def scalar_op(x: af.Array, y: af.Array) -> Any:
+    return x * 2
+
+
+def inplace_op(x: af.Array, y: af.Array) -> Any:
+    x += y
+    return x
+
+
+def index_op(x: af.Array, y: af.Array) -> Any:
+    return x[1:3]
+
+
+def bench(calc: Callable[[af.Array, af.Array], Any], n: int, iters: int = 10000) -> None:
+    x = af.randu((n,))
+    y = af.randu((n,))
+    af.eval(x, y)
+    af.sync()
+
+    start = time()
+    for _ in range(iters):
+        calc(x, y)
+    t = (time() - start) / iters
+
+    print("%-20s %5d elements: %8.2f us per call" % (calc.__name__, n, t * 1e6))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        af.set_device(int(sys.argv[1]))
+
+    af.info()
+
+    print("Benchmark Python overhead per operation on small arrays")
+    for n in (4, 64):
+        bench(query_metadata_ffi, n)
+        bench(query_metadata, n)
+        bench(binary_op, n)
+        bench(scalar_op, n)
+        bench(inplace_op, n)
+        bench(index_op, n)
@@ -0,0 +1,58 @@
+import pytest
+
+import arrayfire as af
+from arrayfire import Array
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture(autouse=True)
+def cpu_backend() -> None:
+    if af.get_backend().backend_type != af.BackendType.cpu:
+        pytest.skip("NumPy can only consume DLPack tensors from host memory")
+
+
+def test_dlpack_device_on_cpu() -> None:
+    device_type, _ = Array([1, 2, 3]).__dlpack_device__()
+
+    assert device_type == 1
+
+
+def test_numpy_from_dlpack_shares_layout() -> None:
+    array = Array.from_numpy(np.arange(6, dtype=np.float32).reshape(2, 3))
+    result = np.from_dlpack(array)
+
+    assert result.shape == (2, 3)
+    assert result.flags.f_contiguous
+    assert np.array_equal(result, np.arange(6, dtype=np.float32).reshape(2, 3))
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_from_dlpack_numpy(order: str) -> None:
+    source = np.asarray(np.arange(24, dtype=np.int32).reshape(2, 3, 4), order=order)
+    array = af.from_dlpack(source)
+
+    assert array.dtype == af.int32
+    assert array.shape == (2, 3, 4)
+    assert np.array_equal(array.to_numpy(), source)
+
+
+def test_from_dlpack_roundtrip() -> None:
+    array = af.randu((3, 4))
+    result = af.from_dlpack(array)
+
+    assert result.shape == array.shape
+    assert af.all_true(result == array)
+
+
+def test_from_dlpack_non_contiguous() -> None:
+    with pytest.raises(BufferError):
+        af.from_dlpack(np.arange(12, dtype=np.float32).reshape(3, 4)[:, ::2])
+
+
+def test_from_dlpack_ignores_strides_of_length_one_dimensions() -> None:
+    source = np.lib.stride_tricks.as_strided(np.arange(4, dtype=np.float32), shape=(1, 4), strides=(100, 4))
+    array = af.from_dlpack(source)
+
+    assert array.shape == (1, 4)
+    assert np.array_equal(array.to_numpy(), source)
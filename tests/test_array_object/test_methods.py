@@ -1,4 +1,10 @@
-from arrayfire import Array
+import struct
+
+import pytest
+
+import arrayfire as af
+from arrayfire import Array, array_object
+from tests._helpers import create_from_2d_nested
 
 
 def test_array_getitem_by_index() -> None:
@@ -16,6 +22,151 @@ def test_array_getitem_by_slice() -> None:
     assert slice_item.to_list() == [2, 3]
 
 
+def test_array_getitem_by_boolean_mask() -> None:
+    array = Array([1, 5, 2, 7, 3])
+
+    assert array[array > 2].to_list() == [5, 7, 3]
+    assert array[array > 9].is_empty()
+    assert array[array > 9].dtype == array.dtype
+
+
+def test_array_getitem_by_index_array() -> None:
+    array = Array([1, 5, 2, 7, 3])
+
+    assert array[Array([4, 0, 0], dtype=af.int32)].to_list() == [3, 1, 1]
+
+
+def test_array_setitem_by_boolean_mask() -> None:
+    array = Array([1, 5, 2, 7, 3])
+
+    with af.debug.track_syncs() as syncs:
+        array[array > 2] = 0
+
+    assert syncs.count == 0
+    assert array.to_list() == [1, 0, 2, 0, 0]
+
+    array[array > 9] = 4
+    assert array.to_list() == [1, 0, 2, 0, 0]
+
+    array[array == 0] = Array([6, 8, 9])
+    assert array.to_list() == [1, 6, 2, 8, 9]
+
+
+def test_array_setitem_by_boolean_mask_2d() -> None:
+    array = create_from_2d_nested(1, 2, 3, 4)
+
+    array[array > 2] = 0
+    assert array.to_list(row_major=True) == [[1, 2], [0, 0]]
+
+    array[Array([0, 1]) > 0] = 5
+    assert array.to_list(row_major=True) == [[1, 2], [5, 5]]
+
+
+def test_array_setitem_by_boolean_mask_keeps_large_integers() -> None:
+    array = af.constant(0, (3,), dtype=af.int64)
+    value = 2**53 + 1
+
+    array[array == 0] = value
+    assert array.to_list() == [value, value, value]
+
+
+def test_array_setitem_slice_with_scalar() -> None:
+    array = Array([1, 2, 3, 4, 5])
+
+    array[1:3] = 0
+    array[::4] = 9
+    assert array.to_list() == [9, 0, 0, 4, 9]
+
+
+def test_array_setitem_broadcasts_lower_rank_array() -> None:
+    array = af.constant(0, (2, 3), dtype=af.int32)
+
+    array[:, 1:] = Array([7, 8], dtype=af.int32)
+    assert array.to_list(row_major=True) == [[0, 7, 7], [0, 8, 8]]
+
+    with pytest.raises(ValueError):
+        array[:, 1:] = Array([1, 2, 3], dtype=af.int32)
+
+
+def test_array_setitem_large_region_in_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(array_object, "_ASSIGN_TILE_ELEMENTS", 4)
+    array = af.constant(0, (2, 7), dtype=af.int32)
+
+    array[:, 1:6] = 1
+    array[0, ::2] = 2
+    assert array.to_list(row_major=True) == [[2, 1, 2, 1, 2, 1, 2], [0, 1, 1, 1, 1, 1, 0]]
+
+
+def test_array_index_key_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(array_object, "_index_keys", {})
+    array = af.constant(0, (4, 3), dtype=af.int32)
+
+    array[1:3, 0] = 1
+    assert array[1:3, 0].to_list() == [1, 1]
+    assert list(array_object._index_keys) == [(((1, 3, None), 0), (4, 3))]
+
+    monkeypatch.setattr(array_object, "_INDEX_KEYS_SIZE", 2)
+    assert [array[index, 0].scalar() for index in range(4)] == [0, 1, 1, 0]
+    assert len(array_object._index_keys) <= 2
+
+
+def test_array_basic_slice_is_view() -> None:
+    array = af.randu((8, 4))
+
+    view = array[2:6]
+    assert view.is_view and view.base is array
+    assert view.offset == 2
+
+    assert not array.is_view and array.base is None
+    assert not array[::2].is_view
+    # NOTE the rows of view are not contiguous, so indexing it copies
+    assert not view[1:].is_view
+
+    vector = af.randu((8,))
+    assert vector[2:6][1:].base is vector
+    assert not array[Array([0, 1], dtype=af.int32)].is_view
+
+
+def test_array_getitem_checks_views_only_for_unit_steps(monkeypatch: pytest.MonkeyPatch) -> None:
+    array = af.randu((8, 4))
+    calls: list[object] = []
+
+    def is_owner(arr: object) -> bool:
+        calls.append(arr)
+        return True
+
+    monkeypatch.setattr(array_object.wrapper, "is_owner", is_owner)
+
+    array[::2]
+    array[::-1, 1]
+    array[Array([0, 1], dtype=af.int32)]
+    assert calls == []
+
+    array[2:6]
+    array[1, ::2]
+    assert len(calls) == 2
+
+
+def test_array_view_copy_on_write() -> None:
+    array = Array([1, 2, 3, 4], dtype=af.int32)
+    view = array[1:3]
+
+    view[0] = 5
+    assert not view.is_view
+    assert view.to_list() == [5, 3]
+    assert array.to_list() == [1, 2, 3, 4]
+
+    view = array[1:3]
+    array[:] = 0
+    assert not view.is_view and view.base is None
+    assert view.to_list() == [2, 3]
+
+    view = array[1:3]
+    array += 1
+    assert not view.is_view and view.base is None
+    assert view.to_list() == [0, 0]
+
+
 def test_scalar() -> None:
     array = Array([1, 2, 3])
     assert array[1].scalar() == 2
@@ -41,3 +192,61 @@ def test_array_to_list_comparison() -> None:
     array2 = Array([1, 2, 3])
     assert array1 is not array2
     assert array1.to_list() == array2.to_list()
+
+
+def test_array_to_list_2d() -> None:
+    array = create_from_2d_nested(1, 2, 3, 4, dtype=af.int32)
+    assert array.to_list() == [[1, 3], [2, 4]]
+    assert array.to_list(row_major=True) == [[1, 2], [3, 4]]
+
+
+def test_array_to_list_3d_row_major() -> None:
+    array = af.moddims(af.range((24,), dtype=af.int32), (2, 3, 4))
+    out = array.to_list(row_major=True)
+
+    assert len(out) == 2 and len(out[0]) == 3 and len(out[0][0]) == 4
+    assert out[1][2][3] == array[1, 2, 3].scalar()
+
+
+def test_array_to_bytes() -> None:
+    array = create_from_2d_nested(1, 2, 3, 4, dtype=af.int32)
+    assert array.to_bytes() == struct.pack("=4i", 1, 3, 2, 4)
+    assert array.to_bytes(row_major=True) == struct.pack("=4i", 1, 2, 3, 4)
+
+
+def test_array_to_memoryview() -> None:
+    array = create_from_2d_nested(1, 2, 3, 4, dtype=af.int32)
+    view = array.to_memoryview(row_major=True)
+
+    assert view.format == "i"
+    assert view.shape == (2, 2)
+    assert view.tolist() == array.to_list(row_major=True)
+
+
+def test_array_metadata_follows_handle_swap() -> None:
+    array = af.randu((2, 3))
+    assert array.shape == (2, 3)
+    assert array.dtype == af.float32
+
+    array += 1
+    array[0, 0] = 2
+    assert array.shape == (2, 3)
+    assert array.size == 6
+
+    view = array[0]
+    assert view.shape == (1, 3)
+    assert view.ndim == 2
+
+
+def test_array_dtype_predicates() -> None:
+    array = af.randu((2, 2), dtype=af.complex32)
+
+    assert array.is_complex and array.is_floating and array.is_single
+    assert not (array.is_real or array.is_double or array.is_integer or array.is_bool)
+
+
+def test_array_has_no_instance_dict() -> None:
+    array = Array([1, 2, 3])
+
+    assert not hasattr(array, "__dict__")
+    assert not hasattr(array + 1, "__dict__")
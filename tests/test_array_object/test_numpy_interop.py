@@ -0,0 +1,60 @@
+import pytest
+
+import arrayfire as af
+from arrayfire import Array
+
+np = pytest.importorskip("numpy")
+
+
+def test_from_numpy_1d() -> None:
+    array = Array.from_numpy(np.array([1, 2, 3], dtype=np.int32))
+
+    assert array.dtype == af.int32
+    assert array.shape == (3,)
+    assert array.to_list() == [1, 2, 3]
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_from_numpy_2d_keeps_layout(order: str) -> None:
+    source = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], dtype=np.float32, order=order)
+    array = Array.from_numpy(source)
+
+    assert array.shape == (2, 3)
+    assert array[0, 2].scalar() == 3.0
+    assert array[1, 0].scalar() == 4.0
+
+
+def test_from_numpy_unsupported_dtype() -> None:
+    with pytest.raises(TypeError):
+        Array.from_numpy(np.array([1, 2, 3], dtype=np.int8))
+
+
+def test_to_numpy_roundtrip() -> None:
+    source = np.arange(24, dtype=np.float64).reshape(2, 3, 4)
+    result = Array.from_numpy(source).to_numpy()
+
+    assert result.dtype == np.float64
+    assert np.array_equal(result, source)
+
+
+def test_to_numpy_into_out() -> None:
+    array = Array([1, 2, 3, 4], dtype=af.int32)
+    out = np.empty(4, dtype=np.int32)
+
+    result = array.to_numpy(out=out)
+
+    assert result is out
+    assert out.tolist() == [1, 2, 3, 4]
+
+
+def test_to_numpy_out_mismatch() -> None:
+    array = Array([1, 2, 3], dtype=af.int32)
+
+    with pytest.raises(ValueError):
+        array.to_numpy(out=np.empty(3, dtype=np.float32))
+
+
+def test_numpy_asarray() -> None:
+    array = Array([1.5, 2.5, 3.5])
+
+    assert np.asarray(array).tolist() == [1.5, 2.5, 3.5]
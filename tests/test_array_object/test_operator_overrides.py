@@ -1,12 +1,15 @@
 import operator
+import threading
 from collections.abc import Callable
 from typing import Any
 
 import pytest
 
+import arrayfire as af
 from arrayfire import Array
 from arrayfire.dtypes import bool as af_bool
-from tests._helpers import round_to
+from arrayfire.dtypes import int64 as af_int64
+from tests._helpers import create_from_2d_nested, round_to
 
 Operator = Callable[[int | float | Array, int | float | Array], Array]
 
@@ -28,7 +31,7 @@ def pytest_generate_tests(metafunc: Any) -> None:
                 "sub",  # __sub__, __isub__, __rsub__
                 "mul",  # __mul__, __imul__, __rmul__
                 "truediv",  # __truediv__, __itruediv__, __rtruediv__
-                # "floordiv",  # __floordiv__, __ifloordiv__, __rfloordiv__  # TODO
+                "floordiv",  # __floordiv__, __ifloordiv__, __rfloordiv__
                 "mod",  # __mod__, __imod__, __rmod__
                 "pow",  # __pow__, __ipow__, __rpow__,
             ],
@@ -69,15 +72,17 @@ def test_arithmetic_operators(
         rref = [op(operand, x) for x in array_origin]
 
     array = Array(array_origin)
+    iarray = Array(array_origin)
 
     res = op(array, operand)
-    ires = iop(array, operand)
+    ires = iop(iarray, operand)
     rres = op(operand, array)
 
     assert round_to(res.to_list()) == round_to(ires.to_list()) == round_to(ref)
     assert round_to(rres.to_list()) == round_to(rref)
 
     assert res.dtype == ires.dtype == rres.dtype
+    assert ires is iarray
     assert res.ndim == ires.ndim == rres.ndim
     assert res.size == ires.size == ires.size
     assert res.shape == ires.shape == rres.shape
@@ -118,3 +123,114 @@ def test_comparison_operators_expected_to_raise_error(
 
     with pytest.raises(TypeError):
         comparison_operator(array, false_operand)
+
+
+def test_scalar_operand_is_broadcast_over_2d_array() -> None:
+    array = create_from_2d_nested(1, 2, 3, 4)
+
+    res = array * 2 + 1
+    rres = 1 - array
+
+    assert res.shape == rres.shape == (2, 2)
+    assert res.dtype == rres.dtype == array.dtype
+    assert round_to([res[0, 0].scalar(), res[1, 1].scalar()]) == [3, 9]  # type: ignore[list-item]
+    assert round_to([rres[0, 1].scalar(), rres[1, 0].scalar()]) == [-1, -2]  # type: ignore[list-item]
+
+
+def _rows(array: Array) -> list[list[float]]:
+    return [round_to(row) for row in array.to_list(row_major=True)]
+
+
+def test_matmul() -> None:
+    lhs = create_from_2d_nested(1, 2, 3, 4)
+    rhs = create_from_2d_nested(5, 6, 7, 8)
+
+    assert _rows(lhs @ rhs) == [[19, 22], [43, 50]]
+    assert _rows(lhs.T @ rhs) == [[26, 30], [38, 44]]
+    assert _rows(lhs @ rhs.T) == [[17, 23], [39, 53]]
+    assert _rows(lhs.T) == [[1, 3], [2, 4]]
+
+
+def test_matmul_with_vectors() -> None:
+    matrix = create_from_2d_nested(1, 2, 3, 4)
+    vector = Array([1, 2])
+
+    assert round_to((vector @ matrix).to_list()) == [7, 10]
+    assert round_to((matrix @ vector).to_list()) == [5, 11]
+
+
+def test_imatmul() -> None:
+    array = create_from_2d_nested(1, 2, 3, 4)
+    res = array
+    res @= create_from_2d_nested(1, 0, 0, 1)
+
+    assert res is array
+    assert _rows(res) == [[1, 2], [3, 4]]
+
+
+def test_matmul_shape_mismatch() -> None:
+    with pytest.raises(ValueError):
+        Array([1, 2, 3]) @ create_from_2d_nested(1, 2, 3, 4)
+
+
+def test_floordiv_signed_integers() -> None:
+    values: list[bool | int | float] = [-7, -6, -1, 0, 1, 6, 7]
+    array = Array(values, dtype=af_int64)
+
+    for divisor in (3, -3):
+        divisors: list[bool | int | float] = [divisor] * len(values)
+        assert (array // divisor).to_list() == [x // divisor for x in values]
+        assert (array // Array(divisors, dtype=af_int64)).to_list() == [x // divisor for x in values]
+
+    assert (array // 3).dtype == af_int64
+
+
+def test_floordiv_floats_is_recorded_lazily() -> None:
+    array = Array([-3.5, 1.5, 4.0])
+
+    with af.lazy():
+        result = array // 2
+        assert hasattr(result, "_node")
+
+    assert result.to_list() == [-2.0, 0.0, 2.0]
+
+
+def test_scalar_operations_from_threads() -> None:
+    array = Array([1, 2, 3, 4])
+    results: list[bool] = []
+
+    def work() -> None:
+        for step in range(50):
+            results.append((array * step + 1).to_list() == [x * step + 1 for x in [1, 2, 3, 4]])
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for _ in range(50):
+        # NOTE shapes that only batch mode broadcasts must keep failing while other threads broadcast scalars
+        with pytest.raises(RuntimeError):
+            array + Array([1])
+
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 200 and all(results)
+
+
+def test_operands_of_scalar_and_array_subclasses() -> None:
+    class Float(float):
+        pass
+
+    array = create_from_2d_nested(1, 2, 3, 4)
+
+    assert _rows(array + Float(0.5)) == [[1.5, 2.5], [3.5, 4.5]]
+    assert _rows(Float(1) - array.T) == [[0, -2], [-1, -3]]
+    assert _rows(array.T * array) == [[1, 6], [6, 16]]
+
+
+def test_complex_scalar_operand() -> None:
+    array = Array([1, 2, 3])
+
+    assert (array + 2j).to_list() == [1 + 2j, 2 + 2j, 3 + 2j]  # type: ignore[operator]
+    assert (1j * array).to_list() == [1j, 2j, 3j]  # type: ignore[operator]
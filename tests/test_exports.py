@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import pytest
+
+import arrayfire as af
+
+
+@pytest.mark.parametrize("name", af.__all__)
+def test_public_name_resolves(name: str) -> None:
+    assert getattr(af, name) is not None
+
+
+def test_lazy_name_is_the_library_object() -> None:
+    from arrayfire.library.mathematical_functions import exp
+    from arrayfire.library.signal_processing import fft
+
+    assert af.exp is exp
+    assert af.fft is fft
+
+
+def test_lazy_submodule_export() -> None:
+    from arrayfire.library import debug
+
+    assert af.debug is debug
+
+
+def test_unknown_name_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="no_such_function"):
+        af.no_such_function
+
+
+def test_dir_lists_lazy_names() -> None:
+    assert set(af.__all__) <= set(dir(af))
+
+
+def test_import_does_not_load_library_modules() -> None:
+    code = 'import sys, arrayfire; print(sorted(m for m in sys.modules if m.startswith("arrayfire.library.")))'
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+
+    assert output.strip() == "[]"
+
+
+def test_star_import_resolves_all_names() -> None:
+    namespace: dict[str, object] = {}
+    exec("from arrayfire import *", namespace)
+
+    assert set(af.__all__) <= set(namespace)
@@ -1,3 +1,6 @@
+import threading
+
+import arrayfire_wrapper.lib as wrapper
 import pytest
 
 import arrayfire as af
@@ -111,3 +114,169 @@ def test_flat_large_array() -> None:
     flattened = af.flat(arr)
     assert flattened.shape == (1000000,)
     assert af.all_true(flattened == af.flat(arr), 0)
+
+
+# Test cases for the af.lazy context manager
+
+
+def test_lazy_matches_eager() -> None:
+    a = af.randu((4, 3))
+    b = af.randu((4, 3))
+    expected = (a + b) * (a + b) - 2 * b
+
+    with af.lazy():
+        result = (a + b) * (a + b) - 2 * b
+        mask = a > b
+
+    assert result.shape == (4, 3)
+    assert af.all_true(result == expected)
+    assert mask.dtype == af.bool
+    assert af.all_true(mask == (a > b))
+
+
+def test_lazy_deduplicates_subexpressions() -> None:
+    a = af.randu((8,))
+    b = af.randu((8,))
+
+    with af.lazy():
+        first = a * b
+        second = a * b
+        assert first._node == second._node  # type: ignore[attr-defined]
+
+    assert af.all_true(first == second)
+
+
+def test_lazy_folds_identity_scalars() -> None:
+    a = af.randu((8,))
+
+    with af.lazy():
+        result = (a + 0) * 1
+
+    assert af.all_true(result == a)
+
+
+def test_lazy_materializes_on_access() -> None:
+    a = af.constant(2, (3,), dtype=af.int32)
+
+    with af.lazy():
+        result = a * 3
+        assert result.to_list() == [6, 6, 6]
+        result += 1
+
+    assert result.to_list() == [7, 7, 7]
+
+
+def test_lazy_records_only_the_current_thread() -> None:
+    a = af.randu((8,))
+    results: list[af.Array] = []
+
+    with af.lazy():
+        recorded = a + 1
+        thread = threading.Thread(target=lambda: results.append(a + 1))
+        thread.start()
+        thread.join()
+
+        assert hasattr(recorded, "_node")
+        assert not hasattr(results[0], "_node")
+
+
+def test_lazy_restores_manual_eval_flag() -> None:
+    af.set_manual_eval_flag(False)
+
+    with af.lazy():
+        pass
+
+    with pytest.raises(ZeroDivisionError):
+        with af.lazy():
+            1 / 0
+
+    assert not af.get_manual_eval_flag()
+
+
+# Test cases for the automatic JIT depth control
+
+
+def test_max_jit_depth_evaluates_deep_results() -> None:
+    previous = af.get_max_jit_depth()
+    af.set_max_jit_depth(8)
+    af.reset_jit_depth_stats()
+
+    try:
+        x = af.constant(0, (16,), dtype=af.int32)
+        for _ in range(40):
+            x = x + 1
+
+        stats = af.get_jit_depth_stats()
+    finally:
+        af.set_max_jit_depth(previous)
+
+    assert stats["operations"] == 40
+    assert stats["auto_evals"] == 4
+    assert af.all_true(x == 40)
+
+
+def test_max_jit_depth_disabled() -> None:
+    previous = af.get_max_jit_depth()
+    af.set_max_jit_depth(None)
+    af.reset_jit_depth_stats()
+
+    try:
+        x = af.constant(1.0, (16,))
+        for _ in range(100):
+            x = x * 1.0001
+    finally:
+        af.set_max_jit_depth(previous)
+
+    assert af.get_jit_depth_stats()["auto_evals"] == 0
+
+
+def test_max_jit_depth_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        af.set_max_jit_depth(0)
+
+
+def test_as_strided_overlapping_and_zero_strides() -> None:
+    array = af.Array([1, 2, 3, 4, 5], dtype=af.int32)
+
+    assert af.as_strided(array, (3, 2), (1, 2)).to_list() == [[1, 2, 3], [3, 4, 5]]
+    assert af.as_strided(array, (2, 3), (0, 1), offset=2).to_list() == [[3, 3], [4, 4], [5, 5]]
+    assert af.as_strided(array, (3,), (-2,), offset=4).to_list() == [5, 3, 1]
+
+
+def test_as_strided_empty_shape() -> None:
+    array = af.Array([1, 2, 3, 4, 5], dtype=af.int32)
+    empty = af.as_strided(array, (0, 3), (1, 1))
+
+    assert empty.is_empty() and empty.size == 0
+    assert empty.dtype == af.int32
+    assert wrapper.get_dims(empty.arr)[:2] == (0, 3)
+
+
+def test_as_strided_out_of_bounds() -> None:
+    array = af.Array([1, 2, 3, 4, 5], dtype=af.int32)
+
+    with pytest.raises(ValueError):
+        af.as_strided(array, (3, 2), (1, 3))
+
+    with pytest.raises(ValueError):
+        af.as_strided(array, (3,), (1, 1))
+
+
+def test_sliding_window_view() -> None:
+    array = af.Array([1, 2, 3, 4, 5], dtype=af.int32)
+    windows = af.sliding_window_view(array, 3)
+
+    assert windows.shape == (3, 3)
+    assert windows.to_list(row_major=True) == [[1, 2, 3], [2, 3, 4], [3, 4, 5]]
+    assert af.sum(windows, axis=1).to_list() == [6, 9, 12]
+
+
+def test_sliding_window_view_along_axis() -> None:
+    array = af.moddims(af.range((6,), dtype=af.int32), (2, 3))
+    windows = af.sliding_window_view(array, 2, axis=1)
+
+    assert windows.shape == (2, 2, 2)
+    assert af.flat(windows[1, 1]).to_list() == [3, 5]
+
+    with pytest.raises(ValueError):
+        af.sliding_window_view(array, 4, axis=1)
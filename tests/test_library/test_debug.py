@@ -0,0 +1,184 @@
+import inspect
+import json
+import threading
+from pathlib import Path
+
+import arrayfire_wrapper.lib as wrapper
+
+import arrayfire as af
+from arrayfire import array_object
+
+
+def test_track_syncs_records_implicit_syncs() -> None:
+    a = af.randu((100,))
+    mask = a > 0.5
+    b = af.randu((100, 2))
+
+    with af.debug.track_syncs() as syncs:
+        af.sum(a)
+        a.scalar()
+        a[mask]
+        b[mask, 1] = 0  # type: ignore[index]
+
+    assert [event.name for event in syncs.events] == ["sum_all", "get_scalar", "where", "where"]
+    assert all(event.duration >= 0 for event in syncs.events)
+    assert syncs.events[0].call_site.filename == __file__
+
+
+def test_track_syncs_ignores_lazy_operations() -> None:
+    a = af.randu((100,))
+
+    with af.debug.track_syncs() as syncs:
+        b = a * 2 + 1
+        af.max(b, axis=0)
+
+    assert syncs.count == 0
+
+
+def test_track_syncs_summary_groups_call_sites() -> None:
+    a = af.randu((10,))
+
+    with af.debug.track_syncs() as syncs:
+        for _ in range(3):
+            af.max(a)
+
+    lines = syncs.summary().splitlines()
+
+    assert len(lines) == 2
+    assert lines[1].split()[:2] == ["max_all", "3"]
+
+
+def test_track_syncs_stops_on_exit() -> None:
+    with af.debug.track_syncs() as syncs:
+        pass
+
+    af.sum(af.randu((10,)))
+
+    assert syncs.count == 0
+
+
+def test_track_syncs_records_only_its_own_thread() -> None:
+    a = af.randu((16,))
+
+    with af.debug.track_syncs() as syncs:
+        worker = threading.Thread(target=lambda: af.sum(a))
+        worker.start()
+        worker.join()
+        a.scalar()
+
+    assert [event.name for event in syncs.events] == ["get_scalar"]
+
+
+def test_profile_records_wrapper_calls() -> None:
+    a = af.randu((8, 4))
+
+    with af.debug.profile(sync=True) as profiler:
+        b = a + a
+        af.eval(b)
+
+    names = [event.name for event in profiler.events]
+    add = profiler.events[names.index("add")]
+
+    assert "eval" in names
+    assert add.shapes == ((8, 4), (8, 4))
+    assert add.dtypes == ("float32", "float32")
+    assert all(event.duration >= 0 for event in profiler.events)
+
+
+def test_profile_restores_wrapper_on_exit() -> None:
+    with af.debug.profile():
+        assert array_object.wrapper is not wrapper
+
+    assert array_object.wrapper is wrapper
+
+
+def test_profile_records_only_its_own_thread() -> None:
+    a = af.randu((16,))
+
+    with af.debug.profile() as outer, af.debug.profile() as inner:
+        worker = threading.Thread(target=lambda: af.sum(a))
+        worker.start()
+        worker.join()
+        a.scalar()
+
+    for profiler in (outer, inner):
+        names = [event.name for event in profiler.events]
+        assert "get_scalar" in names and "sum_all" not in names
+
+
+def test_profile_chrome_trace_and_table(tmp_path: Path) -> None:
+    a = af.randu((16,))
+
+    with af.debug.profile() as profiler:
+        for _ in range(3):
+            a = a * 2
+
+    trace = profiler.to_chrome_trace()
+    profiler.export_chrome_trace(tmp_path / "trace.json")
+
+    assert json.loads((tmp_path / "trace.json").read_text()) == json.loads(json.dumps(trace))
+    assert {event["name"] for event in trace["traceEvents"]} >= {"mul", "create_constant_array"}
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
+    assert profiler.table(top=1).splitlines()[0].split()[:2] == ["function", "calls"]
+    assert len(profiler.table(top=1).splitlines()) == 2
+
+
+def test_track_memory_reports_largest_live_arrays() -> None:
+    with af.debug.track_memory() as memory:
+        small = af.randu((10,))
+        with memory.scope("request"):
+            large = af.randu((100, 100))
+        temporary = af.randu((1000,))
+        del temporary
+
+    arrays = memory.live_arrays()
+
+    assert [record.nbytes for record in arrays] == [100 * 100 * 4, 10 * 4]
+    assert arrays[0].shape == (100, 100)
+    assert arrays[0].scope == "request"
+    assert arrays[1].scope is None
+    assert arrays[0].call_site.filename == __file__
+    assert small.shape == (10,) and large.shape == (100, 100)
+
+
+def test_track_memory_keeps_creation_site_after_in_place_update() -> None:
+    with af.debug.track_memory() as memory:
+        x = af.randu((10,))
+        created_at = inspect.getframeinfo(inspect.currentframe()).lineno - 1  # type: ignore[arg-type]
+        x += 1
+        x[0] = 2
+
+    (record,) = memory.live_arrays()
+
+    assert record.call_site.lineno == created_at
+    assert record.sequence == 0
+    assert record.nbytes == 10 * 4
+
+
+def test_track_memory_records_only_its_own_thread() -> None:
+    held: list[af.Array] = []
+
+    with af.debug.track_memory() as memory:
+        worker = threading.Thread(target=lambda: held.append(af.randu((100,))))
+        worker.start()
+        worker.join()
+        own = af.randu((10,))
+
+    assert [record.shape for record in memory.live_arrays()] == [(10,)]
+    assert own.shape == (10,) and held[0].shape == (100,)
+
+
+def test_track_memory_snapshots_show_growth() -> None:
+    with af.debug.track_memory() as memory:
+        memory.snapshot("start")
+        held = [af.randu((256,)) for _ in range(3)]
+        af.eval(*held)
+        memory.snapshot("end")
+
+    start, end = memory.snapshots
+    report = memory.report()
+
+    assert end.live_arrays - start.live_arrays == 3
+    assert end.live_bytes - start.live_bytes == 3 * 256 * 4
+    assert "start -> end" in report
+    assert "3072 bytes in 3 arrays" in report
@@ -0,0 +1,98 @@
+import gc
+
+import arrayfire as af
+
+
+def test_release_drops_handle() -> None:
+    array = af.randu((1024,))
+    other = af.randu((1024,))
+
+    af.release(array, other)
+
+    assert not array.arr.value
+    assert not other.arr.value
+
+
+def test_collected_arrays_are_released() -> None:
+    before = af.device_mem_info()["lock"]["buffers"]
+
+    arrays = [af.randu((256,)) for _ in range(4)]
+    af.eval(*arrays)
+    del arrays
+    assert af.device_mem_info()["lock"]["buffers"] == before
+
+    array = af.randu((256,))
+    af.eval(array)
+    cycle: list[object] = [array]
+    cycle.append(cycle)
+    del array, cycle
+    gc.collect()
+    assert af.device_mem_info()["lock"]["buffers"] == before
+
+
+def test_in_place_updates_reuse_the_finalizer() -> None:
+    before = af.device_mem_info()["lock"]["buffers"]
+
+    array = af.randu((256,))
+    cell = array._handle_cell
+    for _ in range(3):
+        array += 1
+        af.eval(array)
+
+    assert array._handle_cell is cell
+    assert cell is not None and cell[0] is array.arr
+
+    del array
+    assert af.device_mem_info()["lock"]["buffers"] == before
+
+
+def test_scope_releases_temporaries() -> None:
+    outer = af.randu((64,))
+
+    with af.scope() as arena:
+        temporary = outer * 2
+        kept = temporary + 1
+        arena.keep(kept)
+        outer += 1
+
+    assert not temporary.arr.value
+    assert kept.arr.value
+    assert outer.arr.value
+    assert kept.shape == (64,)
+
+
+def test_nested_scope_hands_kept_arrays_to_parent() -> None:
+    with af.scope():
+        with af.scope() as inner:
+            result = af.randu((8,))
+            inner.keep(result)
+
+        assert result.arr.value
+
+    assert not result.arr.value
+
+
+def test_scope_decorator_keeps_return_value() -> None:
+    temporaries = []
+
+    @af.scope()
+    def compute(x: af.Array) -> tuple[af.Array, af.Array]:
+        temporary = x * x
+        temporaries.append(temporary)
+        return temporary + 1, x - 1
+
+    x = af.randu((8,))
+    first, second = compute(x)
+
+    assert first.arr.value and second.arr.value
+    assert not temporaries[0].arr.value
+
+
+def test_scope_keeps_transpose_source() -> None:
+    with af.scope() as arena:
+        matrix = af.randu((3, 2))
+        transposed = matrix.T
+        arena.keep(transposed)
+
+    assert transposed.shape == (2, 3)
+    assert transposed.arr.value
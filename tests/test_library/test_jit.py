@@ -0,0 +1,61 @@
+import math
+
+import arrayfire as af
+
+
+def cumulative_normal(x: af.Array) -> af.Array:
+    condition = x > 0
+    lhs = condition * (0.5 + af.erf(x / math.sqrt(2.0)) / 2)
+    rhs = (1 - condition) * (0.5 - af.erf((-x) / math.sqrt(2.0)) / 2)
+    return lhs + rhs
+
+
+def test_jit_matches_eager() -> None:
+    traced = af.jit(cumulative_normal)
+    x = af.randn((64, 4))
+
+    assert af.all_true(af.abs(traced(x) - cumulative_normal(x)) < 1e-6)
+
+
+def test_jit_replays_with_new_inputs() -> None:
+    @af.jit
+    def in_circle(x: af.Array, y: af.Array) -> af.Array:
+        return (x * x + y * y) < 1
+
+    x = af.constant(0.5, (8,))
+    y = af.constant(2.0, (8,))
+
+    first = in_circle(x, x)
+    second = in_circle(x, y)
+
+    assert first.dtype == af.bool
+    assert second.shape == (8,)
+    assert af.all_true(first)
+    assert not af.any_true(second)
+
+
+def test_jit_returns_tuples() -> None:
+    @af.jit
+    def split(x: af.Array, scale: float) -> tuple[af.Array, af.Array]:
+        return x * scale, x * 1
+
+    x = af.randu((5,))
+    scaled, same = split(x, 2.0)
+    scaled, same = split(x, 2.0)
+
+    assert af.all_true(scaled == x * 2.0)
+    assert af.all_true(same == x)
+
+
+def test_jit_falls_back_for_untraceable_functions() -> None:
+    offset = af.constant(1, (4,))
+
+    @af.jit
+    def shifted(x: af.Array) -> af.Array:
+        return x + offset
+
+    x = af.constant(1, (4,))
+    shifted(x)
+    offset += 1
+
+    assert af.all_true(shifted(x) == 3)
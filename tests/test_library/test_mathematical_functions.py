@@ -238,6 +238,20 @@ class TestArithmeticOperators:
         expected = [math.atan2(1, 4), math.atan2(2, 5), math.atan2(3, 6)]
         assert round_to(res.to_list()) == round_to(expected)  # type: ignore[arg-type]
 
+    def test_hypot(self) -> None:
+        res = af.hypot(self.array1, self.array2)
+        expected = [math.hypot(1, 4), math.hypot(2, 5), math.hypot(3, 6)]
+        assert round_to(res.to_list()) == round_to(expected)  # type: ignore[arg-type]
+
+        res_scalar = af.hypot(self.array1, 4)
+        expected_scalar = [math.hypot(x, 4) for x in [1, 2, 3]]
+        assert round_to(res_scalar.to_list()) == round_to(expected_scalar)  # type: ignore[arg-type]
+
+    def test_cplx(self) -> None:
+        res = af.cplx(self.array1, self.array2)
+        assert af.real(res).to_list() == [1, 2, 3]
+        assert af.imag(res).to_list() == [4, 5, 6]
+
     def test_sinh(self) -> None:
         # Sinh
         array = af.Array([0, 1, -1])
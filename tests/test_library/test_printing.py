@@ -0,0 +1,41 @@
+from collections.abc import Iterator
+
+import pytest
+
+import arrayfire as af
+
+
+@pytest.fixture(autouse=True)
+def restore_printoptions() -> Iterator[None]:
+    options = af.get_printoptions()
+    yield
+    af.set_printoptions(**options)
+
+
+def test_repr_small_array_prints_all_elements() -> None:
+    array = af.Array([1, 2, 3], dtype=af.int32)
+    assert repr(array) == "[1 2 3]"
+
+
+def test_repr_2d_is_row_major() -> None:
+    array = af.moddims(af.range((6,), dtype=af.int32), (2, 3))
+    assert repr(array) == "[[0 2 4]\n [1 3 5]]"
+
+
+def test_repr_summarizes_large_arrays() -> None:
+    af.set_printoptions(threshold=10, edgeitems=2)
+    array = af.range((100,), dtype=af.int32)
+    assert repr(array) == "[ 0  1 ... 98 99]"
+
+
+def test_str_includes_metadata() -> None:
+    af.set_printoptions(precision=2)
+    out = str(af.constant(1.5, (2,)))
+
+    assert "Dims: (2,)" in out
+    assert out.endswith("[1.50 1.50]")
+
+
+def test_set_printoptions_rejects_negative_values() -> None:
+    with pytest.raises(ValueError):
+        af.set_printoptions(threshold=-1)